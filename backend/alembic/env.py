@@ -1,6 +1,8 @@
 """Alembic environment configuration for async SQLAlchemy."""
 
 import asyncio
+import logging
+import time
 from logging.config import fileConfig
 
 from alembic import context
@@ -21,6 +23,7 @@ from app.models import (  # noqa: F401
     Assessment,
     AssessmentResponse,
     FileUpload,
+    FileUploadPage,
     ThemeScore,
     AssessmentReport,
     BenchmarkSnapshot,
@@ -37,6 +40,18 @@ target_metadata = Base.metadata
 # Override sqlalchemy.url from settings
 config.set_main_option("sqlalchemy.url", settings.database_url)
 
+log = logging.getLogger("alembic.env")
+_step_started = time.perf_counter()
+
+
+def _log_step_timing(ctx, step, heads, run_args) -> None:
+    """Log how long each applied revision took (on_version_apply hook)."""
+    global _step_started
+    now = time.perf_counter()
+    direction = "upgrade" if step.is_upgrade else "downgrade"
+    log.info("%s %s took %.2fs", direction, step.up_revision_id, now - _step_started)
+    _step_started = now
+
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
@@ -53,8 +68,19 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection):
-    context.configure(connection=connection, target_metadata=target_metadata)
+    global _step_started
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        # Single public schema: keeps autogenerate on SQLAlchemy 2.x's
+        # batched reflection instead of walking every schema
+        include_schemas=False,
+        # batch mode is a SQLite ALTER workaround; PostgreSQL never needs it
+        render_as_batch=False,
+        on_version_apply=_log_step_timing,
+    )
     with context.begin_transaction():
+        _step_started = time.perf_counter()
         context.run_migrations()
 
 
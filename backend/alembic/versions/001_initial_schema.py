@@ -37,7 +37,7 @@ def upgrade() -> None:
     op.create_table(
         "users",
         sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("tenant_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("tenants.id"), nullable=False, index=True),
+        sa.Column("tenant_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("tenants.id"), nullable=False),
         sa.Column("email", sa.String(255), unique=True, nullable=False, index=True),
         sa.Column("password_hash", sa.String(255), nullable=False),
         sa.Column("full_name", sa.String(255), nullable=False),
@@ -52,7 +52,7 @@ def upgrade() -> None:
     op.create_table(
         "partner_institutions",
         sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("tenant_id", postgresql.UUID(as_uuid=True), nullable=False, index=True),
+        sa.Column("tenant_id", postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column("name", sa.String(255), nullable=False),
         sa.Column("country", sa.String(100), nullable=False),
         sa.Column("position", sa.Integer, server_default="1"),
@@ -106,7 +106,7 @@ def upgrade() -> None:
     op.create_table(
         "assessments",
         sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("tenant_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("tenants.id"), nullable=False, index=True),
+        sa.Column("tenant_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("tenants.id"), nullable=False),
         sa.Column("template_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("assessment_templates.id"), nullable=False),
         sa.Column("academic_year", sa.String(20), nullable=False),
         sa.Column("status", sa.String(30), server_default="draft"),
@@ -123,7 +123,7 @@ def upgrade() -> None:
     op.create_table(
         "assessment_responses",
         sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("assessment_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("assessments.id"), nullable=False, index=True),
+        sa.Column("assessment_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("assessments.id"), nullable=False),
         sa.Column("item_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("assessment_items.id"), nullable=False),
         sa.Column("partner_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("partner_institutions.id")),
         sa.Column("value", postgresql.JSONB),
@@ -139,8 +139,8 @@ def upgrade() -> None:
     op.create_table(
         "file_uploads",
         sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("tenant_id", postgresql.UUID(as_uuid=True), nullable=False, index=True),
-        sa.Column("assessment_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("assessments.id"), nullable=False, index=True),
+        sa.Column("tenant_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("assessment_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("assessments.id"), nullable=False),
         sa.Column("response_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("assessment_responses.id")),
         sa.Column("original_filename", sa.String(500), nullable=False),
         sa.Column("storage_key", sa.String(500), unique=True, nullable=False),
@@ -157,7 +157,7 @@ def upgrade() -> None:
     op.create_table(
         "theme_scores",
         sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("assessment_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("assessments.id"), nullable=False, index=True),
+        sa.Column("assessment_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("assessments.id"), nullable=False),
         sa.Column("theme_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("assessment_themes.id"), nullable=False),
         sa.Column("normalised_score", sa.Float),
         sa.Column("weighted_score", sa.Float),
@@ -170,7 +170,7 @@ def upgrade() -> None:
     op.create_table(
         "assessment_reports",
         sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("assessment_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("assessments.id"), nullable=False, index=True),
+        sa.Column("assessment_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("assessments.id"), nullable=False),
         sa.Column("version", sa.Integer, server_default="1"),
         sa.Column("executive_summary", sa.Text),
         sa.Column("theme_analyses", postgresql.JSONB),
@@ -202,7 +202,7 @@ def upgrade() -> None:
     op.create_table(
         "ai_jobs",
         sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("assessment_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("assessments.id"), nullable=False, index=True),
+        sa.Column("assessment_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("assessments.id"), nullable=False),
         sa.Column("job_type", sa.String(50), nullable=False),
         sa.Column("status", sa.String(30), server_default="queued"),
         sa.Column("progress", sa.Float, server_default="0.0"),
@@ -5,6 +5,7 @@ Revises: 001
 Create Date: 2026-02-19
 
 """
+import uuid
 from typing import Sequence, Union
 
 from alembic import op
@@ -15,18 +16,59 @@ down_revision: Union[str, None] = "001"
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Rows updated per statement when backfilling existing users
+BACKFILL_BATCH_SIZE = 5000
+
+# How long each constraint step may wait for its table lock before failing
+LOCK_TIMEOUT = "5s"
+
 
 def upgrade() -> None:
+    # Added nullable first; NOT NULL is enforced once the backfill is done
     op.add_column(
         "users",
-        sa.Column("email_verified", sa.Boolean, server_default="false", nullable=False),
+        sa.Column("email_verified", sa.Boolean, server_default="false", nullable=True),
     )
     op.add_column(
         "users",
         sa.Column("email_verified_at", sa.DateTime(timezone=True), nullable=True),
     )
-    # Mark all existing users as verified
-    op.execute("UPDATE users SET email_verified = true, email_verified_at = now()")
+    # Mark all existing users as verified, in batches so each statement
+    # commits on its own instead of holding row locks across the whole table.
+    # Each batch resumes after the last id updated, so no pass re-reads rows
+    # (or dead tuples) an earlier one already covered.
+    backfill = sa.text(
+        "UPDATE users SET email_verified = true, email_verified_at = now() "
+        "WHERE id IN ("
+        "SELECT id FROM users WHERE id > :last_id AND email_verified IS NOT TRUE "
+        "ORDER BY id LIMIT :batch_size"
+        ") RETURNING id"
+    )
+    bind = op.get_bind()
+    with op.get_context().autocommit_block():
+        last_id = uuid.UUID(int=0)
+        while ids := bind.execute(
+            backfill, {"last_id": last_id, "batch_size": BACKFILL_BATCH_SIZE}
+        ).scalars().all():
+            last_id = max(ids)
+        # The backfill rewrote every row: reclaim the dead tuples and refresh
+        # planner statistics now rather than waiting for autovacuum
+        op.execute("VACUUM (ANALYZE) users")
+
+        # Each statement below commits on its own, so no lock outlives it, and
+        # gives up rather than leave writes queued behind it. ADD ... NOT VALID
+        # takes ACCESS EXCLUSIVE only briefly as it does not scan; VALIDATE
+        # scans under SHARE UPDATE EXCLUSIVE, so writes continue; the validated
+        # CHECK then lets SET NOT NULL skip its full-table scan (PG12+).
+        op.execute(f"SET lock_timeout = '{LOCK_TIMEOUT}'")
+        op.execute(
+            "ALTER TABLE users ADD CONSTRAINT users_email_verified_notnull "
+            "CHECK (email_verified IS NOT NULL) NOT VALID"
+        )
+        op.execute("ALTER TABLE users VALIDATE CONSTRAINT users_email_verified_notnull")
+        op.alter_column("users", "email_verified", nullable=False)
+        op.drop_constraint("users_email_verified_notnull", "users", type_="check")
+        op.execute("RESET lock_timeout")
 
 
 def downgrade() -> None:
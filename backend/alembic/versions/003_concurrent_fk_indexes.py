@@ -0,0 +1,48 @@
+"""Build foreign-key lookup indexes concurrently.
+
+These indexes used to be created inline by 001 via ``index=True``, which takes
+an ACCESS EXCLUSIVE lock while each index builds. They are now created with
+CREATE INDEX CONCURRENTLY outside the migration transaction so writes keep
+flowing. IF NOT EXISTS keeps this a no-op on databases that already ran the
+original 001.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-03-02
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, column) - names match SQLAlchemy's ix_<table>_<column>
+# convention so the models' index=True declarations stay in sync.
+INDEXES = [
+    ("ix_users_tenant_id", "users", "tenant_id"),
+    ("ix_partner_institutions_tenant_id", "partner_institutions", "tenant_id"),
+    ("ix_assessments_tenant_id", "assessments", "tenant_id"),
+    ("ix_assessment_responses_assessment_id", "assessment_responses", "assessment_id"),
+    ("ix_file_uploads_tenant_id", "file_uploads", "tenant_id"),
+    ("ix_file_uploads_assessment_id", "file_uploads", "assessment_id"),
+    ("ix_theme_scores_assessment_id", "theme_scores", "assessment_id"),
+    ("ix_assessment_reports_assessment_id", "assessment_reports", "assessment_id"),
+    ("ix_ai_jobs_assessment_id", "ai_jobs", "assessment_id"),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, column in INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({column})")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _table, _column in reversed(INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
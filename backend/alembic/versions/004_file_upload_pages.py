@@ -0,0 +1,43 @@
+"""Move per-page text to file_upload_pages and LZ4-compress extracted_data.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-03-02
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "file_upload_pages",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "upload_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("file_uploads.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("page_no", sa.Integer, nullable=False),
+        sa.Column("text", sa.Text, nullable=False),
+        sa.UniqueConstraint("upload_id", "page_no", name="uq_file_upload_page"),
+    )
+
+    # LZ4 (PostgreSQL 14+) compresses and decompresses TOASTed values much
+    # faster than the default pglz; only newly written values are affected
+    op.execute("ALTER TABLE file_uploads ALTER COLUMN extracted_data SET COMPRESSION lz4")
+    op.execute("ALTER TABLE file_upload_pages ALTER COLUMN text SET COMPRESSION lz4")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE file_uploads ALTER COLUMN extracted_data SET COMPRESSION default")
+    op.drop_table("file_upload_pages")
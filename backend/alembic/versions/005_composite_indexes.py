@@ -0,0 +1,62 @@
+"""Composite indexes for hot query patterns; partner_institutions tenant FK.
+
+(tenant_id, academic_year) on assessments and (assessment_id, item_id) on
+assessment_responses are already served by the uq_tenant_academic_year and
+uq_response_item_partner unique indexes, so they are not duplicated here.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-03-03
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# How long the foreign key steps may wait for their table locks before failing
+LOCK_TIMEOUT = "5s"
+
+INDEXES = [
+    (
+        "ix_file_uploads_assessment_status",
+        "file_uploads (assessment_id, extraction_status) WHERE extraction_status <> 'completed'",
+    ),
+    ("ix_ai_jobs_assessment_status", "ai_jobs (assessment_id, status)"),
+    ("ix_partner_institutions_tenant_position", "partner_institutions (tenant_id, position)"),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Declared in the model but missing from 001. NOT VALID adds it without
+        # scanning; VALIDATE then checks existing rows under a lock that lets
+        # writes continue. Each commits on its own, so the stronger lock taken
+        # by ADD is released before the scan, and neither waits long to start.
+        op.execute(f"SET lock_timeout = '{LOCK_TIMEOUT}'")
+        op.execute(
+            "ALTER TABLE partner_institutions ADD CONSTRAINT partner_institutions_tenant_id_fkey "
+            "FOREIGN KEY (tenant_id) REFERENCES tenants (id) NOT VALID"
+        )
+        op.execute(
+            "ALTER TABLE partner_institutions "
+            "VALIDATE CONSTRAINT partner_institutions_tenant_id_fkey"
+        )
+        op.execute("RESET lock_timeout")
+
+        for name, definition in INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {definition}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _definition in reversed(INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+    op.drop_constraint(
+        "partner_institutions_tenant_id_fkey", "partner_institutions", type_="foreignkey"
+    )
@@ -0,0 +1,36 @@
+"""BRIN indexes on created_at for append-only tables.
+
+Rows are inserted in created_at order, so a BRIN index's per-block-range
+min/max is enough for "recent rows" range scans at a tiny fraction of a
+B-tree's size.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-03-03
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ["ai_jobs", "assessment_reports", "file_uploads", "theme_scores"]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{table}_created_at_brin "
+                f"ON {table} USING BRIN (created_at) WITH (pages_per_range = 32)"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in reversed(TABLES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_created_at_brin")
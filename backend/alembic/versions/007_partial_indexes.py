@@ -0,0 +1,60 @@
+"""Partial indexes for in-flight assessments and jobs; drop redundant indexes.
+
+The dropped single-column indexes are left-prefixes of wider indexes on the
+same table, which serve the same lookups:
+  ix_assessments_tenant_id              -> uq_tenant_academic_year
+  ix_assessment_responses_assessment_id -> uq_response_item_partner
+  ix_theme_scores_assessment_id         -> uq_theme_score
+  ix_ai_jobs_assessment_id              -> ix_ai_jobs_assessment_status
+  ix_partner_institutions_tenant_id     -> ix_partner_institutions_tenant_position
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-03-04
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PARTIAL_INDEXES = [
+    (
+        "ix_assessments_active",
+        "assessments (tenant_id, submitted_at DESC) "
+        "WHERE status IN ('submitted', 'under_review')",
+    ),
+    # Workers set 'processing'; the report endpoints also look for 'in_progress'
+    (
+        "ix_ai_jobs_pending",
+        "ai_jobs (created_at) WHERE status IN ('queued', 'processing', 'in_progress')",
+    ),
+]
+
+REDUNDANT_INDEXES = [
+    ("ix_assessments_tenant_id", "assessments", "tenant_id"),
+    ("ix_assessment_responses_assessment_id", "assessment_responses", "assessment_id"),
+    ("ix_theme_scores_assessment_id", "theme_scores", "assessment_id"),
+    ("ix_ai_jobs_assessment_id", "ai_jobs", "assessment_id"),
+    ("ix_partner_institutions_tenant_id", "partner_institutions", "tenant_id"),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, definition in PARTIAL_INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {definition}")
+        for name, _table, _column in REDUNDANT_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, column in REDUNDANT_INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({column})")
+        for name, _definition in reversed(PARTIAL_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,32 @@
+"""Case-insensitive unique index on users.email.
+
+Sign-in, registration and magic-link lookups match ``lower(email)``, which
+the plain unique index on email cannot serve. Building it fails if two
+accounts differ only in the case of their email address; merge those first.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-03-05
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ix_users_email_lower "
+            "ON users (lower(email))"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_email_lower")
@@ -0,0 +1,48 @@
+"""Treat a NULL partner as one value in uq_response_item_partner.
+
+Responses without a partner all have partner_id NULL, which a plain unique
+constraint treats as distinct, so it never stopped duplicate answers to the
+same item and cannot back ``INSERT ... ON CONFLICT``. The replacement is
+NULLS NOT DISTINCT (PostgreSQL 15+). Building it fails if an assessment
+already has two partner-less answers to one item; remove those first.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-03-06
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_response_item_partner_nnd "
+            "ON assessment_responses (assessment_id, item_id, partner_id) NULLS NOT DISTINCT"
+        )
+    op.drop_constraint("uq_response_item_partner", "assessment_responses", type_="unique")
+    # Adopting the index renames it to the constraint name
+    op.execute(
+        "ALTER TABLE assessment_responses ADD CONSTRAINT uq_response_item_partner "
+        "UNIQUE USING INDEX uq_response_item_partner_nnd"
+    )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_response_item_partner_old "
+            "ON assessment_responses (assessment_id, item_id, partner_id)"
+        )
+    op.drop_constraint("uq_response_item_partner", "assessment_responses", type_="unique")
+    op.execute(
+        "ALTER TABLE assessment_responses ADD CONSTRAINT uq_response_item_partner "
+        "UNIQUE USING INDEX uq_response_item_partner_old"
+    )
@@ -1,42 +1,148 @@
 """Anthropic Claude API wrapper with retry, caching, and cost tracking."""
 
+import asyncio
 import hashlib
-import json
-import time
+import re
+import threading
 from functools import lru_cache
 
 import anthropic
+import httpx
+import orjson
+import redis
 import structlog
+from cachetools import TTLCache
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from app.config import settings
+from app.services.cache_service import get_async_redis, loop_local
 
 logger = structlog.get_logger()
 
-# Simple in-memory cache with TTL (7 days)
-_cache: dict[str, tuple[dict, float]] = {}
+# Response cache shared by all workers via Redis, with TTL (7 days)
+_redis = redis.from_url(settings.redis_url)
+_CACHE_PREFIX = "claude_cache:"
 _CACHE_TTL = 7 * 24 * 3600  # 7 days in seconds
 
+# Bounded per-process L1 in front of Redis; the lock covers callers on
+# thread-pool workers as well as the event loop
+_local_cache: TTLCache = TTLCache(maxsize=1024, ttl=_CACHE_TTL)
+_local_cache_lock = threading.Lock()
 
-def _cache_key(model: str, messages: list[dict], system: str | None = None) -> str:
+# Body of a ```json fenced block (or any fenced block) in a response; a
+# fence left open by a truncated reply runs to the end of the text
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)(?:```|\Z)", re.S)
+
+# Every idle connection stays pooled, and HTTP/2 multiplexes concurrent
+# requests over one TLS connection instead of opening one per request
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=100)
+
+
+def _cache_key(
+    model: str, messages: list[dict], system: str | list[dict] | None = None
+) -> str:
     """Generate a deterministic cache key from request parameters."""
-    payload = json.dumps({"model": model, "messages": messages, "system": system}, sort_keys=True)
-    return hashlib.sha256(payload.encode()).hexdigest()
+    payload = orjson.dumps(
+        {"model": model, "messages": messages, "system": system},
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _get_local(key: str) -> dict | None:
+    with _local_cache_lock:
+        return _local_cache.get(key)
+
+
+def _set_local(key: str, result: dict) -> None:
+    with _local_cache_lock:
+        _local_cache[key] = result
 
 
 def _get_cached(key: str) -> dict | None:
-    """Get a cached response if still within TTL."""
-    if key in _cache:
-        result, timestamp = _cache[key]
-        if time.time() - timestamp < _CACHE_TTL:
-            return result
-        del _cache[key]
-    return None
+    """Get a cached response; both cache tiers expire entries after the TTL."""
+    result = _get_local(key)
+    if result is not None:
+        return result
+    try:
+        raw = _redis.get(_CACHE_PREFIX + key)
+    except redis.RedisError as e:
+        logger.warning("claude_cache_unavailable", error=str(e))
+        return None
+    if raw is None:
+        return None
+    result = orjson.loads(raw)
+    _set_local(key, result)
+    return result
 
 
 def _set_cached(key: str, result: dict) -> None:
     """Store a result in the cache."""
-    _cache[key] = (result, time.time())
+    _set_local(key, result)
+    try:
+        _redis.set(_CACHE_PREFIX + key, orjson.dumps(result), ex=_CACHE_TTL)
+    except redis.RedisError as e:
+        logger.warning("claude_cache_unavailable", error=str(e))
+
+
+async def _get_cached_async(key: str) -> dict | None:
+    """Async counterpart of ``_get_cached``."""
+    result = _get_local(key)
+    if result is not None:
+        return result
+    try:
+        raw = await get_async_redis().get(_CACHE_PREFIX + key)
+    except redis.RedisError as e:
+        logger.warning("claude_cache_unavailable", error=str(e))
+        return None
+    if raw is None:
+        return None
+    result = orjson.loads(raw)
+    _set_local(key, result)
+    return result
+
+
+async def _set_cached_async(key: str, result: dict) -> None:
+    """Async counterpart of ``_set_cached``."""
+    _set_local(key, result)
+    try:
+        await get_async_redis().set(_CACHE_PREFIX + key, orjson.dumps(result), ex=_CACHE_TTL)
+    except redis.RedisError as e:
+        logger.warning("claude_cache_unavailable", error=str(e))
+
+
+def cached_system(*parts: str) -> list[dict]:
+    """Build system prompt blocks with a prompt-cache breakpoint after the last one.
+
+    Everything up to the breakpoint is cached server-side, so static
+    instructions are billed at the cache-read rate on repeat calls. Prefixes
+    shorter than the model's minimum cacheable length (1024 tokens on Sonnet)
+    are sent uncached; the breakpoint is then simply ignored.
+    """
+    blocks = [{"type": "text", "text": part} for part in parts]
+    blocks[-1]["cache_control"] = {"type": "ephemeral"}
+    return blocks
+
+
+def strip_json_fence(content: str) -> str:
+    """Return the payload of a response, unwrapping a fenced code block.
+
+    Unfenced JSON surrounded by prose is cut from the first opening bracket
+    to the last closing one.
+    """
+    match = _FENCE_RE.search(content)
+    if match:
+        return match.group(1).strip()
+    starts = [i for i in (content.find("{"), content.find("[")) if i >= 0]
+    end = max(content.rfind("}"), content.rfind("]"))
+    if not starts or end < min(starts):
+        return content.strip()
+    return content[min(starts):end + 1]
+
+
+def extract_json(content: str):
+    """Parse the JSON payload of a response, unwrapping a fenced code block."""
+    return orjson.loads(strip_json_fence(content))
 
 
 @lru_cache(maxsize=1)
@@ -45,6 +151,74 @@ def get_client() -> anthropic.Anthropic:
     return anthropic.Anthropic(api_key=settings.anthropic_api_key)
 
 
+@loop_local
+def get_async_client() -> anthropic.AsyncAnthropic:
+    """Get the AsyncAnthropic client for the running event loop."""
+    return anthropic.AsyncAnthropic(
+        api_key=settings.anthropic_api_key,
+        http_client=anthropic.DefaultAsyncHttpxClient(http2=True, limits=_HTTP_LIMITS),
+    )
+
+
+def _build_request(
+    messages: list[dict],
+    system: str | list[dict] | None,
+    model: str,
+    max_tokens: int,
+    temperature: float,
+) -> dict:
+    """Build the keyword arguments for ``messages.create``."""
+    kwargs = {
+        "model": model,
+        "max_tokens": max_tokens,
+        "temperature": temperature,
+        "messages": messages,
+    }
+    if system:
+        kwargs["system"] = cached_system(system) if isinstance(system, str) else system
+
+    logger.info(
+        "claude_api_call",
+        model=model,
+        num_messages=len(messages),
+        max_tokens=max_tokens,
+    )
+    return kwargs
+
+
+def _build_result(response: anthropic.types.Message) -> dict:
+    """Convert an API response into the cached result dict."""
+    usage = response.usage
+    cache_write_tokens = getattr(usage, "cache_creation_input_tokens", None) or 0
+    cache_read_tokens = getattr(usage, "cache_read_input_tokens", None) or 0
+    result = {
+        "content": response.content[0].text if response.content else "",
+        "usage": {
+            "input_tokens": usage.input_tokens,
+            "output_tokens": usage.output_tokens,
+            "cache_creation_input_tokens": cache_write_tokens,
+            "cache_read_input_tokens": cache_read_tokens,
+        },
+        "model": response.model,
+        "stop_reason": response.stop_reason,
+    }
+
+    # Estimate cost (Sonnet pricing as of 2025; cache writes 1.25x, reads 0.1x input)
+    input_cost = usage.input_tokens * 0.003 / 1000
+    cache_cost = cache_write_tokens * 0.00375 / 1000 + cache_read_tokens * 0.0003 / 1000
+    output_cost = usage.output_tokens * 0.015 / 1000
+    result["estimated_cost_usd"] = round(input_cost + cache_cost + output_cost, 6)
+
+    logger.info(
+        "claude_api_response",
+        input_tokens=usage.input_tokens,
+        output_tokens=usage.output_tokens,
+        cache_read_tokens=cache_read_tokens,
+        estimated_cost=result["estimated_cost_usd"],
+    )
+    return result
+
+
 @retry(
     stop=stop_after_attempt(3),
     wait=wait_exponential(multiplier=1, min=2, max=30),
@@ -52,7 +226,7 @@ def get_client() -> anthropic.Anthropic:
 )
 def call_claude(
     messages: list[dict],
-    system: str | None = None,
+    system: str | list[dict] | None = None,
     model: str | None = None,
     max_tokens: int = 4096,
     temperature: float = 0.0,
@@ -62,7 +236,8 @@ def call_claude(
 
     Args:
         messages: List of message dicts with role and content.
-        system: Optional system prompt.
+        system: Optional system prompt, or prebuilt blocks from ``cached_system``.
+            A plain string is sent as a single prompt-cached block.
         model: Model to use (defaults to settings.anthropic_model).
         max_tokens: Maximum tokens in response.
         temperature: Sampling temperature (0 for deterministic scoring).
@@ -81,50 +256,126 @@ def call_claude(
             logger.info("claude_cache_hit", cache_key=cache_key[:12])
             return cached
 
-    client = get_client()
+    kwargs = _build_request(messages, system, model, max_tokens, temperature)
+    response = get_client().messages.create(**kwargs)
+    result = _build_result(response)
 
-    kwargs = {
-        "model": model,
-        "max_tokens": max_tokens,
-        "temperature": temperature,
-        "messages": messages,
-    }
-    if system:
-        kwargs["system"] = system
+    # Cache the result
+    if use_cache:
+        _set_cached(cache_key, result)
 
-    logger.info(
-        "claude_api_call",
-        model=model,
-        num_messages=len(messages),
-        max_tokens=max_tokens,
-    )
+    return result
 
-    response = client.messages.create(**kwargs)
 
-    result = {
-        "content": response.content[0].text if response.content else "",
-        "usage": {
-            "input_tokens": response.usage.input_tokens,
-            "output_tokens": response.usage.output_tokens,
-        },
-        "model": response.model,
-        "stop_reason": response.stop_reason,
-    }
+# tenacity runs coroutine functions under AsyncRetrying, sleeping with asyncio
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=2, max=30),
+    reraise=True,
+)
+async def call_claude_async(
+    messages: list[dict],
+    system: str | list[dict] | None = None,
+    model: str | None = None,
+    max_tokens: int = 4096,
+    temperature: float = 0.0,
+    use_cache: bool = True,
+) -> dict:
+    """Non-blocking variant of ``call_claude`` for use inside the event loop.
 
-    # Estimate cost (Sonnet pricing as of 2025)
-    input_cost = response.usage.input_tokens * 0.003 / 1000
-    output_cost = response.usage.output_tokens * 0.015 / 1000
-    result["estimated_cost_usd"] = round(input_cost + output_cost, 6)
+    Takes the same arguments and returns the same dict, sharing the Redis
+    response cache with the synchronous client.
+    """
+    model = model or settings.anthropic_model
 
-    logger.info(
-        "claude_api_response",
-        input_tokens=response.usage.input_tokens,
-        output_tokens=response.usage.output_tokens,
-        estimated_cost=result["estimated_cost_usd"],
-    )
+    if use_cache:
+        cache_key = _cache_key(model, messages, system)
+        cached = await _get_cached_async(cache_key)
+        if cached is not None:
+            logger.info("claude_cache_hit", cache_key=cache_key[:12])
+            return cached
+
+    kwargs = _build_request(messages, system, model, max_tokens, temperature)
+    response = await get_async_client().messages.create(**kwargs)
+    result = _build_result(response)
 
-    # Cache the result
     if use_cache:
-        _set_cached(cache_key, result)
+        await _set_cached_async(cache_key, result)
 
     return result
+
+
+async def call_claude_batch_async(
+    requests: dict[str, dict],
+    model: str | None = None,
+    use_cache: bool = True,
+) -> dict[str, dict]:
+    """Run many requests through the Message Batches API at half the token price.
+
+    Batches finish asynchronously (usually within minutes), so this suits
+    background jobs rather than interactive calls. The batch is polled every
+    ``settings.claude_batch_poll_seconds`` and cancelled after
+    ``settings.claude_batch_timeout_seconds``.
+
+    Args:
+        requests: ``call_claude_async`` keyword arguments (messages, system,
+            max_tokens, temperature) keyed by a caller-chosen id.
+        model: Model to use (defaults to settings.anthropic_model).
+        use_cache: Whether to use response caching.
+
+    Returns:
+        Result dicts shaped like ``call_claude`` results, keyed by request id.
+        Requests that errored or expired in the batch are left out.
+    """
+    model = model or settings.anthropic_model
+    results: dict[str, dict] = {}
+    params: dict[str, dict] = {}
+    cache_keys: dict[str, str] = {}
+    for custom_id, request in requests.items():
+        if use_cache:
+            cache_keys[custom_id] = _cache_key(model, request["messages"], request.get("system"))
+            cached = await _get_cached_async(cache_keys[custom_id])
+            if cached is not None:
+                results[custom_id] = cached
+                continue
+        params[custom_id] = _build_request(
+            request["messages"],
+            request.get("system"),
+            model,
+            request.get("max_tokens", 4096),
+            request.get("temperature", 0.0),
+        )
+    if not params:
+        return results
+
+    client = get_async_client()
+    batch = await client.messages.batches.create(
+        requests=[{"custom_id": custom_id, "params": p} for custom_id, p in params.items()]
+    )
+    logger.info("claude_batch_submitted", batch_id=batch.id, num_requests=len(params))
+
+    deadline = asyncio.get_running_loop().time() + settings.claude_batch_timeout_seconds
+    while batch.processing_status != "ended":
+        if asyncio.get_running_loop().time() > deadline:
+            await client.messages.batches.cancel(batch.id)
+            raise TimeoutError(f"Claude batch {batch.id} did not finish in time")
+        await asyncio.sleep(settings.claude_batch_poll_seconds)
+        batch = await client.messages.batches.retrieve(batch.id)
+
+    async for entry in await client.messages.batches.results(batch.id):
+        if entry.result.type != "succeeded":
+            logger.warning(
+                "claude_batch_request_failed",
+                batch_id=batch.id,
+                custom_id=entry.custom_id,
+                result_type=entry.result.type,
+            )
+            continue
+        result = _build_result(entry.result.message)
+        # Batched requests are billed at 50% of the standard rates
+        result["estimated_cost_usd"] = round(result["estimated_cost_usd"] / 2, 6)
+        results[entry.custom_id] = result
+        if use_cache:
+            await _set_cached_async(cache_keys[entry.custom_id], result)
+
+    return results
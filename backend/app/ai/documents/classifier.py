@@ -1,13 +1,44 @@
 """Document type classification using Claude API."""
 
-import json
+import re
 
-from app.ai.claude_client import call_claude
+from app.ai.claude_client import cached_system, call_claude_async, extract_json
 from app.ai.prompts.document_intelligence import (
     CLASSIFY_DOCUMENT_SYSTEM,
     CLASSIFY_DOCUMENT_TEMPLATE,
 )
 
+_SYSTEM_BLOCK = cached_system(CLASSIFY_DOCUMENT_SYSTEM)
+
+# (document_type, filename pattern, corroborating text pattern). A filename
+# match alone is only a weak hint; with corroborating text it is trusted
+# without asking Claude.
+_FILENAME_RULES = (
+    (
+        "terms_of_reference",
+        re.compile(r"(?<![a-z])(tor|terms[\W_]*of[\W_]*reference)(?![a-z])", re.I),
+        re.compile(r"terms of reference|membership|quorum|remit", re.I),
+    ),
+    (
+        "standard_operating_procedure",
+        re.compile(r"(?<![a-z])(sop|standard[\W_]*operating|procedures?)(?![a-z])", re.I),
+        re.compile(r"procedure|responsibilit|process", re.I),
+    ),
+    (
+        "policy_document",
+        re.compile(r"(?<![a-z])(polic(y|ies)|safeguarding|safeguard)(?![a-z])", re.I),
+        re.compile(r"policy|safeguard|scope", re.I),
+    ),
+)
+
+
+def _match_filename(filename: str) -> tuple[str, re.Pattern] | None:
+    """Return the document type and corroboration pattern a filename implies."""
+    for document_type, filename_re, text_re in _FILENAME_RULES:
+        if filename_re.search(filename):
+            return document_type, text_re
+    return None
+
 
 async def classify_document(filename: str, text_excerpt: str) -> dict:
     """Classify a document type using Claude API.
@@ -19,26 +50,25 @@ async def classify_document(filename: str, text_excerpt: str) -> dict:
     Returns:
         Dict with document_type, confidence, and summary.
     """
-    prompt = CLASSIFY_DOCUMENT_TEMPLATE.format(
+    # Fast path: an unambiguous filename backed by the text needs no API call
+    match = _match_filename(filename)
+    if match and match[1].search(text_excerpt[:2000]):
+        return {"document_type": match[0], "confidence": 0.9, "summary": ""}
+
+    prompt = CLASSIFY_DOCUMENT_TEMPLATE.substitute(
         filename=filename,
         text_excerpt=text_excerpt[:2000],
     )
 
     try:
-        result = call_claude(
+        result = await call_claude_async(
             messages=[{"role": "user", "content": prompt}],
-            system=CLASSIFY_DOCUMENT_SYSTEM,
+            system=_SYSTEM_BLOCK,
             temperature=0.0,
             max_tokens=500,
         )
 
-        content = result["content"]
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0]
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0]
-
-        classification = json.loads(content.strip())
+        classification = extract_json(result["content"])
         return {
             "document_type": classification.get("document_type", "other"),
             "confidence": classification.get("confidence", 0.0),
@@ -46,11 +76,6 @@ async def classify_document(filename: str, text_excerpt: str) -> dict:
         }
     except Exception:
         # Fallback: try to classify from filename
-        filename_lower = filename.lower()
-        if "tor" in filename_lower or "terms" in filename_lower:
-            return {"document_type": "terms_of_reference", "confidence": 0.3, "summary": ""}
-        elif "sop" in filename_lower or "procedure" in filename_lower:
-            return {"document_type": "standard_operating_procedure", "confidence": 0.3, "summary": ""}
-        elif "policy" in filename_lower or "safeguard" in filename_lower:
-            return {"document_type": "policy_document", "confidence": 0.3, "summary": ""}
+        if match:
+            return {"document_type": match[0], "confidence": 0.3, "summary": ""}
         return {"document_type": "other", "confidence": 0.1, "summary": ""}
@@ -1,10 +1,26 @@
 """Document completeness checking against assessment item requirements."""
 
-import json
+import orjson
 
-from app.ai.claude_client import call_claude
+from app.ai.claude_client import call_claude_async, extract_json
 from app.ai.prompts.document_intelligence import COMPLETENESS_CHECK_TEMPLATE
 
+# The prompt only shows the first 2000 characters of extracted data, so long
+# string values are cut before serializing instead of after
+_MAX_STRING_CHARS = 200
+_MAX_DATA_CHARS = 2000
+
+
+def _truncate_strings(value, limit: int = _MAX_STRING_CHARS):
+    """Recursively cut string values in nested dicts/lists to ``limit`` chars."""
+    if isinstance(value, str):
+        return value[:limit]
+    if isinstance(value, dict):
+        return {k: _truncate_strings(v, limit) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_truncate_strings(v, limit) for v in value]
+    return value
+
 
 async def check_document_completeness(
     item_label: str,
@@ -25,28 +41,26 @@ async def check_document_completeness(
     Returns:
         Dict with is_complete, completeness_score, present/missing sections.
     """
-    prompt = COMPLETENESS_CHECK_TEMPLATE.format(
+    prompt = COMPLETENESS_CHECK_TEMPLATE.substitute(
         item_label=item_label,
         required_type=required_type,
         document_summary=document_summary,
-        extracted_data_json=json.dumps(extracted_data, indent=2, default=str)[:2000],
+        extracted_data_json=orjson.dumps(
+            _truncate_strings(extracted_data),
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        ).decode()[:_MAX_DATA_CHARS],
         required_sections="\n".join(f"- {s}" for s in required_sections),
     )
 
     try:
-        result = call_claude(
+        result = await call_claude_async(
             messages=[{"role": "user", "content": prompt}],
             temperature=0.0,
             max_tokens=1000,
         )
 
-        content = result["content"]
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0]
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0]
-
-        return json.loads(content.strip())
+        return extract_json(result["content"])
     except Exception:
         return {
             "is_complete": False,
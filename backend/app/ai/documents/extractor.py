@@ -3,23 +3,17 @@
 Uses PyMuPDF for native PDFs, with OCR fallback for scanned documents.
 """
 
-import io
-
-import boto3
-from botocore.config import Config as BotoConfig
+import asyncio
+import os
+import tempfile
+from collections.abc import Iterator
 
 from app.config import settings
+from app.services.storage_service import get_s3_client
 
-
-def _get_s3_client():
-    return boto3.client(
-        "s3",
-        endpoint_url=settings.s3_endpoint_url,
-        aws_access_key_id=settings.s3_access_key,
-        aws_secret_access_key=settings.s3_secret_key,
-        region_name=settings.s3_region,
-        config=BotoConfig(signature_version="s3v4"),
-    )
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_P = _W_NS + "p"
+_W_T = _W_NS + "t"
 
 
 async def extract_text(storage_key: str, content_type: str) -> str:
@@ -32,59 +26,96 @@ async def extract_text(storage_key: str, content_type: str) -> str:
     Returns:
         Extracted text as a string.
     """
-    # Download from S3
-    s3 = _get_s3_client()
-    response = s3.get_object(Bucket=settings.s3_bucket_name, Key=storage_key)
-    file_bytes = response["Body"].read()
-
-    if content_type == "application/pdf" or storage_key.lower().endswith(".pdf"):
-        return _extract_from_pdf(file_bytes)
-    elif content_type in (
+    return "\n".join(await extract_pages(storage_key, content_type))
+
+
+async def extract_pages(storage_key: str, content_type: str) -> list[str]:
+    """Extract text from a document stored in S3, one string per page.
+
+    DOCX files have no fixed pagination and are returned as a single page.
+    """
+    path = await download_document(storage_key)
+    try:
+        # Parsing is CPU-bound; run it off the event loop
+        return await asyncio.to_thread(read_pages, path, content_type)
+    finally:
+        os.unlink(path)
+
+
+async def download_document(storage_key: str) -> str:
+    """Stream a document from S3 into a temp file and return its path.
+
+    Parsers read from disk instead of holding the whole document in memory.
+    The caller is responsible for deleting the file.
+    """
+    fd, path = tempfile.mkstemp(suffix=os.path.splitext(storage_key)[1])
+    try:
+        with os.fdopen(fd, "wb") as f:
+            await asyncio.to_thread(
+                get_s3_client().download_fileobj, settings.s3_bucket_name, storage_key, f
+            )
+    except BaseException:
+        os.unlink(path)
+        raise
+    return path
+
+
+def read_pages(path: str, content_type: str, max_chars: int | None = None) -> list[str]:
+    """Parse a downloaded document into per-page text.
+
+    With ``max_chars``, parsing stops as soon as that much text has been
+    read, which is all classification needs. Never raises; unreadable
+    documents yield no pages.
+    """
+    if content_type in (
         "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
         "application/msword",
-    ):
-        return _extract_from_docx(file_bytes)
-    else:
-        # Try PDF extraction as fallback
-        try:
-            return _extract_from_pdf(file_bytes)
-        except Exception:
-            return ""
-
-
-def _extract_from_pdf(file_bytes: bytes) -> str:
-    """Extract text from a PDF using PyMuPDF."""
+    ) and not path.lower().endswith(".pdf"):
+        text = _extract_from_docx(path, max_chars)
+        return [text] if text else []
+    # PDF, or PDF extraction as a fallback for anything else
     try:
-        import fitz  # PyMuPDF
+        return list(_extract_pdf_pages(path, max_chars))
+    except Exception:
+        return []
 
-        doc = fitz.open(stream=file_bytes, filetype="pdf")
-        text_parts = []
+
+def _extract_pdf_pages(path: str, max_chars: int | None = None) -> Iterator[str]:
+    """Yield per-page text from a PDF using PyMuPDF (pages are loaded lazily)."""
+    import fitz  # PyMuPDF
+
+    with fitz.open(path, filetype="pdf") as doc:
+        total = 0
         for page in doc:
-            text_parts.append(page.get_text())
-        doc.close()
-        return "\n".join(text_parts)
-    except Exception:
-        return ""
+            text = page.get_text()
+            yield text
+            total += len(text)
+            if max_chars is not None and total >= max_chars:
+                return
 
 
-def _extract_from_docx(file_bytes: bytes) -> str:
-    """Extract text from a DOCX file."""
+def _extract_from_docx(path: str, max_chars: int | None = None) -> str:
+    """Extract text from a DOCX file, streaming paragraphs with lxml."""
     try:
         import zipfile
-        import xml.etree.ElementTree as ET
 
-        with zipfile.ZipFile(io.BytesIO(file_bytes)) as z:
+        from lxml import etree
+
+        text_parts = []
+        total = 0
+        with zipfile.ZipFile(path) as z:
             with z.open("word/document.xml") as f:
-                tree = ET.parse(f)
-                root = tree.getroot()
-                ns = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
-                paragraphs = root.findall(".//w:p", ns)
-                text_parts = []
-                for para in paragraphs:
-                    texts = para.findall(".//w:t", ns)
-                    para_text = "".join(t.text or "" for t in texts)
+                for _, para in etree.iterparse(f, events=("end",), tag=_W_P):
+                    para_text = "".join(t.text or "" for t in para.iter(_W_T))
                     if para_text:
                         text_parts.append(para_text)
-                return "\n".join(text_parts)
+                        total += len(para_text)
+                    # Free the parsed paragraph and its already-processed siblings
+                    para.clear()
+                    while para.getprevious() is not None:
+                        del para.getparent()[0]
+                    if max_chars is not None and total >= max_chars:
+                        break
+        return "\n".join(text_parts)
     except Exception:
         return ""
@@ -3,16 +3,22 @@
 Upload → Extract text → Classify → Extract structured data → Check completeness
 """
 
+import asyncio
+import os
 import uuid
 
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.file_upload import FileUpload
-from app.ai.documents.extractor import extract_text
+from app.database import async_session_factory
+from app.models.file_upload import FileUpload, FileUploadPage
+from app.ai.documents.extractor import download_document, read_pages
 from app.ai.documents.classifier import classify_document
 from app.ai.documents.completeness import check_document_completeness
 
+# Text needed for classification; parsing stops once this much is read
+CLASSIFY_EXCERPT_CHARS = 2000
+
 
 async def process_document(
     db: AsyncSession,
@@ -36,14 +42,22 @@ async def process_document(
     if not upload:
         raise ValueError(f"FileUpload {file_upload_id} not found")
 
+    # Start the S3 download while the status update is flushed
+    download = asyncio.create_task(download_document(upload.storage_key))
     upload.extraction_status = "processing"
-    await db.flush()
+    path = None
 
     try:
-        # Step 1: Extract text
-        extracted_text = await extract_text(upload.storage_key, upload.content_type)
+        await db.flush()
+        path = await download
+
+        # Step 1: Extract just enough text to classify the document
+        pages = await asyncio.to_thread(
+            read_pages, path, upload.content_type, CLASSIFY_EXCERPT_CHARS
+        )
+        excerpt = "\n".join(pages)
 
-        if not extracted_text or len(extracted_text.strip()) < 10:
+        if not excerpt or len(excerpt.strip()) < 10:
             upload.extraction_status = "failed"
             upload.extraction_error = "Could not extract meaningful text from document"
             await db.flush()
@@ -52,16 +66,32 @@ async def process_document(
         # Step 2: Classify document
         classification = await classify_document(
             filename=upload.original_filename,
-            text_excerpt=extracted_text[:2000],
+            text_excerpt=excerpt[:CLASSIFY_EXCERPT_CHARS],
         )
         upload.document_type = classification.get("document_type", "other")
 
+        # Only documents we can use are worth parsing in full
+        full_text_extracted = upload.document_type != "other"
+        if full_text_extracted:
+            pages = await asyncio.to_thread(read_pages, path, upload.content_type)
+        extracted_text = "\n".join(pages)
+
+        # Full text lives in file_upload_pages so extracted_data stays small
+        await db.execute(delete(FileUploadPage).where(FileUploadPage.upload_id == upload.id))
+        db.add_all(
+            FileUploadPage(upload_id=upload.id, page_no=page_no, text=text)
+            for page_no, text in enumerate(pages, start=1)
+            if text.strip()
+        )
+
         # Step 3: Extract structured data
         # This would call type-specific extraction prompts
         upload.extracted_data = {
             "text_length": len(extracted_text),
             "classification": classification,
-            "text_preview": extracted_text[:500],
+            "page_count": len(pages),
+            "full_text_extracted": full_text_extracted,
+            "text_preview": extracted_text[:200],
         }
 
         # Step 4: Completeness check (if linked to a response/item)
@@ -78,7 +108,43 @@ async def process_document(
         }
 
     except Exception as e:
+        download.cancel()
         upload.extraction_status = "failed"
         upload.extraction_error = str(e)
         await db.flush()
         return {"status": "failed", "error": str(e)}
+
+    finally:
+        # The download may have finished even if we failed before awaiting it
+        if path is None and download.done() and not download.cancelled():
+            path = download.result() if download.exception() is None else None
+        if path is not None:
+            os.unlink(path)
+
+
+async def process_documents_batch(
+    file_upload_ids: list[uuid.UUID],
+    concurrency: int = 8,
+) -> list[dict]:
+    """Run the pipeline over several uploads concurrently.
+
+    Each document gets its own session (an AsyncSession cannot be shared
+    between concurrent tasks) and is committed independently, so one
+    failure does not roll back the others.
+
+    Returns:
+        One result dict per id, in the order given.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _process(file_upload_id: uuid.UUID) -> dict:
+        async with semaphore, async_session_factory() as db:
+            try:
+                result = await process_document(db, file_upload_id)
+                await db.commit()
+                return result
+            except Exception as e:
+                await db.rollback()
+                return {"status": "failed", "error": str(e)}
+
+    return await asyncio.gather(*(_process(i) for i in file_upload_ids))
@@ -4,116 +4,268 @@ Expert-defined thresholds that produce a 0-1 risk score
 with top contributing factors. No ML needed.
 """
 
+from bisect import bisect_right
+from functools import lru_cache
+from operator import itemgetter
 
-# Risk rule definitions: each rule checks a condition and assigns a risk contribution
-RISK_RULES = [
-    {
-        "id": "low_financial_score",
-        "name": "Low Financial Sustainability Score",
-        "description": "Financial theme score below 40 indicates high financial risk",
-        "weight": 0.25,
-        "evaluate": lambda scores: max(0, (40 - scores.get("financial", 50)) / 40)
-        if scores.get("financial", 50) < 40
-        else 0.0,
-    },
-    {
-        "id": "declining_enrollment",
-        "name": "Declining Student Enrollment",
-        "description": "Decreasing enrollment trend over 4 years",
-        "weight": 0.20,
-        "evaluate": lambda scores: 0.8
-        if scores.get("enrollment_trend") == "decreasing"
-        else 0.0,
-    },
-    {
-        "id": "low_retention",
-        "name": "Low Student Retention Rate",
-        "description": "Retention rate below 70%",
-        "weight": 0.15,
-        "evaluate": lambda scores: max(0, (70 - scores.get("retention_rate", 80)) / 70)
-        if scores.get("retention_rate", 80) < 70
-        else 0.0,
-    },
-    {
-        "id": "high_ssr",
-        "name": "High Student-Staff Ratio",
-        "description": "SSR above 35 indicates understaffing risk",
-        "weight": 0.15,
-        "evaluate": lambda scores: min(1.0, max(0, (scores.get("ssr", 20) - 35) / 30))
-        if scores.get("ssr", 20) > 35
-        else 0.0,
-    },
-    {
-        "id": "low_governance",
-        "name": "Weak Governance Score",
-        "description": "Governance theme score below 50 indicates governance risk",
-        "weight": 0.15,
-        "evaluate": lambda scores: max(0, (50 - scores.get("governance", 60)) / 50)
-        if scores.get("governance", 60) < 50
-        else 0.0,
-    },
-    {
-        "id": "low_staff_qualifications",
-        "name": "Low Staff Qualifications",
-        "description": "PhD percentage below 20% is concerning",
-        "weight": 0.10,
-        "evaluate": lambda scores: max(0, (20 - scores.get("phd_pct", 40)) / 20)
-        if scores.get("phd_pct", 40) < 20
-        else 0.0,
-    },
-]
-
-
-def compute_risk_score(assessment_metrics: dict) -> dict:
+import numpy as np
+
+from app.config import settings
+
+
+# Risk rule metadata (id, name, description), only read for rules that fire.
+# Order matches _RULE_PARAMS.
+RULE_META = (
+    (
+        "low_financial_score",
+        "Low Financial Sustainability Score",
+        "Financial theme score below 40 indicates high financial risk",
+    ),
+    (
+        "declining_enrollment",
+        "Declining Student Enrollment",
+        "Decreasing enrollment trend over 4 years",
+    ),
+    (
+        "low_retention",
+        "Low Student Retention Rate",
+        "Retention rate below 70%",
+    ),
+    (
+        "high_ssr",
+        "High Student-Staff Ratio",
+        "SSR above 35 indicates understaffing risk",
+    ),
+    (
+        "low_governance",
+        "Weak Governance Score",
+        "Governance theme score below 50 indicates governance risk",
+    ),
+    (
+        "low_staff_qualifications",
+        "Low Staff Qualifications",
+        "PhD percentage below 20% is concerning",
+    ),
+)
+
+# Rule parameters: (weight, metric key, default, threshold, denominator, kind).
+# "lt" rules score (threshold - x) / denom below the threshold, "gt" rules score
+# (x - threshold) / denom above it (capped at 1), and "eq" rules score the
+# denominator as a fixed risk when the metric equals the threshold value.
+# The batch evaluator is driven from this table; the scalar one is unrolled
+# by hand and checked against it at import.
+_RULE_PARAMS = (
+    (0.25, "financial", 50, 40, 40, "lt"),
+    (0.20, "enrollment_trend", None, "decreasing", 0.8, "eq"),
+    (0.15, "retention_rate", 80, 70, 70, "lt"),
+    (0.15, "ssr", 20, 35, 30, "gt"),
+    (0.15, "governance", 60, 50, 50, "lt"),
+    (0.10, "phd_pct", 40, 20, 20, "lt"),
+)
+_RULE_WEIGHTS = tuple(params[0] for params in _RULE_PARAMS)
+
+# Ascending score cut-offs; a score at or above the i-th bin is one level up
+_LEVEL_BINS = tuple(settings.risk_level_thresholds)
+_LEVELS = ("low", "medium", "high")
+
+
+# Batch-kernel forms of the rule weights and level names
+_RULE_WEIGHT_COLUMN = np.array(_RULE_WEIGHTS)[:, None]
+_LEVEL_ARRAY = np.array(_LEVELS)
+
+
+def _column(metrics: dict[str, np.ndarray], key: str, default: float, n: int) -> np.ndarray:
+    """Fetch a metric column, substituting the rule default for absent/NaN values."""
+    if key not in metrics:
+        return np.full(n, default)
+    values = np.asarray(metrics[key], dtype=np.float64)
+    return np.where(np.isnan(values), default, values)
+
+
+def _rule_score(value, threshold, denom, kind: str) -> float:
+    """Raw 0-1 score of one rule for one metric value (reference for the unrolled form)."""
+    if kind == "lt":
+        return max(0.0, (threshold - value) / denom)
+    if kind == "gt":
+        return min(1.0, max(0.0, (value - threshold) / denom))
+    return denom if value == threshold else 0.0
+
+
+def _rule_scores(
+    metrics: dict[str, np.ndarray], n: int, key: str, default, threshold, denom, kind: str
+) -> np.ndarray:
+    """Raw scores of one rule over N assessments; the array form of _rule_score."""
+    if kind == "eq":
+        if key not in metrics:
+            return np.zeros(n)
+        return np.where(np.asarray(metrics[key]) == threshold, denom, 0.0)
+    values = _column(metrics, key, default, n)
+    if kind == "lt":
+        return np.maximum(0.0, (threshold - values) / denom)
+    return np.clip((values - threshold) / denom, 0.0, 1.0)
+
+
+def compute_risk_scores_batch(
+    metrics: dict[str, np.ndarray],
+    thresholds: tuple[float, ...] | None = None,
+) -> dict[str, np.ndarray]:
+    """Score many assessments at once with vectorized rule evaluation.
+
+    Args:
+        metrics: Column arrays of equal length N, keyed like the scalar metrics
+            ('financial', 'governance', 'retention_rate', 'ssr', 'phd_pct',
+            'enrollment_trend'). Missing numeric values are NaN.
+        thresholds: Optional level cut-offs overriding the configured ones.
+
+    Returns:
+        Dict with N-length 'risk_score' and 'risk_level' arrays, and (6, N)
+        'raw_scores'/'weighted_contributions' matrices in RULE_META order.
+    """
+    n = len(next(iter(metrics.values())))
+    raw = np.stack([_rule_scores(metrics, n, *params[1:]) for params in _RULE_PARAMS])
+    weighted = raw * _RULE_WEIGHT_COLUMN
+
+    # Clamp to [0, 1]
+    risk_scores = np.clip(weighted.sum(axis=0), 0.0, 1.0)
+
+    return {
+        "risk_score": risk_scores,
+        "risk_level": _LEVEL_ARRAY[np.digitize(risk_scores, thresholds or _LEVEL_BINS)],
+        "raw_scores": raw,
+        "weighted_contributions": weighted,
+    }
+
+
+def compute_risk_score(
+    assessment_metrics: dict,
+    detail: bool = True,
+    thresholds: tuple[float, ...] | None = None,
+) -> dict:
     """Compute risk score from assessment metrics using expert-defined rules.
 
+    Results are memoized on the metric values, so repeated scoring of the
+    same assessment (dashboards, report regeneration) skips the rules.
+
     Args:
         assessment_metrics: Dict with keys like 'financial', 'governance',
             'retention_rate', 'ssr', 'phd_pct', 'enrollment_trend', etc.
+            Numeric metrics must be numbers; absent ones take rule defaults.
+        detail: Build the contributing factors; pass False when only the
+            score and level are needed (bulk triage, dashboards).
+        thresholds: Optional ascending low/medium and medium/high cut-offs,
+            e.g. a tenant override; defaults to settings.risk_level_thresholds.
 
     Returns:
         Dict with:
             - risk_score: 0.0 (low risk) to 1.0 (high risk)
             - risk_level: 'low', 'medium', or 'high'
-            - contributing_factors: List of active risk factors sorted by contribution
+            - contributing_factors: List of active risk factors sorted by
+              contribution (only when ``detail`` is True)
     """
-    contributing_factors = []
-    total_risk = 0.0
-
-    for rule in RISK_RULES:
-        try:
-            raw_score = rule["evaluate"](assessment_metrics)
-            weighted = raw_score * rule["weight"]
-            total_risk += weighted
-
-            if raw_score > 0:
-                contributing_factors.append({
-                    "rule_id": rule["id"],
-                    "name": rule["name"],
-                    "description": rule["description"],
-                    "raw_score": round(raw_score, 3),
-                    "weighted_contribution": round(weighted, 3),
-                })
-        except (KeyError, TypeError, ZeroDivisionError):
-            continue
+    return _to_dict(_compute_risk_score_cached(
+        _freeze(assessment_metrics), detail, tuple(thresholds or _LEVEL_BINS)
+    ))
 
-    # Clamp to [0, 1]
-    risk_score = min(1.0, max(0.0, total_risk))
 
-    # Determine risk level
-    if risk_score >= 0.6:
-        risk_level = "high"
-    elif risk_score >= 0.3:
-        risk_level = "medium"
-    else:
-        risk_level = "low"
+def _freeze(assessment_metrics: dict) -> tuple:
+    """Canonical hashable form of a metrics dict (lists become tuples)."""
+    return tuple(sorted(
+        (key, tuple(value) if isinstance(value, list) else value)
+        for key, value in assessment_metrics.items()
+    ))
 
-    # Sort factors by contribution (highest first)
-    contributing_factors.sort(key=lambda f: f["weighted_contribution"], reverse=True)
 
+def _to_dict(cached: tuple) -> dict:
+    """Rebuild the public result dict from the cached flat tuple."""
+    risk_score, risk_level, factors = cached
+    if factors is None:
+        return {
+            "risk_score": risk_score,
+            "risk_level": risk_level,
+            "rules_evaluated": len(RULE_META),
+        }
     return {
-        "risk_score": round(risk_score, 3),
+        "risk_score": risk_score,
         "risk_level": risk_level,
-        "contributing_factors": contributing_factors,
-        "rules_evaluated": len(RISK_RULES),
+        "contributing_factors": [
+            {
+                "rule_id": rule_id,
+                "name": name,
+                "description": description,
+                "raw_score": raw_score,
+                "weighted_contribution": weighted,
+            }
+            for rule_id, name, description, raw_score, weighted in factors
+        ],
+        "rules_evaluated": len(RULE_META),
     }
+
+
+def _evaluate_rules(m: dict) -> tuple[tuple[float, ...], float]:
+    """Raw rule scores and their weighted sum; _RULE_PARAMS unrolled by hand.
+
+    The clamps make threshold checks redundant. Kept in step with the table
+    by ``_check_unrolled_rules`` at import.
+    """
+    r0 = max(0.0, (40 - m.get("financial", 50)) / 40.0)
+    r1 = 0.8 if m.get("enrollment_trend") == "decreasing" else 0.0
+    r2 = max(0.0, (70 - m.get("retention_rate", 80)) / 70.0)
+    r3 = min(1.0, max(0.0, (m.get("ssr", 20) - 35) / 30.0))
+    r4 = max(0.0, (50 - m.get("governance", 60)) / 50.0)
+    r5 = max(0.0, (20 - m.get("phd_pct", 40)) / 20.0)
+    total = r0 * 0.25 + r1 * 0.20 + r2 * 0.15 + r3 * 0.15 + r4 * 0.15 + r5 * 0.10
+    return (r0, r1, r2, r3, r4, r5), total
+
+
+def _check_unrolled_rules() -> None:
+    """Fail fast if ``_evaluate_rules`` has drifted from ``_RULE_PARAMS``."""
+    probes: list[dict] = [{}]
+    all_firing = {}
+    for _weight, key, _default, threshold, denom, kind in _RULE_PARAMS:
+        if kind == "eq":
+            probes += [{key: threshold}, {key: "stable"}]
+            all_firing[key] = threshold
+        else:
+            steps = (-2, -0.5, -0.01, 0, 0.01, 0.5, 2)
+            probes += [{key: threshold + step * denom} for step in steps]
+            all_firing[key] = threshold + (denom / 2 if kind == "gt" else -denom / 2)
+    # Every rule firing at once exercises all the weights together
+    probes.append(all_firing)
+
+    for m in probes:
+        expected = tuple(
+            _rule_score(m.get(key, default), threshold, denom, kind)
+            for _weight, key, default, threshold, denom, kind in _RULE_PARAMS
+        )
+        raw_scores, total = _evaluate_rules(m)
+        expected_total = sum(raw * weight for raw, weight in zip(expected, _RULE_WEIGHTS))
+        if raw_scores != expected or abs(total - expected_total) > 1e-12:
+            raise AssertionError(f"_evaluate_rules disagrees with _RULE_PARAMS for {m}")
+
+
+_check_unrolled_rules()
+
+
+@lru_cache(maxsize=4096)
+def _compute_risk_score_cached(metrics: tuple, detail: bool, thresholds: tuple) -> tuple:
+    """Evaluate the rules; returns (risk_score, risk_level, factor tuples or None)."""
+    raw_scores, total_risk = _evaluate_rules(dict(metrics))
+
+    # Clamp to [0, 1]
+    risk_score = min(1.0, max(0.0, total_risk))
+    risk_level = _LEVELS[bisect_right(thresholds, risk_score)]
+    if not detail:
+        return round(risk_score, 3), risk_level, None
+
+    contributing_factors = [
+        (rule_id, name, description, round(raw_score, 3), round(raw_score * weight, 3))
+        for (rule_id, name, description), raw_score, weight in zip(
+            RULE_META, raw_scores, _RULE_WEIGHTS
+        )
+        if raw_score > 0
+    ]
+
+    # Sort factors by weighted contribution (highest first)
+    contributing_factors.sort(key=itemgetter(4), reverse=True)
+
+    return round(risk_score, 3), risk_level, tuple(contributing_factors)
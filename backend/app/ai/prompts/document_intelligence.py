@@ -1,13 +1,15 @@
 """Prompt templates for document intelligence pipeline."""
 
+from string import Template
+
 CLASSIFY_DOCUMENT_SYSTEM = """You are a document classification expert for Transnational Education (TNE)
 quality assessment. Classify uploaded documents into predefined categories."""
 
-CLASSIFY_DOCUMENT_TEMPLATE = """Classify this document based on its content.
+CLASSIFY_DOCUMENT_TEMPLATE = Template("""Classify this document based on its content.
 
-**Filename**: {filename}
+**Filename**: ${filename}
 **First 2000 characters of extracted text**:
-{text_excerpt}
+${text_excerpt}
 
 Classify into ONE of these categories:
 - terms_of_reference: Partnership agreement or Terms of Reference
@@ -22,20 +24,20 @@ Classify into ONE of these categories:
 - other: Does not fit any category above
 
 Respond in JSON:
-{{
+{
   "document_type": "<category>",
   "confidence": <0.0-1.0>,
   "summary": "<1-2 sentence summary of the document>"
-}}"""
+}""")
 
-EXTRACT_STRUCTURED_DATA_TEMPLATE = """Extract structured data from this {document_type} document.
+EXTRACT_STRUCTURED_DATA_TEMPLATE = Template("""Extract structured data from this ${document_type} document.
 
 **Document text**:
-{document_text}
+${document_text}
 
-{type_specific_instructions}
+${type_specific_instructions}
 
-Respond in JSON with the extracted fields. Use null for fields that cannot be determined."""
+Respond in JSON with the extracted fields. Use null for fields that cannot be determined.""")
 
 # Type-specific extraction instructions
 EXTRACTION_INSTRUCTIONS = {
@@ -63,21 +65,21 @@ EXTRACTION_INSTRUCTIONS = {
 - action_items: List of action items with owners""",
 }
 
-COMPLETENESS_CHECK_TEMPLATE = """Assess whether this document satisfies the requirements for the assessment item.
+COMPLETENESS_CHECK_TEMPLATE = Template("""Assess whether this document satisfies the requirements for the assessment item.
 
-**Assessment Item**: {item_label}
-**Required Document Type**: {required_type}
-**Document Summary**: {document_summary}
-**Extracted Data**: {extracted_data_json}
+**Assessment Item**: ${item_label}
+**Required Document Type**: ${required_type}
+**Document Summary**: ${document_summary}
+**Extracted Data**: ${extracted_data_json}
 
 **Required Sections/Content**:
-{required_sections}
+${required_sections}
 
 Respond in JSON:
-{{
+{
   "is_complete": <true/false>,
   "completeness_score": <0-100>,
   "present_sections": ["<section1>", "<section2>"],
   "missing_sections": ["<section1>"],
   "recommendations": ["<recommendation for improving completeness>"]
-}}"""
+}""")
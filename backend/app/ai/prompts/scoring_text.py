@@ -1,20 +1,15 @@
 """Prompt templates for Claude API text scoring."""
 
+from string import Template
+
 SCORE_TEXT_RESPONSE_SYSTEM = """You are an expert TNE (Transnational Education) quality assessor.
 You evaluate institutional responses against specific rubric dimensions.
 You must be fair, consistent, and evidence-based in your scoring.
 Always provide constructive feedback that helps institutions improve."""
 
-SCORE_TEXT_RESPONSE_TEMPLATE = """Evaluate the following institutional response for the assessment item.
-
-**Item**: {item_label}
-**Item Code**: {item_code}
-**Theme**: {theme_name}
-
-**Institution's Response**:
-{response_text}
-
-**Scoring Rubric** - Score each dimension from 0-25:
+# Static rubric and output format, sent as a prompt-cached system block after
+# SCORE_TEXT_RESPONSE_SYSTEM so only the item block varies per call
+SCORE_TEXT_RUBRIC_BLOCK = """**Scoring Rubric** - Score each dimension from 0-25:
 
 1. **Relevance** (0-25): How relevant is the response to the specific question asked?
    - 25: Directly and comprehensively addresses all aspects
@@ -41,7 +36,7 @@ SCORE_TEXT_RESPONSE_TEMPLATE = """Evaluate the following institutional response
    - 5: Major gaps
 
 Respond in exactly this JSON format:
-{{
+{
   "relevance": <0-25>,
   "specificity": <0-25>,
   "evidence": <0-25>,
@@ -50,27 +45,47 @@ Respond in exactly this JSON format:
   "strengths": ["<strength 1>", "<strength 2>"],
   "weaknesses": ["<weakness 1>", "<weakness 2>"],
   "feedback": "<2-3 sentences of constructive feedback>"
-}}"""
+}"""
+
+SCORE_TEXT_ITEM_BLOCK = Template("""Evaluate the following institutional response for the assessment item \
+against the scoring rubric.
+
+**Item**: ${item_label}
+**Item Code**: ${item_code}
+**Theme**: ${theme_name}
+
+**Institution's Response**:
+${response_text}""")
+
+SCORE_TEXT_BATCH_TEMPLATE = Template("""Evaluate each of the following ${count} institutional responses \
+against the scoring rubric, independently of one another.
+
+${entries}
+
+Respond with a JSON array holding one object per entry. Each object uses the JSON format \
+above plus an "entry" field set to the entry number.""")
 
 CONSISTENCY_CHECK_SYSTEM = """You are an expert TNE quality assessor performing a consistency check.
 Identify contradictions, implausible claims, and inconsistencies across assessment responses."""
 
-CONSISTENCY_CHECK_TEMPLATE = """Review the following assessment responses for internal consistency.
+# Static instructions and output format, sent as a prompt-cached system block
+# after CONSISTENCY_CHECK_SYSTEM so only the assessment data varies per call
+CONSISTENCY_CHECK_FORMAT_BLOCK = """Review the assessment responses you are given for internal consistency.
 Flag any contradictions, implausible claims, or inconsistencies.
 
-**Assessment Data**:
-{assessment_data_json}
-
 Respond in JSON format:
-{{
+{
   "consistent": <true/false>,
   "issues": [
-    {{
+    {
       "severity": "<high/medium/low>",
       "items_involved": ["<item_code_1>", "<item_code_2>"],
       "description": "<description of the inconsistency>",
       "recommendation": "<suggested resolution>"
-    }}
+    }
   ],
   "overall_assessment": "<brief summary>"
-}}"""
+}"""
+
+CONSISTENCY_CHECK_TEMPLATE = Template("""**Assessment Data**:
+${assessment_data_json}""")
@@ -4,19 +4,23 @@ Generates assessment reports section-by-section via Claude API,
 renders to HTML using Jinja2, then converts to PDF via WeasyPrint.
 """
 
+import asyncio
 import logging
 import uuid
+from collections import namedtuple
+from tempfile import SpooledTemporaryFile
 
-import boto3
-from botocore.config import Config as BotoConfig
-from sqlalchemy import select
+from boto3.s3.transfer import TransferConfig
+from cachetools import TTLCache
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.config import settings
 from app.models.assessment import Assessment, AssessmentTheme
-from app.models.scoring import ThemeScore
 from app.models.report import AssessmentReport
 from app.models.tenant import Tenant
+from app.services.storage_service import get_s3_client
 from app.ai.reports.sections import (
     generate_executive_summary,
     generate_theme_analysis,
@@ -26,6 +30,60 @@ from app.ai.reports.pdf_renderer import render_report_pdf
 
 log = logging.getLogger(__name__)
 
+# PDFs stay in memory up to this size before spilling to disk, and larger
+# ones are uploaded in parts of the same size
+_PDF_SPOOL_BYTES = 8 * 1024 * 1024
+_PDF_TRANSFER = TransferConfig(
+    multipart_threshold=_PDF_SPOOL_BYTES,
+    multipart_chunksize=_PDF_SPOOL_BYTES,
+    max_concurrency=4,
+)
+
+
+# Statements are built once and reused, so each call only binds the id
+_ASSESSMENT_STMT = (
+    select(Assessment)
+    .where(Assessment.id == bindparam("assessment_id"))
+    .options(selectinload(Assessment.theme_scores))
+)
+_TENANT_NAME_STMT = select(Tenant.name).where(Tenant.id == bindparam("tenant_id"))
+_TEMPLATE_THEMES_STMT = select(
+    AssessmentTheme.id, AssessmentTheme.name, AssessmentTheme.weight
+).where(AssessmentTheme.template_id == bindparam("template_id"))
+_LATEST_VERSION_STMT = select(func.max(AssessmentReport.version)).where(
+    AssessmentReport.assessment_id == bindparam("assessment_id")
+)
+
+
+# Plain per-theme values read in the report loop, instead of ORM attributes
+ThemeView = namedtuple("ThemeView", "name weight_pct")
+
+# Tenant names and template themes rarely change and are shared by every
+# report for the same tenant/template, so bulk runs skip those queries.
+# Entries are plain values (never ORM instances, which are session-bound).
+# Edits happen in the API process while reports run in Celery workers, so
+# there is no in-process hook to invalidate; the short TTL bounds staleness.
+_tenant_names: TTLCache = TTLCache(maxsize=1024, ttl=300)
+_template_themes: TTLCache = TTLCache(maxsize=256, ttl=300)
+
+
+async def _load_tenant_name(db: AsyncSession, tenant_id: uuid.UUID) -> str:
+    name = _tenant_names.get(tenant_id)
+    if name is None:
+        name = await db.scalar(_TENANT_NAME_STMT, {"tenant_id": tenant_id})
+        _tenant_names[tenant_id] = name
+    return name
+
+
+async def _load_themes(db: AsyncSession, template_id: uuid.UUID) -> dict[uuid.UUID, ThemeView]:
+    """Map theme id to a ThemeView (name, weight as a percentage) for a template."""
+    themes = _template_themes.get(template_id)
+    if themes is None:
+        result = await db.execute(_TEMPLATE_THEMES_STMT, {"template_id": template_id})
+        themes = {row.id: ThemeView(row.name, row.weight * 100.0) for row in result}
+        _template_themes[template_id] = themes
+    return themes
+
 
 async def generate_report(
     db: AsyncSession,
@@ -35,84 +93,59 @@ async def generate_report(
 
     Steps:
     1. Load assessment data and scores
-    2. Generate executive summary via Claude
-    3. Generate per-theme analyses via Claude
-    4. Generate recommendations via Claude
-    5. Render HTML → PDF
-    6. Store report
+    2. Generate executive summary, per-theme analyses and recommendations
+       via Claude, concurrently
+    3. Render HTML → PDF
+    4. Store report
 
     Returns:
         The created AssessmentReport record.
     """
-    # Load assessment
-    result = await db.execute(
-        select(Assessment).where(Assessment.id == assessment_id)
-    )
+    # Load assessment with its theme scores; tenant and themes come from cache
+    result = await db.execute(_ASSESSMENT_STMT, {"assessment_id": assessment_id})
     assessment = result.scalar_one()
-
-    # Load tenant
-    tenant_result = await db.execute(
-        select(Tenant).where(Tenant.id == assessment.tenant_id)
-    )
-    tenant = tenant_result.scalar_one()
-
-    # Load theme scores
-    scores_result = await db.execute(
-        select(ThemeScore).where(ThemeScore.assessment_id == assessment_id)
-    )
-    theme_scores = scores_result.scalars().all()
-
-    # Load themes
-    themes_result = await db.execute(
-        select(AssessmentTheme).where(
-            AssessmentTheme.template_id == assessment.template_id
-        )
-    )
-    themes = themes_result.scalars().all()
-    themes_by_id = {t.id: t for t in themes}
-
-    # Format scores for prompts
-    theme_scores_formatted = "\n".join(
-        f"- {themes_by_id.get(ts.theme_id, type('', (), {'name': 'Unknown'})()).name}: "
-        f"{ts.normalised_score}/100 (weight: {ts.weighted_score})"
-        for ts in theme_scores
-    )
-
-    # 1. Executive Summary
-    executive_summary = await generate_executive_summary(
-        institution_name=tenant.name,
-        academic_year=assessment.academic_year,
-        overall_score=assessment.overall_score,
-        theme_scores_formatted=theme_scores_formatted,
-    )
-
-    # 2. Theme Analyses
-    theme_analyses = {}
+    theme_scores = assessment.theme_scores
+    institution_name = await _load_tenant_name(db, assessment.tenant_id)
+    themes_by_id = await _load_themes(db, assessment.template_id)
+
+    # One pass over the scores builds the prompt lines, the PDF score cards
+    # and the per-theme analysis calls; scores for themes no longer on the
+    # template are skipped throughout
+    lines, theme_tasks, theme_ids, pdf_theme_scores = [], [], [], []
     for ts in theme_scores:
         theme = themes_by_id.get(ts.theme_id)
-        if theme:
-            analysis = await generate_theme_analysis(
-                theme_name=theme.name,
-                theme_score=ts.normalised_score,
-                theme_weight=theme.weight * 100,
-            )
-            theme_analyses[str(ts.theme_id)] = analysis
-
-    # 3. Recommendations
-    recommendations = await generate_recommendations(
-        overall_score=assessment.overall_score,
-        theme_scores_formatted=theme_scores_formatted,
+        if theme is None:
+            continue
+        lines.append(f"- {theme.name}: {ts.normalised_score}/100 (weight: {ts.weighted_score})")
+        pdf_theme_scores.append({"name": theme.name, "score": ts.normalised_score})
+        theme_tasks.append(generate_theme_analysis(
+            theme_name=theme.name,
+            theme_score=ts.normalised_score,
+            theme_weight=theme.weight_pct,
+        ))
+        theme_ids.append(str(ts.theme_id))
+    theme_scores_formatted = "\n".join(lines)
+
+    # Executive summary, theme analyses and recommendations are independent
+    # Claude calls, so run them concurrently (sections.py caps in-flight calls)
+    executive_summary, recommendations, analyses = await asyncio.gather(
+        generate_executive_summary(
+            institution_name=institution_name,
+            academic_year=assessment.academic_year,
+            overall_score=assessment.overall_score,
+            theme_scores_formatted=theme_scores_formatted,
+        ),
+        generate_recommendations(
+            overall_score=assessment.overall_score,
+            theme_scores_formatted=theme_scores_formatted,
+        ),
+        asyncio.gather(*theme_tasks),
     )
+    theme_analyses = dict(zip(theme_ids, analyses))
 
     # Create/update report record
-    existing = await db.execute(
-        select(AssessmentReport)
-        .where(AssessmentReport.assessment_id == assessment_id)
-        .order_by(AssessmentReport.version.desc())
-        .limit(1)
-    )
-    latest = existing.scalar_one_or_none()
-    version = (latest.version + 1) if latest else 1
+    latest_version = await db.scalar(_LATEST_VERSION_STMT, {"assessment_id": assessment_id})
+    version = (latest_version or 0) + 1
 
     report = AssessmentReport(
         assessment_id=assessment_id,
@@ -126,37 +159,32 @@ async def generate_report(
 
     # Generate PDF and upload to S3
     try:
-        pdf_theme_scores = [
-            {"name": themes_by_id[ts.theme_id].name, "score": ts.normalised_score}
-            for ts in theme_scores
-            if ts.theme_id in themes_by_id
-        ]
-        pdf_bytes = render_report_pdf(
-            report=report,
-            institution_name=tenant.name,
-            academic_year=assessment.academic_year,
-            overall_score=assessment.overall_score,
-            theme_scores=pdf_theme_scores,
-        )
-
         storage_key = (
             f"reports/{assessment.tenant_id}/{assessment_id}/"
             f"report-v{version}.pdf"
         )
-        s3 = boto3.client(
-            "s3",
-            endpoint_url=settings.s3_endpoint_url,
-            aws_access_key_id=settings.s3_access_key,
-            aws_secret_access_key=settings.s3_secret_key,
-            region_name=settings.s3_region,
-            config=BotoConfig(signature_version="s3v4"),
-        )
-        s3.put_object(
-            Bucket=settings.s3_bucket_name,
-            Key=storage_key,
-            Body=pdf_bytes,
-            ContentType="application/pdf",
-        )
+        # WeasyPrint rendering and the boto3 upload both block, so keep them
+        # off the event loop; the PDF is streamed through one spooled buffer
+        # rather than held as bytes and copied again for the upload
+        with SpooledTemporaryFile(max_size=_PDF_SPOOL_BYTES) as buf:
+            await asyncio.to_thread(
+                render_report_pdf,
+                report=report,
+                institution_name=institution_name,
+                academic_year=assessment.academic_year,
+                overall_score=assessment.overall_score,
+                theme_scores=pdf_theme_scores,
+                target=buf,
+            )
+            buf.seek(0)
+            await asyncio.to_thread(
+                get_s3_client().upload_fileobj,
+                buf,
+                settings.s3_bucket_name,
+                storage_key,
+                ExtraArgs={"ContentType": "application/pdf"},
+                Config=_PDF_TRANSFER,
+            )
 
         report.pdf_storage_key = storage_key
         await db.flush()
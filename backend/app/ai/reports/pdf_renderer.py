@@ -5,36 +5,93 @@ converts markdown content to HTML via mistune, then renders to PDF
 via WeasyPrint.
 """
 
+import asyncio
 import io
+import multiprocessing
+import os
 import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from collections.abc import Callable
+from functools import lru_cache, partial
+from types import SimpleNamespace
+from typing import IO
 
 import mistune
 import weasyprint
+from cachetools import LRUCache
+from weasyprint.text.fonts import FontConfiguration
 from jinja2 import Environment, BaseLoader
-from markupsafe import Markup
+from markupsafe import Markup, escape
 
 from app.models.report import AssessmentReport
 
-_md = mistune.create_markdown(escape=False)
+# The speedup plugin swaps in mistune's faster paragraph and inline-text
+# rules; output is unchanged for the prose and lists the reports contain
+_md = mistune.create_markdown(escape=False, plugins=["speedup"])
+
+# Leading H1/H2 that just repeats the section title
+_LEADING_H12 = re.compile(r"^\s*<h[12][^>]*>.*?</h[12]>\s*")
+
+
+# Rendered HTML keyed by markdown source: regenerated reports mostly repeat
+# unchanged sections. Renders also run on worker threads, hence the lock
+_html_cache: LRUCache = LRUCache(maxsize=2048)
+_html_cache_lock = threading.Lock()
 
 
 def _md_to_html(text: str) -> str:
     """Convert markdown text to HTML, stripping redundant top-level headings."""
     if not text:
         return ""
-    html = _md(text)
-    # Strip leading H1/H2 that just repeats the section title
-    html = re.sub(r"^\s*<h[12][^>]*>.*?</h[12]>\s*", "", html, count=1)
+    with _html_cache_lock:
+        html = _html_cache.get(text)
+    if html is None:
+        html = _LEADING_H12.sub("", _md(text), count=1)
+        with _html_cache_lock:
+            _html_cache[text] = html
     return html
 
 
-REPORT_HTML_TEMPLATE = """\
-<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="utf-8">
-<style>
+# Separates fragments in a batched markdown pass; mistune passes HTML
+# comments standing alone between blank lines through as raw HTML blocks
+_SPLIT_RE = re.compile(r"\n*<!--md-split-(\d+)-->\n*")
+
+# Stand-in for a markdown fragment until the batched pass has rendered it
+_FRAGMENT_RE = re.compile(r"<md-fragment (\d+)>")
+
+
+def _md_to_html_batch(texts: list[str]) -> list[str]:
+    """Convert several markdown texts to HTML with a single parser pass.
+
+    Texts already in the cache are not parsed again. Falls back to converting
+    each text separately if a fragment swallows a split marker (e.g. an
+    unclosed code fence), so output always lines up.
+    """
+    with _html_cache_lock:
+        rendered = [_html_cache.get(text) if text else "" for text in texts]
+    misses = [n for n, html in enumerate(rendered) if html is None]
+
+    if len(misses) > 1:
+        joined = "\n\n".join(
+            f"{texts[n]}\n\n<!--md-split-{i}-->" for i, n in enumerate(misses)
+        )
+        pieces = _SPLIT_RE.split(_md(joined))
+        # split() alternates html and marker ids: [html0, "0", html1, "1", ..., tail]
+        if pieces[1::2] == [str(i) for i in range(len(misses))]:
+            with _html_cache_lock:
+                for n, html in zip(misses, pieces[0::2]):
+                    rendered[n] = _html_cache[texts[n]] = _LEADING_H12.sub("", html, count=1)
+            return rendered
+
+    for n in misses:
+        rendered[n] = _md_to_html(texts[n])
+    return rendered
+
+
+# Report stylesheet, parsed once into _CSS and applied at render time
+REPORT_STYLE = """\
   @page {
     size: A4;
     margin: 2cm 2.5cm 2.5cm 2.5cm;
@@ -281,7 +338,13 @@ REPORT_HTML_TEMPLATE = """\
     color: #94a3b8;
     text-align: center;
   }
-</style>
+"""
+
+REPORT_HTML_TEMPLATE = """\
+<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
 </head>
 <body>
 
@@ -306,11 +369,11 @@ REPORT_HTML_TEMPLATE = """\
       <div class="value brand">{{ "%.1f"|format(overall_score) }}%</div>
       <div class="bar"><div class="bar-fill brand-bg" style="width:{{ overall_score }}%"></div></div>
     </div>
-    {% for ts in theme_scores %}
+    {% for card in score_cards %}
     <div class="score-card">
-      <div class="label">{{ ts.name }}</div>
-      <div class="value {{ score_class(ts.score) }}">{{ "%.1f"|format(ts.score) }}%</div>
-      <div class="bar"><div class="bar-fill {{ score_class(ts.score) }}-bg" style="width:{{ ts.score }}%"></div></div>
+      <div class="label">{{ card["label"] }}</div>
+      <div class="value {{ card["cls"] }}">{{ card["value"] }}%</div>
+      <div class="bar"><div class="bar-fill {{ card["cls"] }}-bg" style="width:{{ card["width"] }}%"></div></div>
     </div>
     {% endfor %}
   </div>
@@ -322,7 +385,7 @@ REPORT_HTML_TEMPLATE = """\
   <h2>Contents</h2>
   <ol>
     {% for section in sections %}
-    <li>{{ section.title }}</li>
+    <li>{{ section["title"] }}</li>
     {% endfor %}
   </ol>
 </div>
@@ -331,17 +394,17 @@ REPORT_HTML_TEMPLATE = """\
 {% for section in sections %}
 <div class="section">
   <div class="section-header">
-    <h2>{{ section.title }}</h2>
-    {% if section.score is not none %}
-    <span class="score-badge {{ score_class(section.score) }}" style="background:{{ score_bg(section.score) }}">
-      {{ "%.1f"|format(section.score) }}%
+    <h2>{{ section["title"] }}</h2>
+    {% if section["score"] is not none %}
+    <span class="score-badge {{ section["cls"] }}" style="background:{{ section["bg"] }}">
+      {{ section["value"] }}%
     </span>
     {% endif %}
   </div>
-  {% if section.is_recommendations %}
-    {{ section.content }}
+  {% if section["is_recommendations"] %}
+    {{ section["content"] }}
   {% else %}
-    <div class="content">{{ section.content }}</div>
+    <div class="content">{{ section["content"] }}</div>
   {% endif %}
 </div>
 {% endfor %}
@@ -354,25 +417,31 @@ REPORT_HTML_TEMPLATE = """\
 </html>
 """
 
+# Parsed and compiled once per process rather than on every render
+_JINJA_ENV = Environment(loader=BaseLoader(), autoescape=False)
+_REPORT_TEMPLATE = _JINJA_ENV.from_string(REPORT_HTML_TEMPLATE)
+
+# One font configuration for every render, so fonts are loaded once per
+# process instead of per document
+_FONT_CONFIG = FontConfiguration()
+_CSS = weasyprint.CSS(string=REPORT_STYLE, font_config=_FONT_CONFIG)
+
+
+# Indexed by score bucket: below 60, 60-80, 80 and above
+_SCORE_CLASSES = ("poor", "fair", "good")
+_SCORE_BGS = ("#fef2f2", "#fffbeb", "#ecfdf5")
+
 
 def _score_class(score: float | None) -> str:
     if score is None:
         return ""
-    if score >= 80:
-        return "good"
-    if score >= 60:
-        return "fair"
-    return "poor"
+    return _SCORE_CLASSES[(score >= 60) + (score >= 80)]
 
 
 def _score_bg(score: float | None) -> str:
     if score is None:
         return "#f1f5f9"
-    if score >= 80:
-        return "#ecfdf5"
-    if score >= 60:
-        return "#fffbeb"
-    return "#fef2f2"
+    return _SCORE_BGS[(score >= 60) + (score >= 80)]
 
 
 def _build_recommendation_cards(recs_content: str) -> str:
@@ -385,16 +454,23 @@ def _build_recommendation_cards(recs_content: str) -> str:
     return f'<div class="content">{recs_content}</div>'
 
 
-def _build_recommendations_from_raw(recs: list | dict | None) -> str:
-    """Build recommendation cards directly from the raw DB data."""
+def _build_recommendations_from_raw(
+    recs: list | dict | None,
+    md_to_html: Callable[[str], str] = _md_to_html,
+) -> Markup:
+    """Build recommendation cards directly from the raw DB data.
+
+    Model-generated fields are HTML-escaped as the cards are built; only the
+    rationale is rendered from markdown, via ``md_to_html``.
+    """
     if not recs:
-        return ""
+        return Markup("")
 
     if isinstance(recs, dict):
         recs = list(recs.values()) if recs else []
 
     if not isinstance(recs, list):
-        return f'<div class="content"><p>{recs}</p></div>'
+        return Markup(f'<div class="content"><p>{escape(recs)}</p></div>')
 
     cards = []
     for i, rec in enumerate(recs, 1):
@@ -412,23 +488,26 @@ def _build_recommendations_from_raw(recs: list | dict | None) -> str:
 
             priority_cls = f"priority-{priority}" if priority in ("high", "medium", "low") else "priority-medium"
 
-            card = f'<div class="rec-card">'
-            card += f'<div class="rec-header">'
-            card += f'<span class="rec-number">{i}</span>'
-            card += f'<span class="rec-title">{title}</span>'
-            card += f'</div>'
-            card += f'<div class="rec-meta">'
-            card += f'<span class="priority-badge {priority_cls}">{priority}</span>'
+            parts = [
+                '<div class="rec-card">',
+                '<div class="rec-header">',
+                f'<span class="rec-number">{i}</span>',
+                f'<span class="rec-title">{escape(title)}</span>',
+                '</div>',
+                '<div class="rec-meta">',
+                f'<span class="priority-badge {priority_cls}">{escape(priority)}</span>',
+            ]
             if themes:
-                card += f'<span class="theme-tag">{themes}</span>'
-            card += f'</div>'
+                parts.append(f'<span class="theme-tag">{escape(themes)}</span>')
+            parts.append('</div>')
             if rationale:
-                rationale_html = _md_to_html(rationale)
-                card += f'<div class="rec-body">{rationale_html}</div>'
+                parts.append(f'<div class="rec-body">{md_to_html(rationale)}</div>')
             if timeline:
-                card += f'<div class="timeline"><strong>Timeline:</strong> {timeline}</div>'
-            card += f'</div>'
-            cards.append(card)
+                parts.append(
+                    f'<div class="timeline"><strong>Timeline:</strong> {escape(timeline)}</div>'
+                )
+            parts.append('</div>')
+            cards.append("".join(parts))
         elif isinstance(rec, str):
             cards.append(
                 f'<div class="rec-card">'
@@ -436,11 +515,11 @@ def _build_recommendations_from_raw(recs: list | dict | None) -> str:
                 f'<span class="rec-number">{i}</span>'
                 f'<span class="rec-title">Recommendation {i}</span>'
                 f'</div>'
-                f'<div class="rec-body"><p>{rec}</p></div>'
+                f'<div class="rec-body"><p>{escape(rec)}</p></div>'
                 f'</div>'
             )
 
-    return "\n".join(cards)
+    return Markup("\n".join(cards))
 
 
 def render_report_pdf(
@@ -449,8 +528,9 @@ def render_report_pdf(
     academic_year: str,
     overall_score: float | None = None,
     theme_scores: list[dict] | None = None,
-) -> bytes:
-    """Render report to PDF bytes.
+    target: IO[bytes] | str | None = None,
+) -> bytes | None:
+    """Render report to PDF bytes, or stream it into ``target``.
 
     Args:
         report: The AssessmentReport record with content fields populated.
@@ -458,20 +538,31 @@ def render_report_pdf(
         academic_year: Assessment academic year string.
         overall_score: Overall assessment percentage (0-100).
         theme_scores: List of dicts with 'name' and 'score' keys.
+        target: Optional binary file object or file path to write the PDF into.
 
     Returns:
-        PDF file as bytes.
+        PDF file as bytes, or None when written to ``target``.
     """
     theme_scores = theme_scores or []
     theme_score_map = {ts["name"]: ts["score"] for ts in theme_scores}
 
+    # Markdown is collected while the sections are built and converted in one
+    # batched pass once the page is rendered
+    fragments: list[str] = []
+
+    def md(text: str) -> str:
+        if not text:
+            return ""
+        fragments.append(text)
+        return f"<md-fragment {len(fragments) - 1}>"
+
     sections = []
 
     # Executive summary
     if report.executive_summary:
         sections.append({
             "title": "Executive Summary",
-            "content": Markup(_md_to_html(report.executive_summary)),
+            "content": Markup(md(report.executive_summary)),
             "score": None,
             "is_recommendations": False,
         })
@@ -489,14 +580,14 @@ def render_report_pdf(
                 # The 'analysis' key holds the full markdown text
                 analysis_text = analysis.get("analysis", "")
                 if analysis_text:
-                    content_html = _md_to_html(analysis_text)
+                    content_html = md(analysis_text)
                 else:
                     # Fallback: try structured fields
                     html_parts = []
                     for field in ("summary", "strengths", "areas_for_improvement"):
                         val = analysis.get(field)
                         if isinstance(val, str):
-                            html_parts.append(_md_to_html(val))
+                            html_parts.append(md(val))
                         elif isinstance(val, list):
                             label = field.replace("_", " ").title()
                             html_parts.append(f"<h3>{label}</h3><ul>")
@@ -518,36 +609,114 @@ def render_report_pdf(
 
                 sections.append({
                     "title": title,
-                    "content": Markup(_md_to_html(analysis)),
+                    "content": Markup(md(analysis)),
                     "score": theme_score,
                     "is_recommendations": False,
                 })
 
     # Recommendations
     if report.improvement_recommendations:
-        recs_html = _build_recommendations_from_raw(report.improvement_recommendations)
+        recs_html = _build_recommendations_from_raw(report.improvement_recommendations, md)
         sections.append({
             "title": "Improvement Recommendations",
-            "content": Markup(recs_html),
+            "content": recs_html,
             "score": None,
             "is_recommendations": True,
         })
 
-    env = Environment(loader=BaseLoader(), autoescape=False)
-    template = env.from_string(REPORT_HTML_TEMPLATE)
-
-    html_str = template.render(
+    # Score strings and classes are formatted here so the template only does
+    # plain item lookups per card and section
+    score_cards = [
+        {
+            "label": ts["name"],
+            "value": f"{ts['score']:.1f}",
+            "cls": _score_class(ts["score"]),
+            "width": ts["score"],
+        }
+        for ts in theme_scores
+    ]
+    for section in sections:
+        score = section["score"]
+        if score is not None:
+            section["value"] = f"{score:.1f}"
+            section["cls"] = _score_class(score)
+            section["bg"] = _score_bg(score)
+
+    html_str = _REPORT_TEMPLATE.render(
         institution_name=institution_name,
         academic_year=academic_year,
         version=report.version,
         generated_date=datetime.now(timezone.utc).strftime("%d %B %Y"),
         overall_score=overall_score,
-        theme_scores=theme_scores,
+        score_cards=score_cards,
         sections=sections,
-        score_class=_score_class,
-        score_bg=_score_bg,
     )
+    rendered = _md_to_html_batch(fragments)
+    html_str = _FRAGMENT_RE.sub(lambda m: rendered[int(m.group(1))], html_str)
+
+    document = weasyprint.HTML(string=html_str)
+    if target is not None:
+        document.write_pdf(target, stylesheets=[_CSS], font_config=_FONT_CONFIG)
+        return None
 
     pdf_bytes = io.BytesIO()
-    weasyprint.HTML(string=html_str).write_pdf(pdf_bytes)
+    document.write_pdf(pdf_bytes, stylesheets=[_CSS], font_config=_FONT_CONFIG)
     return pdf_bytes.getvalue()
+
+
+@lru_cache(maxsize=1)
+def _pdf_pool() -> ProcessPoolExecutor:
+    # Created on first use so importers that never render asynchronously
+    # (Celery workers, scripts) do not start processes. Workers are replaced
+    # after a few renders to hand back WeasyPrint's per-render memory growth.
+    # Sized to the CPUs this process may run on, not every core on the host,
+    # so a pinned container does not start more renderers than it can run.
+    usable_cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else None
+    return ProcessPoolExecutor(
+        max_workers=usable_cpus or os.cpu_count() or 2,
+        mp_context=multiprocessing.get_context("spawn"),
+        max_tasks_per_child=20,
+    )
+
+
+def _render_worker(report_fields: dict, **kwargs) -> bytes | None:
+    return render_report_pdf(report=SimpleNamespace(**report_fields), **kwargs)
+
+
+async def render_report_pdf_async(
+    report: AssessmentReport,
+    institution_name: str,
+    academic_year: str,
+    overall_score: float | None = None,
+    theme_scores: list[dict] | None = None,
+    target: str | None = None,
+) -> bytes | None:
+    """Render report to PDF bytes in a worker process.
+
+    With a ``target`` file path the worker writes the PDF there and nothing
+    is returned, so the document never passes through this process's memory.
+
+    Keeps CPU-bound rendering off the event loop and out of the GIL. For the
+    API process only: daemonic Celery workers cannot start child processes,
+    so tasks render with ``render_report_pdf`` in a thread instead.
+    """
+    # ORM instances do not cross the process boundary; send the fields the
+    # renderer reads as plain values
+    report_fields = {
+        "version": report.version,
+        "executive_summary": report.executive_summary,
+        "theme_analyses": report.theme_analyses,
+        "improvement_recommendations": report.improvement_recommendations,
+    }
+    return await asyncio.get_running_loop().run_in_executor(
+        _pdf_pool(),
+        partial(
+            _render_worker,
+            report_fields,
+            institution_name=institution_name,
+            academic_year=academic_year,
+            overall_score=overall_score,
+            theme_scores=theme_scores,
+            target=target,
+        ),
+    )
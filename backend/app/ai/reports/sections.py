@@ -1,8 +1,12 @@
 """Individual report section generators using Claude API."""
 
-import json
+import asyncio
 
-from app.ai.claude_client import call_claude
+import orjson
+
+from app.ai.claude_client import call_claude_async, extract_json
+from app.config import settings
+from app.services.cache_service import loop_local
 from app.ai.prompts.report_sections import (
     EXECUTIVE_SUMMARY_SYSTEM,
     EXECUTIVE_SUMMARY_TEMPLATE,
@@ -11,6 +15,12 @@ from app.ai.prompts.report_sections import (
 )
 
 
+@loop_local
+def _claude_slots() -> asyncio.Semaphore:
+    """Cap in-flight section calls so a gathered report stays under rate limits."""
+    return asyncio.Semaphore(settings.claude_max_concurrency)
+
+
 async def generate_executive_summary(
     institution_name: str,
     academic_year: str,
@@ -23,7 +33,7 @@ async def generate_executive_summary(
     employment_rate: float | str = "N/A",
 ) -> str:
     """Generate executive summary section via Claude API."""
-    prompt = EXECUTIVE_SUMMARY_TEMPLATE.format(
+    prompt = EXECUTIVE_SUMMARY_TEMPLATE.substitute(
         institution_name=institution_name,
         academic_year=academic_year,
         overall_score=overall_score or "N/A",
@@ -35,12 +45,13 @@ async def generate_executive_summary(
         employment_rate=employment_rate,
     )
 
-    result = call_claude(
-        messages=[{"role": "user", "content": prompt}],
-        system=EXECUTIVE_SUMMARY_SYSTEM,
-        temperature=0.3,  # Slightly creative for prose
-        max_tokens=2000,
-    )
+    async with _claude_slots():
+        result = await call_claude_async(
+            messages=[{"role": "user", "content": prompt}],
+            system=EXECUTIVE_SUMMARY_SYSTEM,
+            temperature=0.3,  # Slightly creative for prose
+            max_tokens=2000,
+        )
 
     return result["content"]
 
@@ -53,7 +64,7 @@ async def generate_theme_analysis(
     benchmark_data: str = "No benchmark data available for comparison",
 ) -> dict:
     """Generate per-theme analysis section via Claude API."""
-    prompt = THEME_ANALYSIS_TEMPLATE.format(
+    prompt = THEME_ANALYSIS_TEMPLATE.substitute(
         theme_name=theme_name,
         theme_score=theme_score or "N/A",
         theme_weight=theme_weight,
@@ -61,12 +72,13 @@ async def generate_theme_analysis(
         benchmark_data=benchmark_data,
     )
 
-    result = call_claude(
-        messages=[{"role": "user", "content": prompt}],
-        system=EXECUTIVE_SUMMARY_SYSTEM,
-        temperature=0.3,
-        max_tokens=1500,
-    )
+    async with _claude_slots():
+        result = await call_claude_async(
+            messages=[{"role": "user", "content": prompt}],
+            system=EXECUTIVE_SUMMARY_SYSTEM,
+            temperature=0.3,
+            max_tokens=1500,
+        )
 
     return {
         "theme_name": theme_name,
@@ -82,27 +94,24 @@ async def generate_recommendations(
     consistency_issues: str = "None identified",
 ) -> list[dict]:
     """Generate improvement recommendations via Claude API."""
-    prompt = RECOMMENDATIONS_TEMPLATE.format(
+    prompt = RECOMMENDATIONS_TEMPLATE.substitute(
         assessment_summary=f"Overall score: {overall_score or 'N/A'}/100",
         theme_scores_formatted=theme_scores_formatted,
         low_scoring_items=low_scoring_items,
         consistency_issues=consistency_issues,
     )
 
-    result = call_claude(
-        messages=[{"role": "user", "content": prompt}],
-        system=EXECUTIVE_SUMMARY_SYSTEM,
-        temperature=0.3,
-        max_tokens=3000,
-    )
+    async with _claude_slots():
+        result = await call_claude_async(
+            messages=[{"role": "user", "content": prompt}],
+            system=EXECUTIVE_SUMMARY_SYSTEM,
+            temperature=0.3,
+            max_tokens=3000,
+        )
 
     # Parse JSON array from response
     content = result["content"]
     try:
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0]
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0]
-        return json.loads(content.strip())
-    except (json.JSONDecodeError, IndexError):
+        return extract_json(content)
+    except orjson.JSONDecodeError:
         return [{"title": "Report generation note", "detail": content}]
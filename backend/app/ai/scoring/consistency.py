@@ -3,39 +3,48 @@
 Combines rule-based checks with a Claude API call for cross-theme inconsistency detection.
 """
 
-import json
-
-from app.ai.claude_client import call_claude
-from app.ai.prompts.scoring_text import CONSISTENCY_CHECK_SYSTEM, CONSISTENCY_CHECK_TEMPLATE
-
-
-# Rule-based consistency checks
-CONSISTENCY_RULES = [
-    {
-        "id": "staff_count_vs_phd",
-        "description": "PhD staff cannot exceed total academic staff",
-        "check": lambda r: (
-            r.get("TL07", {}).get("value", 0) or 0
-        ) <= (r.get("TL06", {}).get("value", float("inf")) or float("inf")),
-    },
-    {
-        "id": "flying_faculty_vs_staff",
-        "description": "Flying faculty cannot exceed total academic staff",
-        "check": lambda r: (
-            r.get("TL09", {}).get("value", 0) or 0
-        ) <= (r.get("TL06", {}).get("value", float("inf")) or float("inf")),
-    },
-    {
-        "id": "retention_plausibility",
-        "description": "Retention rate should be between 0-100%",
-        "check": lambda r: 0 <= (r.get("TL04", {}).get("value", 50) or 50) <= 100,
-    },
-    {
-        "id": "employment_rate_plausibility",
-        "description": "Employment rate should be between 0-100%",
-        "check": lambda r: 0 <= (r.get("SE04", {}).get("value", 50) or 50) <= 100,
-    },
-]
+import asyncio
+
+import orjson
+
+from app.ai.claude_client import cached_system, call_claude_async, extract_json
+from app.ai.prompts.scoring_text import (
+    CONSISTENCY_CHECK_FORMAT_BLOCK,
+    CONSISTENCY_CHECK_SYSTEM,
+    CONSISTENCY_CHECK_TEMPLATE,
+)
+
+
+_INF = float("inf")
+
+# Instructions and output format form one prompt-cached prefix; the user
+# message carries only the assessment data
+_SYSTEM_BLOCK = cached_system(CONSISTENCY_CHECK_SYSTEM, CONSISTENCY_CHECK_FORMAT_BLOCK)
+
+# Character budget for the assessment data sent to Claude
+_MAX_DATA_CHARS = 5000
+
+# Rule-based consistency checks as (id, description), in the order
+# run_rule_checks evaluates them
+CONSISTENCY_RULES = (
+    ("staff_count_vs_phd", "PhD staff cannot exceed total academic staff"),
+    ("flying_faculty_vs_staff", "Flying faculty cannot exceed total academic staff"),
+    ("retention_plausibility", "Retention rate should be between 0-100%"),
+    ("employment_rate_plausibility", "Employment rate should be between 0-100%"),
+)
+
+
+def _get_num(responses_by_code: dict, code: str, default: float):
+    """Response value for an item code, or the default when absent/empty."""
+    return responses_by_code.get(code, {}).get("value", default) or default
+
+
+def _le(a, b) -> bool:
+    """``a <= b``, treating values that cannot be compared as passing the rule."""
+    try:
+        return a <= b
+    except TypeError:
+        return True
 
 
 def run_rule_checks(responses_by_code: dict) -> list[dict]:
@@ -47,19 +56,70 @@ def run_rule_checks(responses_by_code: dict) -> list[dict]:
     Returns:
         List of issues found.
     """
-    issues = []
-    for rule in CONSISTENCY_RULES:
-        try:
-            if not rule["check"](responses_by_code):
-                issues.append({
-                    "severity": "high",
-                    "rule_id": rule["id"],
-                    "description": rule["description"],
-                    "type": "rule_violation",
-                })
-        except (KeyError, TypeError):
+    total_staff = _get_num(responses_by_code, "TL06", _INF)
+    phd_staff = _get_num(responses_by_code, "TL07", 0)
+    flying_faculty = _get_num(responses_by_code, "TL09", 0)
+    retention = _get_num(responses_by_code, "TL04", 50)
+    employment = _get_num(responses_by_code, "SE04", 50)
+
+    passed = (
+        _le(phd_staff, total_staff),
+        _le(flying_faculty, total_staff),
+        _le(0, retention) and _le(retention, 100),
+        _le(0, employment) and _le(employment, 100),
+    )
+    return [
+        {
+            "severity": "high",
+            "rule_id": rule_id,
+            "description": description,
+            "type": "rule_violation",
+        }
+        for (rule_id, description), ok in zip(CONSISTENCY_RULES, passed)
+        if not ok
+    ]
+
+
+def _compact_payload(responses_by_code: dict, limit: int = _MAX_DATA_CHARS) -> str:
+    """Compact JSON of the non-empty responses, cut off at ``limit`` characters.
+
+    Entries are serialized one at a time and serialization stops once the
+    budget is used, so large assessments are never dumped in full.
+    """
+    parts = []
+    size = 1
+    for code, value in responses_by_code.items():
+        if not value:
             continue
-    return issues
+        part = "{}:{}".format(
+            orjson.dumps(code).decode(),
+            orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS).decode(),
+        )
+        parts.append(part)
+        size += len(part) + 1
+        if size > limit:
+            break
+    return ("{" + ",".join(parts) + "}")[:limit]
+
+
+async def _ai_issues(responses_by_code: dict) -> list[dict]:
+    """Ask Claude for cross-theme inconsistencies; failures yield no issues."""
+    try:
+        prompt = CONSISTENCY_CHECK_TEMPLATE.substitute(
+            assessment_data_json=_compact_payload(responses_by_code)
+        )
+
+        result = await call_claude_async(
+            messages=[{"role": "user", "content": prompt}],
+            system=_SYSTEM_BLOCK,
+            temperature=0.0,
+            max_tokens=2000,
+        )
+
+        ai_result = extract_json(result["content"])
+        return ai_result.get("issues", [])
+    except Exception:
+        return []  # AI check is non-critical
 
 
 async def check_consistency(
@@ -75,38 +135,15 @@ async def check_consistency(
     Returns:
         Dict with is_consistent, issues list, and summary.
     """
-    # Phase 1: Rule-based checks
-    rule_issues = run_rule_checks(responses_by_code)
-
-    # Phase 3: AI-based cross-theme consistency check
-    ai_issues = []
+    # Rule-based checks run on a worker thread while the AI-based
+    # cross-theme check waits on Claude
     if use_ai:
-        try:
-            prompt = CONSISTENCY_CHECK_TEMPLATE.format(
-                assessment_data_json=json.dumps(
-                    {k: v for k, v in responses_by_code.items() if v},
-                    indent=2,
-                    default=str,
-                )[:5000]  # Limit context size
-            )
-
-            result = call_claude(
-                messages=[{"role": "user", "content": prompt}],
-                system=CONSISTENCY_CHECK_SYSTEM,
-                temperature=0.0,
-                max_tokens=2000,
-            )
-
-            content = result["content"]
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0]
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0]
-
-            ai_result = json.loads(content.strip())
-            ai_issues = ai_result.get("issues", [])
-        except Exception:
-            pass  # AI check is non-critical
+        rule_issues, ai_issues = await asyncio.gather(
+            asyncio.to_thread(run_rule_checks, responses_by_code),
+            _ai_issues(responses_by_code),
+        )
+    else:
+        rule_issues, ai_issues = run_rule_checks(responses_by_code), []
 
     all_issues = rule_issues + ai_issues
 
@@ -1,7 +1,29 @@
 """Numeric item scorer - algorithmic scoring against configurable ranges."""
 
+from bisect import bisect_right
+from functools import lru_cache
+from operator import itemgetter
+
 from app.models.assessment import AssessmentItem
 
+_NEG_INF = float("-inf")
+_INF = float("inf")
+
+
+@lru_cache(maxsize=256)
+def _prepare_ranges(bands: tuple) -> tuple[list, list, list] | None:
+    """Sort (min, max, score) bands by min for bisection.
+
+    Returns None when bands overlap, since then the first matching band in
+    rubric order wins and a linear scan is needed to honour that.
+    """
+    ordered = sorted(bands, key=itemgetter(0))
+    mins = [band[0] for band in ordered]
+    maxes = [band[1] for band in ordered]
+    if any(maxes[i] > mins[i + 1] for i in range(len(ordered) - 1)):
+        return None
+    return mins, maxes, [band[2] for band in ordered]
+
 
 async def score_numeric(
     value: dict | None,
@@ -37,13 +59,24 @@ async def score_numeric(
     if not ranges:
         return None
 
+    # Rubrics are shared by every response to an item, so the sorted form
+    # is built once per distinct set of bands
+    bands = tuple(
+        (r.get("min", _NEG_INF), r.get("max", _INF), r.get("score")) for r in ranges
+    )
+    prepared = _prepare_ranges(bands)
+
     score = None
-    for r in ranges:
-        r_min = r.get("min", float("-inf"))
-        r_max = r.get("max", float("inf"))
-        if r_min <= num_value < r_max:
-            score = float(r["score"])
-            break
+    if prepared is None:
+        for r_min, r_max, r_score in bands:
+            if r_min <= num_value < r_max:
+                score = float(r_score)
+                break
+    else:
+        mins, maxes, scores = prepared
+        idx = bisect_right(mins, num_value) - 1
+        if idx >= 0 and mins[idx] <= num_value < maxes[idx]:
+            score = float(scores[idx])
 
     if score is None:
         return None
@@ -3,21 +3,27 @@
 Chains: Numeric → Binary → Text (Claude) → Timeseries → Consistency → Aggregation
 """
 
+import asyncio
 import uuid
+from types import MappingProxyType
 
+import structlog
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.models.assessment import Assessment, AssessmentItem, AssessmentResponse, AssessmentTheme
 from app.ai.scoring.numeric import score_numeric
 from app.ai.scoring.binary import score_binary
-from app.ai.scoring.text import score_text
+from app.ai.scoring.text import score_text, score_text_batch
 from app.ai.scoring.timeseries import score_timeseries
 from app.services.scoring_service import calculate_theme_scores
 
+logger = structlog.get_logger()
+
 
 # Map field types to scoring functions
-SCORER_MAP = {
+SCORER_MAP = MappingProxyType({
     "numeric": score_numeric,
     "percentage": score_numeric,
     "auto_calculated": score_numeric,
@@ -25,10 +31,12 @@ SCORER_MAP = {
     "long_text": score_text,
     "short_text": score_text,
     "multi_year_gender": score_timeseries,
-}
+})
 
 # Field types that don't need individual scoring (scored via other mechanisms)
-SKIP_SCORING = {"file_upload", "dropdown", "multi_select", "partner_specific", "salary_bands"}
+SKIP_SCORING = frozenset(
+    {"file_upload", "dropdown", "multi_select", "partner_specific", "salary_bands"}
+)
 
 
 async def score_assessment(
@@ -47,45 +55,66 @@ async def score_assessment(
     if not assessment:
         raise ValueError(f"Assessment {assessment_id} not found")
 
-    # Load all items for this template
-    items_result = await db.execute(
-        select(AssessmentItem)
-        .join(AssessmentTheme)
-        .where(AssessmentTheme.template_id == assessment.template_id)
-    )
-    items = items_result.scalars().all()
-    items_by_id = {item.id: item for item in items}
-
-    # Load all responses
-    responses_result = await db.execute(
-        select(AssessmentResponse).where(
-            AssessmentResponse.assessment_id == assessment_id
+    # Load responses paired with their template items in one round-trip;
+    # responses to items outside the template are dropped by the join
+    rows_result = await db.execute(
+        select(AssessmentResponse, AssessmentItem)
+        .join(AssessmentItem, AssessmentItem.id == AssessmentResponse.item_id)
+        .join(AssessmentTheme, AssessmentTheme.id == AssessmentItem.theme_id)
+        .where(
+            AssessmentResponse.assessment_id == assessment_id,
+            AssessmentTheme.template_id == assessment.template_id,
         )
     )
-    responses = responses_result.scalars().all()
+    rows = rows_result.all()
 
     scored_count = 0
     skipped_count = 0
 
-    for response in responses:
-        item = items_by_id.get(response.item_id)
-        if not item:
-            continue
-
-        if item.field_type in SKIP_SCORING:
-            skipped_count += 1
-            continue
-
-        scorer = SCORER_MAP.get(item.field_type)
+    # Scorers are independent, so run them concurrently; text responses go to
+    # Claude together through the batched scorer instead of one call each
+    pending, text_batch = [], []
+    skip_scoring, get_scorer = SKIP_SCORING, SCORER_MAP.get
+    for response, item in rows:
+        field_type = item.field_type
+        scorer = None if field_type in skip_scoring else get_scorer(field_type)
         if scorer is None:
             skipped_count += 1
             continue
 
-        score_result = await scorer(
-            value=response.value,
-            rubric=item.scoring_rubric,
-            item=item,
-        )
+        if scorer is score_text:
+            text_batch.append((response, item))
+        else:
+            pending.append((response, scorer(
+                value=response.value,
+                rubric=item.scoring_rubric,
+                item=item,
+            )))
+
+    text_results, *results = await asyncio.gather(
+        score_text_batch(
+            [(item, response.value) for response, item in text_batch],
+            tenant_id=assessment.tenant_id,
+            use_message_batches=settings.claude_use_message_batches,
+        ),
+        *(coro for _, coro in pending),
+        return_exceptions=True,
+    )
+    if isinstance(text_results, Exception):
+        text_results = [text_results] * len(text_batch)
+
+    scored_pairs = [
+        *zip((response for response, _ in text_batch), text_results),
+        *zip((response for response, _ in pending), results),
+    ]
+    for response, score_result in scored_pairs:
+        if isinstance(score_result, Exception):
+            logger.warning(
+                "item_scoring_failed",
+                response_id=str(response.id),
+                error=str(score_result),
+            )
+            continue
 
         if score_result is not None:
             response.ai_score = score_result.get("score")
@@ -94,12 +123,10 @@ async def score_assessment(
 
     await db.flush()
 
-    # Aggregate into theme scores
+    # Aggregate into theme scores; this also sets the overall score on
+    # ``assessment``, the same identity-mapped instance, so no refresh is needed
     theme_scores = await calculate_theme_scores(db, assessment_id)
 
-    # Refresh to get updated overall score
-    await db.refresh(assessment)
-
     return {
         "assessment_id": str(assessment_id),
         "overall_score": assessment.overall_score,
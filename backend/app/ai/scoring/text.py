@@ -1,85 +1,297 @@
 """Free-text item scorer using Claude API rubric evaluation."""
 
-import json
+import asyncio
+import re
+import uuid
 
-from app.ai.claude_client import call_claude
-from app.ai.prompts.scoring_text import SCORE_TEXT_RESPONSE_SYSTEM, SCORE_TEXT_RESPONSE_TEMPLATE
+from app.ai.claude_client import (
+    cached_system,
+    call_claude_async,
+    call_claude_batch_async,
+    extract_json,
+)
+from app.ai.scoring.text_cache import cache_scores, embed, get_cached_scores
+from app.ai.prompts.scoring_text import (
+    SCORE_TEXT_BATCH_TEMPLATE,
+    SCORE_TEXT_ITEM_BLOCK,
+    SCORE_TEXT_RESPONSE_SYSTEM,
+    SCORE_TEXT_RUBRIC_BLOCK,
+)
+from app.config import settings
 from app.models.assessment import AssessmentItem
 
+# Instructions and rubric are identical for every item, so they form one
+# prompt-cached prefix and each call only sends the item block as new input
+_SYSTEM_BLOCK = cached_system(SCORE_TEXT_RESPONSE_SYSTEM, SCORE_TEXT_RUBRIC_BLOCK)
+
+# Responses scored per batched request, and the output budget for each
+_BATCH_SIZE = 10
+_BATCH_TOKENS_PER_ITEM = 600
+
+# Characters of a response sent to Claude (and embedded for the score cache)
+_MAX_RESPONSE_CHARS = 3000
+
+# SCORE_TEXT_ITEM_BLOCK cut once at its placeholders (item label, item code,
+# theme name, response text, in that order) so each block is one concatenation
+(
+    _ITEM_HEAD,
+    _ITEM_AFTER_LABEL,
+    _ITEM_AFTER_CODE,
+    _ITEM_AFTER_THEME,
+    _ITEM_TAIL,
+) = re.split(r"\$\{\w+\}", SCORE_TEXT_ITEM_BLOCK.template)
+
+_TOO_SHORT = {
+    "score": 0.0,
+    "feedback": "Response is too short or empty to evaluate.",
+}
+
+_TOO_GENERIC = {
+    "score": 5.0,
+    "feedback": "Response is too brief or generic for detailed rubric evaluation.",
+}
+
+# Responses made only of filler words ("N/A", "same as above", "to be
+# confirmed") are scored locally; short but substantive answers such as
+# "AACSB and EQUIS accredited" still go to Claude
+_FILLER_WORDS = frozenset(
+    "a above all an and answer any applicable are as at be below by confirmed "
+    "do does done for has have in is it n na nil no none not of on or other "
+    "previous refer same see so tba tbc tbd the this to we yes".split()
+)
+_WORD_RE = re.compile(r"\w+")
+
+
+def _response_text(value: dict | str) -> str:
+    return value.get("text", "") or value.get("value", "") if isinstance(value, dict) else str(value)
+
+
+def _trivial_score(text_value: str) -> dict | None:
+    """Score a clearly non-substantive response without Claude, else None."""
+    if len(text_value.strip()) < 10:
+        return dict(_TOO_SHORT)
+    words = set(_WORD_RE.findall(text_value.lower()))
+    if words <= _FILLER_WORDS:
+        return dict(_TOO_GENERIC)
+    return None
+
+
+def _item_block(item: AssessmentItem, text_value: str) -> str:
+    # Theme name left empty; could be populated from the theme relationship
+    return (
+        f"{_ITEM_HEAD}{item.label}{_ITEM_AFTER_LABEL}{item.code}{_ITEM_AFTER_CODE}"
+        f"{_ITEM_AFTER_THEME}{text_value[:_MAX_RESPONSE_CHARS]}{_ITEM_TAIL}"
+    )
+
+
+def _build_score(scores: dict) -> dict:
+    """Turn Claude's per-dimension JSON into the scorer result dict."""
+    total = scores.get("total_score", 0)
+    if total == 0:
+        total = sum(
+            scores.get(d, 0)
+            for d in ["relevance", "specificity", "evidence", "comprehensiveness"]
+        )
+
+    feedback_parts = []
+    if scores.get("strengths"):
+        feedback_parts.append(f"Strengths: {'; '.join(scores['strengths'])}")
+    if scores.get("weaknesses"):
+        feedback_parts.append(f"Areas for improvement: {'; '.join(scores['weaknesses'])}")
+    if scores.get("feedback"):
+        feedback_parts.append(scores["feedback"])
+
+    return {
+        "score": float(min(100, max(0, total))),
+        "feedback": " | ".join(feedback_parts) if feedback_parts else f"Score: {total}/100",
+        "dimensions": {
+            "relevance": scores.get("relevance"),
+            "specificity": scores.get("specificity"),
+            "evidence": scores.get("evidence"),
+            "comprehensiveness": scores.get("comprehensiveness"),
+        },
+    }
+
 
 async def score_text(
     value: dict | None,
     rubric: dict | None,
     item: AssessmentItem,
+    tenant_id: uuid.UUID | None = None,
 ) -> dict | None:
     """Score a free-text response using Claude API rubric evaluation.
 
     Evaluates against 4 dimensions: relevance, specificity, evidence, comprehensiveness.
-    Each dimension scored 0-25, total 0-100.
+    Each dimension scored 0-25, total 0-100. The score cache is only consulted
+    when ``tenant_id`` is given, as cached evaluations are per tenant.
     """
     if value is None:
         return None
 
-    text_value = value.get("text", "") or value.get("value", "") if isinstance(value, dict) else str(value)
-    if not text_value or len(text_value.strip()) < 10:
-        return {
-            "score": 0.0,
-            "feedback": "Response is too short or empty to evaluate.",
-        }
+    text_value = _response_text(value)
+    trivial = _trivial_score(text_value)
+    if trivial is not None:
+        return trivial
 
-    # Build prompt
-    prompt = SCORE_TEXT_RESPONSE_TEMPLATE.format(
-        item_label=item.label,
-        item_code=item.code,
-        theme_name="",  # Could be populated from theme relationship
-        response_text=text_value[:3000],  # Limit to 3000 chars
-    )
+    if tenant_id is None:
+        return await _score_one(item, text_value)
+
+    # A near-duplicate response to the same item reuses its evaluation
+    texts = [text_value[:_MAX_RESPONSE_CHARS]]
+    vectors = await asyncio.to_thread(embed, texts)
+    cached = (await get_cached_scores(tenant_id, [item], texts, vectors))[0]
+    if cached is not None:
+        return cached
+
+    result = await _score_one(item, text_value)
+    await cache_scores(tenant_id, [item], texts, vectors, [result])
+    return result
+
+
+async def _score_one(item: AssessmentItem, text_value: str) -> dict:
+    """Evaluate a single response with its own Claude request."""
+    prompt = _item_block(item, text_value)
 
     try:
-        result = call_claude(
+        result = await call_claude_async(
             messages=[{"role": "user", "content": prompt}],
-            system=SCORE_TEXT_RESPONSE_SYSTEM,
+            system=_SYSTEM_BLOCK,
             temperature=0.0,
             max_tokens=1000,
         )
 
-        # Parse JSON response
-        content = result["content"]
-        # Try to extract JSON from the response
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0]
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0]
-
-        scores = json.loads(content.strip())
-
-        total = scores.get("total_score", 0)
-        if total == 0:
-            total = sum(
-                scores.get(d, 0)
-                for d in ["relevance", "specificity", "evidence", "comprehensiveness"]
-            )
-
-        feedback_parts = []
-        if scores.get("strengths"):
-            feedback_parts.append(f"Strengths: {'; '.join(scores['strengths'])}")
-        if scores.get("weaknesses"):
-            feedback_parts.append(f"Areas for improvement: {'; '.join(scores['weaknesses'])}")
-        if scores.get("feedback"):
-            feedback_parts.append(scores["feedback"])
-
-        return {
-            "score": float(min(100, max(0, total))),
-            "feedback": " | ".join(feedback_parts) if feedback_parts else f"Score: {total}/100",
-            "dimensions": {
-                "relevance": scores.get("relevance"),
-                "specificity": scores.get("specificity"),
-                "evidence": scores.get("evidence"),
-                "comprehensiveness": scores.get("comprehensiveness"),
-            },
-        }
+        # Parse JSON response, unwrapping any code fence
+        scores = extract_json(result["content"])
+        return _build_score(scores)
     except Exception as e:
         return {
             "score": None,
             "feedback": f"Scoring error: {str(e)}",
         }
+
+
+def _chunk_request(chunk: list[tuple[int, AssessmentItem, str]]) -> dict:
+    """Claude request arguments for scoring several responses in one prompt."""
+    prompt = SCORE_TEXT_BATCH_TEMPLATE.substitute(
+        count=len(chunk),
+        entries="\n\n".join(
+            f"### Entry {n}\n{_item_block(item, text_value)}" for n, item, text_value in chunk
+        ),
+    )
+    return {
+        "messages": [{"role": "user", "content": prompt}],
+        "system": _SYSTEM_BLOCK,
+        "temperature": 0.0,
+        "max_tokens": _BATCH_TOKENS_PER_ITEM * len(chunk),
+    }
+
+
+def _parse_chunk(chunk: list[tuple[int, AssessmentItem, str]], content: str) -> dict[int, dict]:
+    """Parse a batched reply into results keyed by entry number.
+
+    Entries missing from (or unparseable in) the reply are simply absent.
+    """
+    wanted = {n for n, _item, _text in chunk}
+    scored = {}
+    try:
+        for scores in extract_json(content):
+            if isinstance(scores, dict) and scores.get("entry") in wanted:
+                scored[scores["entry"]] = _build_score(scores)
+    except Exception:
+        pass
+    return scored
+
+
+async def _score_chunk(chunk: list[tuple[int, AssessmentItem, str]]) -> dict[int, dict]:
+    """Score several responses in one request; returns results keyed by entry number."""
+    try:
+        result = await call_claude_async(**_chunk_request(chunk))
+    except Exception:
+        return {}
+    return _parse_chunk(chunk, result["content"])
+
+
+async def _score_chunks_in_message_batch(
+    chunks: list[list[tuple[int, AssessmentItem, str]]],
+) -> list[dict[int, dict]]:
+    """Score every chunk through one Message Batch; a failed batch scores nothing."""
+    try:
+        replies = await call_claude_batch_async(
+            {str(i): _chunk_request(chunk) for i, chunk in enumerate(chunks)}
+        )
+    except Exception:
+        return [{} for _chunk in chunks]
+    return [
+        _parse_chunk(chunk, replies[str(i)]["content"]) if str(i) in replies else {}
+        for i, chunk in enumerate(chunks)
+    ]
+
+
+async def score_text_batch(
+    entries: list[tuple[AssessmentItem, dict | None]],
+    tenant_id: uuid.UUID,
+    use_message_batches: bool = False,
+) -> list[dict | None]:
+    """Score many free-text responses with as few Claude requests as possible.
+
+    Near-duplicates of responses already scored for ``tenant_id`` come from the
+    score cache. The rest are sent ``_BATCH_SIZE`` at a time in a single prompt;
+    any entry the batched reply does not cover is rescored with its own request.
+
+    With ``use_message_batches`` the batched prompts go through the Message
+    Batches API at half price; only suitable for background jobs.
+
+    Returns:
+        One result per entry, in order, shaped like ``score_text`` results.
+    """
+    results: list[dict | None] = [None] * len(entries)
+    to_score = []
+    for n, (item, value) in enumerate(entries):
+        if value is None:
+            continue
+        text_value = _response_text(value)
+        results[n] = _trivial_score(text_value)
+        if results[n] is None:
+            to_score.append((n, item, text_value))
+
+    # Near-duplicates of previously scored responses skip Claude entirely
+    texts = [text_value[:_MAX_RESPONSE_CHARS] for _n, _item, text_value in to_score]
+    vectors = await asyncio.to_thread(embed, texts)
+    cached = await get_cached_scores(
+        tenant_id, [item for _n, item, _text in to_score], texts, vectors
+    )
+    miss_rows = [row for row, hit in enumerate(cached) if hit is None]
+    for (n, _item, _text), hit in zip(to_score, cached):
+        results[n] = hit
+    misses = [to_score[row] for row in miss_rows]
+
+    slots = asyncio.Semaphore(settings.claude_max_concurrency)
+
+    async def _bounded(coro):
+        async with slots:
+            return await coro
+
+    chunks = [misses[i:i + _BATCH_SIZE] for i in range(0, len(misses), _BATCH_SIZE)]
+    if use_message_batches and chunks:
+        chunk_results = await _score_chunks_in_message_batch(chunks)
+    else:
+        chunk_results = await asyncio.gather(*(_bounded(_score_chunk(chunk)) for chunk in chunks))
+    for scored in chunk_results:
+        for n, result in scored.items():
+            results[n] = result
+
+    missing = [(n, item, text_value) for n, item, text_value in misses if results[n] is None]
+    fallbacks = await asyncio.gather(*(
+        _bounded(_score_one(item, text_value)) for _n, item, text_value in missing
+    ))
+    for (n, _item, _text), result in zip(missing, fallbacks):
+        results[n] = result
+
+    await cache_scores(
+        tenant_id,
+        [item for _n, item, _text in misses],
+        [texts[row] for row in miss_rows],
+        vectors[miss_rows],
+        [results[n] for n, _item, _text in misses],
+    )
+    return results
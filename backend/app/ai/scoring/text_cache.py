@@ -0,0 +1,153 @@
+"""Near-duplicate cache for free-text rubric scores.
+
+Responses are embedded as hashed character n-gram vectors and stored in Redis
+per tenant, item, rubric, and the numbers and negations the response
+contains. A new response of similar length whose cosine similarity to a cached
+one reaches ``settings.text_score_cache_similarity`` reuses that evaluation
+instead of another Claude call.
+"""
+
+import hashlib
+import re
+import uuid
+
+import numpy as np
+import orjson
+import redis
+import structlog
+from sklearn.feature_extraction.text import HashingVectorizer
+
+from app.config import settings
+from app.models.assessment import AssessmentItem
+from app.services.cache_service import get_async_redis
+
+logger = structlog.get_logger()
+
+_CACHE_PREFIX = "text_score_cache:"
+_CACHE_TTL = 30 * 24 * 3600  # 30 days in seconds
+_MAX_ENTRIES = 256  # per namespace, newest first
+
+# Character n-grams barely tell "12 partners" from "21 partners", so only
+# responses quoting exactly the same figures may share an evaluation
+_NUMBER_RE = re.compile(r"\d+(?:[.,]\d+)*")
+
+# Nor do they tell "full access" from "no access": responses must also use
+# the same negations, and be of similar length, to share an evaluation
+_NEGATION_RE = re.compile(r"\b(?:no|not|none|never|without|nor|neither|cannot)\b|n't\b")
+_MIN_LENGTH_RATIO = 0.8
+
+# Each entry is the float16 vector, the response length as a uint32, then
+# the JSON result
+_DIM = 1024
+_VEC_BYTES = _DIM * 2
+_HEAD_BYTES = _VEC_BYTES + 4
+
+# Stateless, so one instance serves every thread; rows come out unit length
+# so a dot product is the cosine similarity
+_vectorizer = HashingVectorizer(
+    analyzer="char_wb",
+    ngram_range=(3, 5),
+    n_features=_DIM,
+    alternate_sign=False,
+    norm="l2",
+)
+
+
+def embed(texts: list[str]) -> np.ndarray:
+    """Embed response texts as unit-length float16 rows (CPU-bound)."""
+    if not texts:
+        return np.empty((0, _DIM), dtype=np.float16)
+    return _vectorizer.transform(texts).toarray().astype(np.float16)
+
+
+def _namespace(tenant_id: uuid.UUID, item: AssessmentItem, text: str) -> str:
+    """Cache key for a response.
+
+    Evaluations are never shared across tenants, and changing the item's label
+    or rubric, or the figures or negations the response uses, starts a fresh one.
+    """
+    prompt_inputs = orjson.dumps(
+        {
+            "label": item.label,
+            "rubric": item.scoring_rubric,
+            "numbers": _NUMBER_RE.findall(text),
+            "negations": sorted(set(_NEGATION_RE.findall(text.lower()))),
+        },
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+    )
+    digest = hashlib.sha256(prompt_inputs).hexdigest()
+    return f"{_CACHE_PREFIX}{tenant_id}:{item.code}:{digest}"
+
+
+async def get_cached_scores(
+    tenant_id: uuid.UUID,
+    items: list[AssessmentItem],
+    texts: list[str],
+    vectors: np.ndarray,
+) -> list[dict | None]:
+    """Return a cached score for each response that has a near-duplicate, else None."""
+    if not items:
+        return []
+    keys = [_namespace(tenant_id, item, text) for item, text in zip(items, texts)]
+    unique = list(dict.fromkeys(keys))
+    try:
+        async with get_async_redis().pipeline(transaction=False) as pipe:
+            for key in unique:
+                pipe.lrange(key, 0, -1)
+            entries = dict(zip(unique, await pipe.execute()))
+    except redis.RedisError as e:
+        logger.warning("text_score_cache_unavailable", error=str(e))
+        return [None] * len(items)
+
+    threshold = settings.text_score_cache_similarity
+    matrices: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+    hits: list[dict | None] = []
+    for key, text, vector in zip(keys, texts, vectors):
+        cached = entries[key]
+        if not cached:
+            hits.append(None)
+            continue
+        if key not in matrices:
+            packed = b"".join(entry[:_VEC_BYTES] for entry in cached)
+            lengths = b"".join(entry[_VEC_BYTES:_HEAD_BYTES] for entry in cached)
+            matrices[key] = (
+                np.frombuffer(packed, dtype=np.float16).reshape(-1, _DIM),
+                np.frombuffer(lengths, dtype=np.uint32),
+            )
+        matrix, lengths = matrices[key]
+        similarity = matrix.astype(np.float32) @ vector.astype(np.float32)
+        length_ratio = np.minimum(lengths, len(text)) / np.maximum(lengths, max(len(text), 1))
+        similarity[length_ratio < _MIN_LENGTH_RATIO] = -1.0
+        best = int(similarity.argmax())
+        if similarity[best] < threshold:
+            hits.append(None)
+            continue
+        result = orjson.loads(cached[best][_HEAD_BYTES:])
+        result["feedback"] = f"{result['feedback']} (cached)"
+        hits.append(result)
+    return hits
+
+
+async def cache_scores(
+    tenant_id: uuid.UUID,
+    items: list[AssessmentItem],
+    texts: list[str],
+    vectors: np.ndarray,
+    results: list[dict | None],
+) -> None:
+    """Store successful evaluations so near-duplicate responses can reuse them."""
+    if not items:
+        return
+    try:
+        async with get_async_redis().pipeline(transaction=False) as pipe:
+            for item, text, vector, result in zip(items, texts, vectors, results):
+                if not result or result.get("score") is None:
+                    continue  # never cache scoring errors
+                key = _namespace(tenant_id, item, text)
+                length = np.uint32(len(text)).tobytes()
+                pipe.lpush(key, vector.tobytes() + length + orjson.dumps(result))
+                pipe.ltrim(key, 0, _MAX_ENTRIES - 1)
+                pipe.expire(key, _CACHE_TTL)
+            await pipe.execute()
+    except redis.RedisError as e:
+        logger.warning("text_score_cache_unavailable", error=str(e))
@@ -1,8 +1,47 @@
 """Time-series item scorer for multi-year trend data."""
 
+import re
+
 from app.models.assessment import AssessmentItem
 from app.services.calculation_service import calculate_trend
 
+_NUMBER = (int, float)
+_LEADING_YEAR = re.compile(r"\s*(\d{4})")
+
+
+def _year_order(label) -> tuple:
+    """Sort key for a year label.
+
+    Labels starting with a 4-digit year ("2021", 2021, "2021-22") sort on it;
+    any other label ("Year 1") sorts after them, by its text.
+    """
+    text = str(label)
+    match = _LEADING_YEAR.match(text)
+    return (0, int(match.group(1)), text) if match else (1, 0, text)
+
+
+def _year_totals(years_data: list | dict) -> dict:
+    """Collapse either stored series format into ``{year label: total}`` in one pass.
+
+    List format: [{"year": 2023, "male": 298, "female": 262, ...}, ...]
+    Dict format: {"2021": {"male": 100, "female": 120}, ...} or {"2021": 500, ...}
+    Non-numeric fields are ignored; order the labels with ``_year_order``.
+    """
+    if isinstance(years_data, list):
+        return {
+            entry.get("year", 0): sum(
+                v for k, v in entry.items() if k != "year" and isinstance(v, _NUMBER)
+            )
+            for entry in years_data
+        }
+    totals = {}
+    for year, year_val in years_data.items():
+        if isinstance(year_val, dict):
+            totals[year] = sum(v for v in year_val.values() if isinstance(v, _NUMBER))
+        elif isinstance(year_val, _NUMBER):
+            totals[year] = year_val
+    return totals
+
 
 async def score_timeseries(
     value: dict | None,
@@ -24,25 +63,8 @@ async def score_timeseries(
     if not years_data:
         return None
 
-    # Extract totals per year
-    totals = []
-    if isinstance(years_data, list):
-        # List format: [{"year": 2023, "male": 298, "female": 262, ...}, ...]
-        for entry in sorted(years_data, key=lambda e: e.get("year", 0)):
-            total = sum(
-                v for k, v in entry.items()
-                if k != "year" and isinstance(v, (int, float))
-            )
-            totals.append(total)
-    else:
-        # Dict format: {"2021": {"male": 100, "female": 120}, ...}
-        for year in sorted(years_data.keys()):
-            year_val = years_data[year]
-            if isinstance(year_val, dict):
-                total = sum(v for v in year_val.values() if isinstance(v, (int, float)))
-                totals.append(total)
-            elif isinstance(year_val, (int, float)):
-                totals.append(year_val)
+    year_totals = _year_totals(years_data)
+    totals = [year_totals[year] for year in sorted(year_totals, key=_year_order)]
 
     if len(totals) < 2:
         return {"score": 50.0, "feedback": "Insufficient data points for trend analysis."}
@@ -3,15 +3,29 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from app.database import get_db
 from app.dependencies import require_role
 from app.models.assessment import Assessment
 from app.models.tenant import Tenant
 from app.models.user import User
+from app.schemas.tenant import TenantSummaryResponse
+from app.services.cache_service import get_cached_json, set_cached_json
 
 router = APIRouter(prefix="/admin")
 
+# Counts are served from Redis for a minute rather than rescanned per page load
+_PLATFORM_STATS_KEY = "platform_stats"
+_PLATFORM_STATS_TTL = 60
+
+# All three counts as scalar subqueries, returned in one row and round-trip
+_PLATFORM_STATS_STMT = select(
+    select(func.count(Tenant.id)).scalar_subquery().label("total_tenants"),
+    select(func.count(User.id)).scalar_subquery().label("total_users"),
+    select(func.count(Assessment.id)).scalar_subquery().label("total_assessments"),
+)
+
 
 @router.get("/stats")
 async def platform_stats(
@@ -19,34 +33,33 @@ async def platform_stats(
     db: AsyncSession = Depends(get_db),
 ):
     """Get platform-wide statistics (platform_admin only)."""
-    tenants_count = await db.execute(select(func.count(Tenant.id)))
-    users_count = await db.execute(select(func.count(User.id)))
-    assessments_count = await db.execute(select(func.count(Assessment.id)))
-
-    return {
-        "total_tenants": tenants_count.scalar(),
-        "total_users": users_count.scalar(),
-        "total_assessments": assessments_count.scalar(),
-    }
+    stats = await get_cached_json(_PLATFORM_STATS_KEY)
+    if stats is None:
+        result = await db.execute(_PLATFORM_STATS_STMT)
+        stats = dict(result.one()._mapping)
+        await set_cached_json(_PLATFORM_STATS_KEY, stats, _PLATFORM_STATS_TTL)
+    return stats
 
 
-@router.get("/tenants", response_model=list)
+@router.get("/tenants", response_model=list[TenantSummaryResponse])
 async def list_all_tenants(
     _user: User = Depends(require_role("platform_admin")),
     db: AsyncSession = Depends(get_db),
 ):
     """List all tenants (platform_admin only)."""
-    result = await db.execute(select(Tenant).order_by(Tenant.created_at.desc()))
-    tenants = result.scalars().all()
-    return [
-        {
-            "id": str(t.id),
-            "name": t.name,
-            "slug": t.slug,
-            "country": t.country,
-            "subscription_tier": t.subscription_tier,
-            "is_active": t.is_active,
-            "created_at": t.created_at.isoformat() if t.created_at else None,
-        }
-        for t in tenants
-    ]
+    result = await db.execute(
+        select(Tenant)
+        .options(
+            load_only(
+                Tenant.id,
+                Tenant.name,
+                Tenant.slug,
+                Tenant.country,
+                Tenant.subscription_tier,
+                Tenant.is_active,
+                Tenant.created_at,
+            )
+        )
+        .order_by(Tenant.created_at.desc())
+    )
+    return result.scalars().all()
@@ -2,7 +2,9 @@
 
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -28,6 +30,12 @@ from app.services.assessment_service import (
 
 router = APIRouter(prefix="/assessments")
 
+# Templates are seeded reference data with no write endpoints, so the
+# serialized list is kept for a few minutes instead of reloading the
+# template -> themes -> items graph and re-validating it on every request
+_templates_json: TTLCache = TTLCache(maxsize=1, ttl=300)
+_TEMPLATE_LIST = TypeAdapter(list[AssessmentTemplateResponse])
+
 
 # ---------------------------------------------------------------------------
 # Templates
@@ -39,12 +47,18 @@ async def list_templates(
     db: AsyncSession = Depends(get_db),
 ):
     """List all active assessment templates with their themes and items."""
-    result = await db.execute(
-        select(AssessmentTemplate)
-        .where(AssessmentTemplate.is_active.is_(True))
-        .options(selectinload(AssessmentTemplate.themes).selectinload(AssessmentTheme.items))
-    )
-    return result.scalars().unique().all()
+    content = _templates_json.get("active")
+    if content is None:
+        result = await db.execute(
+            select(AssessmentTemplate)
+            .where(AssessmentTemplate.is_active.is_(True))
+            .options(selectinload(AssessmentTemplate.themes).selectinload(AssessmentTheme.items))
+        )
+        templates = _TEMPLATE_LIST.validate_python(
+            result.scalars().unique().all(), from_attributes=True
+        )
+        content = _templates_json["active"] = _TEMPLATE_LIST.dump_json(templates)
+    return Response(content=content, media_type="application/json")
 
 
 @router.get("/templates/{template_id}", response_model=AssessmentTemplateResponse)
@@ -1,12 +1,19 @@
 """Authentication endpoints: login, register, refresh, logout, email verification, magic links."""
 
-from datetime import datetime, timedelta, timezone
-
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from jose import jwt, JWTError
-from passlib.context import CryptContext
-from sqlalchemy import select
+import base64
+import hashlib
+import hmac
+import time
+from datetime import datetime, timezone
+
+import jwt
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from jwt import PyJWTError
+from sqlalchemy import Select, exists, func, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from app.config import settings
 from app.database import get_db
@@ -22,8 +29,11 @@ from app.schemas.auth import (
     ResendVerificationRequest,
     TokenResponse,
 )
+from app.services.password_service import hash_password_async, verify_password_async
 from app.services.token_service import (
+    LOGIN_RATE_LIMIT_PER_EMAIL,
     check_rate_limit,
+    check_rate_limit_async,
     create_email_verification_token,
     create_magic_link_token,
     verify_email_token,
@@ -33,35 +43,78 @@ from app.workers.tasks import send_magic_link_email_task, send_verification_emai
 
 router = APIRouter(prefix="/auth")
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Columns the sign-in paths read; the rest of the row stays in the database
+_AUTH_USER_COLUMNS = load_only(
+    User.id,
+    User.tenant_id,
+    User.email,
+    User.password_hash,
+    User.full_name,
+    User.role,
+    User.is_active,
+    User.email_verified,
+    User.last_login,
+)
+
+
+def _user_by_email(email: str) -> Select:
+    """Select a user by email, case-insensitively (served by ix_users_email_lower)."""
+    return (
+        select(User)
+        .options(_AUTH_USER_COLUMNS)
+        .where(func.lower(User.email) == email.lower())
+    )
 
 
 # ---------------------------------------------------------------------------
 # Token helpers
 # ---------------------------------------------------------------------------
 
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# HMAC tokens are signed here with the header encoded and the key schedule
+# set up once; the result is a standard JWT that jwt.decode verifies. Any
+# other algorithm goes through PyJWT
+_HMAC_DIGESTS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+_JWT_HEADER = _b64url(orjson.dumps({"alg": settings.jwt_algorithm, "typ": "JWT"})) + b"."
+_JWT_MAC = (
+    hmac.new(settings.jwt_secret_key.encode(), digestmod=_HMAC_DIGESTS[settings.jwt_algorithm])
+    if settings.jwt_algorithm in _HMAC_DIGESTS
+    else None
+)
+
+
+def _encode_token(payload: dict) -> str:
+    if _JWT_MAC is None:
+        return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    signing_input = _JWT_HEADER + _b64url(orjson.dumps(payload))
+    mac = _JWT_MAC.copy()
+    mac.update(signing_input)
+    return (signing_input + b"." + _b64url(mac.digest())).decode()
+
+
 def _create_access_token(user: User) -> str:
     """Create a short-lived access token."""
-    expire = datetime.now(timezone.utc) + timedelta(minutes=settings.access_token_expire_minutes)
     payload = {
         "sub": str(user.id),
         "tenant_id": str(user.tenant_id),
         "role": user.role,
         "type": "access",
-        "exp": expire,
+        "exp": int(time.time()) + settings.access_token_expire_minutes * 60,
     }
-    return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    return _encode_token(payload)
 
 
 def _create_refresh_token(user: User) -> str:
     """Create a longer-lived refresh token."""
-    expire = datetime.now(timezone.utc) + timedelta(days=settings.refresh_token_expire_days)
     payload = {
         "sub": str(user.id),
         "type": "refresh",
-        "exp": expire,
+        "exp": int(time.time()) + settings.refresh_token_expire_days * 86400,
     }
-    return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    return _encode_token(payload)
 
 
 def _build_token_response(user: User) -> TokenResponse:
@@ -78,11 +131,21 @@ def _build_token_response(user: User) -> TokenResponse:
 
 @router.post("/login", response_model=TokenResponse)
 async def login(body: LoginRequest, db: AsyncSession = Depends(get_db)):
-    """Authenticate with email + password, return JWT token pair."""
-    result = await db.execute(select(User).where(User.email == body.email))
+    """Authenticate with email + password, return JWT token pair. Rate-limited."""
+    # Limited per email only: behind the frontend proxy every request shares
+    # one client address, so a per-IP bucket would be a global limit
+    if not await check_rate_limit_async("login", body.email.lower(), LOGIN_RATE_LIMIT_PER_EMAIL):
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests. Please try again later.",
+        )
+
+    result = await db.execute(_user_by_email(body.email))
     user = result.scalar_one_or_none()
 
-    if user is None or not pwd_context.verify(body.password, user.password_hash):
+    # Unknown emails still pay for a bcrypt check so timing doesn't reveal them
+    password_hash = user.password_hash if user is not None else None
+    if not await verify_password_async(body.password, password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
@@ -116,7 +179,7 @@ async def refresh(body: RefreshRequest, db: AsyncSession = Depends(get_db)):
             settings.jwt_secret_key,
             algorithms=[settings.jwt_algorithm],
         )
-    except JWTError:
+    except PyJWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired refresh token",
@@ -159,51 +222,63 @@ async def logout():
 
 
 @router.post("/register", response_model=MessageResponse)
-async def register(body: RegisterRequest, db: AsyncSession = Depends(get_db)):
+async def register(
+    body: RegisterRequest,
+    background: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+):
     """Register a new tenant and its first admin user.
 
     Creates both a Tenant record and the first User with the ``tenant_admin``
     role. Sends a verification email instead of returning tokens directly.
     """
-    # Check for duplicate email
-    existing_user = await db.execute(select(User).where(User.email == body.email))
-    if existing_user.scalar_one_or_none() is not None:
+    # Check for duplicate email and tenant slug in one round-trip
+    taken = (
+        await db.execute(
+            select(
+                exists().where(func.lower(User.email) == body.email.lower()).label("email"),
+                exists().where(Tenant.slug == body.tenant_slug).label("slug"),
+            )
+        )
+    ).one()
+    if taken.email:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Email already registered",
         )
-
-    # Check for duplicate tenant slug
-    existing_tenant = await db.execute(select(Tenant).where(Tenant.slug == body.tenant_slug))
-    if existing_tenant.scalar_one_or_none() is not None:
+    if taken.slug:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Tenant slug already taken",
         )
 
-    # Create tenant
+    # Create tenant and its admin user (email_verified defaults to false);
+    # the relationship lets one flush insert both in order
     tenant = Tenant(
         name=body.tenant_name,
         slug=body.tenant_slug,
         country=body.country,
     )
-    db.add(tenant)
-    await db.flush()  # populate tenant.id
-
-    # Create admin user (email_verified defaults to false)
     user = User(
-        tenant_id=tenant.id,
+        tenant=tenant,
         email=body.email,
-        password_hash=pwd_context.hash(body.password),
+        password_hash=await hash_password_async(body.password),
         full_name=body.full_name,
         role="tenant_admin",
     )
     db.add(user)
-    await db.flush()  # populate user.id
+    try:
+        await db.flush()  # populate user.id
+    except IntegrityError:
+        # A concurrent registration claimed the email or slug after the check
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Email or tenant slug already taken",
+        )
 
-    # Send verification email via Celery
+    # Send verification email via Celery, enqueued after the response is sent
     token = create_email_verification_token(str(user.id))
-    send_verification_email_task.delay(body.email, body.full_name, token)
+    background.add_task(send_verification_email_task.delay, body.email, body.full_name, token)
 
     return MessageResponse(
         message="Registration successful. Please check your email to verify your account."
@@ -243,6 +318,7 @@ async def verify_email(
 @router.post("/resend-verification", response_model=MessageResponse)
 async def resend_verification(
     body: ResendVerificationRequest,
+    background: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ):
     """Resend email verification link. Rate-limited to 3 per 60s per email."""
@@ -257,14 +333,14 @@ async def resend_verification(
             detail="Too many requests. Please try again later.",
         )
 
-    result = await db.execute(select(User).where(User.email == body.email))
+    result = await db.execute(_user_by_email(body.email))
     user = result.scalar_one_or_none()
 
     if user is None or user.email_verified:
         return success_msg
 
     token = create_email_verification_token(str(user.id))
-    send_verification_email_task.delay(user.email, user.full_name, token)
+    background.add_task(send_verification_email_task.delay, user.email, user.full_name, token)
 
     return success_msg
 
@@ -272,6 +348,7 @@ async def resend_verification(
 @router.post("/magic-link", response_model=MessageResponse)
 async def request_magic_link(
     body: MagicLinkRequest,
+    background: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ):
     """Send a magic link login email. Only for verified, active users. Rate-limited."""
@@ -286,7 +363,7 @@ async def request_magic_link(
             detail="Too many requests. Please try again later.",
         )
 
-    result = await db.execute(select(User).where(User.email == body.email))
+    result = await db.execute(_user_by_email(body.email))
     user = result.scalar_one_or_none()
 
     # Only send magic link if user exists, is active, and email is verified
@@ -294,7 +371,7 @@ async def request_magic_link(
         return success_msg
 
     token = create_magic_link_token(user.email)
-    send_magic_link_email_task.delay(user.email, token)
+    background.add_task(send_magic_link_email_task.delay, user.email, token)
 
     return success_msg
 
@@ -312,7 +389,7 @@ async def verify_magic_link(
             detail="Invalid or expired magic link",
         )
 
-    result = await db.execute(select(User).where(User.email == email))
+    result = await db.execute(_user_by_email(email))
     user = result.scalar_one_or_none()
 
     if user is None or not user.is_active or not user.email_verified:
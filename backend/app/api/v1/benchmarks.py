@@ -12,9 +12,14 @@ from app.models.assessment import Assessment
 from app.models.tenant import Tenant
 from app.schemas.benchmark import BenchmarkCompareResponse, BenchmarkMetric
 from app.services.benchmark_service import get_benchmark_comparison
+from app.services.cache_service import get_cached_json, set_cached_json
 
 router = APIRouter(prefix="/benchmarks")
 
+# Peer percentiles are refreshed yearly; the key includes the assessment's
+# updated_at, so rescoring it starts a fresh entry
+_COMPARE_TTL = 3600
+
 
 @router.get("/compare/{assessment_id}", response_model=BenchmarkCompareResponse)
 async def compare_assessment(
@@ -33,6 +38,13 @@ async def compare_assessment(
     if not assessment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Assessment not found")
 
+    cache_key = (
+        f"benchmark_compare:{assessment_id}:{assessment.updated_at.isoformat()}:{country or ''}"
+    )
+    cached = await get_cached_json(cache_key)
+    if cached is not None:
+        return cached
+
     comparisons = await get_benchmark_comparison(
         db,
         assessment_id=assessment_id,
@@ -54,8 +66,10 @@ async def compare_assessment(
         for c in comparisons
     ]
 
-    return BenchmarkCompareResponse(
+    comparison = BenchmarkCompareResponse(
         academic_year=assessment.academic_year,
         country=country,
         metrics=metrics,
     )
+    await set_cached_json(cache_key, comparison.model_dump(mode="json"), _COMPARE_TTL)
+    return comparison
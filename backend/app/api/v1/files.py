@@ -1,9 +1,10 @@
 """File upload and document intelligence endpoints."""
 
+import asyncio
+import os
 import uuid
 
-import boto3
-from botocore.config import Config as BotoConfig
+from boto3.s3.transfer import TransferConfig
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -16,19 +17,18 @@ from app.models.file_upload import FileUpload
 from app.models.tenant import Tenant
 from app.models.user import User
 from app.schemas.file import FileUploadResponse
+from app.services.storage_service import get_s3_client
 
 router = APIRouter(prefix="/assessments/{assessment_id}/files")
 
-
-def _get_s3_client():
-    return boto3.client(
-        "s3",
-        endpoint_url=settings.s3_endpoint_url,
-        aws_access_key_id=settings.s3_access_key,
-        aws_secret_access_key=settings.s3_secret_key,
-        region_name=settings.s3_region,
-        config=BotoConfig(signature_version="s3v4"),
-    )
+# Uploads are streamed to S3 from the spooled request body; files above the
+# threshold go up in parts of the same size, four at a time
+_UPLOAD_PART_BYTES = 8 * 1024 * 1024
+_UPLOAD_TRANSFER = TransferConfig(
+    multipart_threshold=_UPLOAD_PART_BYTES,
+    multipart_chunksize=_UPLOAD_PART_BYTES,
+    max_concurrency=4,
+)
 
 
 @router.post("", response_model=FileUploadResponse, status_code=status.HTTP_201_CREATED)
@@ -54,14 +54,17 @@ async def upload_file(
     file_id = uuid.uuid4()
     storage_key = f"{tenant.id}/{assessment_id}/{file_id}/{file.filename}"
 
-    # Upload to S3/MinIO
-    s3 = _get_s3_client()
-    content = await file.read()
-    s3.put_object(
-        Bucket=settings.s3_bucket_name,
-        Key=storage_key,
-        Body=content,
-        ContentType=file.content_type or "application/octet-stream",
+    # Stream to S3/MinIO off the event loop, never reading the whole file
+    content_type = file.content_type or "application/octet-stream"
+    file_size = file.file.seek(0, os.SEEK_END)
+    file.file.seek(0)
+    await asyncio.to_thread(
+        get_s3_client().upload_fileobj,
+        file.file,
+        settings.s3_bucket_name,
+        storage_key,
+        ExtraArgs={"ContentType": content_type},
+        Config=_UPLOAD_TRANSFER,
     )
 
     # Create database record
@@ -71,8 +74,8 @@ async def upload_file(
         response_id=response_id,
         original_filename=file.filename or "unknown",
         storage_key=storage_key,
-        content_type=file.content_type or "application/octet-stream",
-        file_size=len(content),
+        content_type=content_type,
+        file_size=file_size,
     )
     db.add(upload)
     await db.flush()
@@ -139,8 +142,8 @@ async def download_file(
     if not upload:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
 
-    s3 = _get_s3_client()
-    url = s3.generate_presigned_url(
+    # Presigning is local HMAC work with no network call, so it stays inline
+    url = get_s3_client().generate_presigned_url(
         "get_object",
         Params={"Bucket": settings.s3_bucket_name, "Key": upload.storage_key},
         ExpiresIn=3600,
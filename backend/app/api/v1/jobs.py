@@ -1,8 +1,12 @@
-"""AI job status endpoints for polling background task progress."""
+"""AI job status endpoints for polling or streaming background task progress."""
 
 import uuid
+from collections.abc import AsyncIterator
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from redis.asyncio.client import PubSub
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -12,17 +16,18 @@ from app.models.ai_job import AIJob
 from app.models.assessment import Assessment
 from app.models.user import User
 from app.schemas.ai_job import AIJobResponse
+from app.services.cache_service import get_async_redis, job_events_channel
 
 router = APIRouter(prefix="/jobs")
 
+_FINISHED = ("completed", "failed")
 
-@router.get("/{job_id}", response_model=AIJobResponse)
-async def get_job_status(
-    job_id: uuid.UUID,
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
-):
-    """Get the status of an AI background job."""
+# A comment line is sent when a job is quiet for this long, so proxies keep
+# the stream open
+_KEEPALIVE_SECONDS = 15.0
+
+
+async def _get_job_or_404(db: AsyncSession, job_id: uuid.UUID, user: User) -> AIJob:
     result = await db.execute(
         select(AIJob)
         .join(Assessment, AIJob.assessment_id == Assessment.id)
@@ -32,3 +37,59 @@ async def get_job_status(
     if not job:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
     return job
+
+
+@router.get("/{job_id}", response_model=AIJobResponse)
+async def get_job_status(
+    job_id: uuid.UUID,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get the status of an AI background job."""
+    return await _get_job_or_404(db, job_id, user)
+
+
+async def _job_events(pubsub: PubSub, initial: bytes, finished: bool) -> AsyncIterator[bytes]:
+    try:
+        yield b"data: " + initial + b"\n\n"
+        while not finished:
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=_KEEPALIVE_SECONDS
+            )
+            if message is None:
+                yield b": keepalive\n\n"
+                continue
+            yield b"data: " + message["data"] + b"\n\n"
+            finished = orjson.loads(message["data"])["status"] in _FINISHED
+    finally:
+        await pubsub.aclose()
+
+
+@router.get("/{job_id}/events")
+async def stream_job_status(
+    job_id: uuid.UUID,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Stream an AI job's state as server-sent events until it finishes.
+
+    The first event is the current row; later ones are pushed by the worker
+    on every status change, so clients need not poll ``GET /jobs/{id}``.
+    """
+    # Subscribe before reading the row so no change can fall in between
+    pubsub = get_async_redis().pubsub()
+    await pubsub.subscribe(job_events_channel(job_id))
+    try:
+        job = await _get_job_or_404(db, job_id, user)
+    except HTTPException:
+        await pubsub.aclose()
+        raise
+    initial = orjson.dumps(AIJobResponse.model_validate(job).model_dump(mode="json"))
+    # The stream may stay open for minutes; don't hold a pooled connection
+    await db.close()
+
+    return StreamingResponse(
+        _job_events(pubsub, initial, job.status in _FINISHED),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
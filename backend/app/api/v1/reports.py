@@ -1,13 +1,16 @@
 """Report generation and retrieval endpoints."""
 
+import asyncio
 import logging
+import os
+import tempfile
 import uuid
+from datetime import datetime, timezone
 
-import boto3
-from botocore.config import Config as BotoConfig
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import Response
-from sqlalchemy import select
+from fastapi.responses import FileResponse, RedirectResponse, StreamingResponse
+from starlette.background import BackgroundTask
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
@@ -20,13 +23,29 @@ from app.models.tenant import Tenant
 from app.models.user import User
 from app.schemas.report import ReportResponse
 from app.schemas.ai_job import AIJobResponse
+from app.services.cache_service import (
+    delete_cached,
+    get_cached_json,
+    report_cache_key,
+    set_cached_json,
+)
 from app.services.report_service import get_report
-from app.ai.reports.pdf_renderer import render_report_pdf
+from app.services.storage_service import get_s3_client
+from app.ai.reports.pdf_renderer import render_report_pdf_async
+from app.workers.tasks import ACTIVE_JOB_STATUSES, STALE_JOB_AGE
 
 log = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/assessments/{assessment_id}/report")
 
+# Reports only change when a generation job finishes or a PDF is cached,
+# both of which drop the entry
+_REPORT_TTL = 60
+
+# Lifetime of a presigned PDF link, and the size of chunks streamed from S3
+_PDF_URL_EXPIRES = 300
+_PDF_CHUNK_BYTES = 1024 * 1024
+
 
 @router.get("", response_model=ReportResponse)
 async def get_assessment_report(
@@ -35,10 +54,17 @@ async def get_assessment_report(
     db: AsyncSession = Depends(get_db),
 ):
     """Get the latest report for an assessment."""
+    cache_key = report_cache_key(tenant.id, assessment_id)
+    cached = await get_cached_json(cache_key)
+    if cached is not None:
+        return cached
+
     report = await get_report(db, assessment_id, tenant.id)
     if not report:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report not found")
-    return report
+    response = ReportResponse.model_validate(report)
+    await set_cached_json(cache_key, response.model_dump(mode="json"), _REPORT_TTL)
+    return response
 
 
 @router.post("/generate", response_model=AIJobResponse, status_code=status.HTTP_202_ACCEPTED)
@@ -89,13 +115,12 @@ async def get_active_report_job(
     _user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """Check if there's an active (queued/in_progress) report generation job.
+    """Check if there's an active (queued/processing) report generation job.
 
-    Jobs older than 10 minutes are considered stale and auto-failed.
+    Jobs older than ``STALE_JOB_AGE`` are ignored; the ``sweep_stale_jobs``
+    beat task marks them failed.
     """
-    from datetime import datetime, timezone, timedelta
-
-    stale_cutoff = datetime.now(timezone.utc) - timedelta(minutes=10)
+    stale_cutoff = datetime.now(timezone.utc) - STALE_JOB_AGE
 
     result = await db.execute(
         select(AIJob)
@@ -103,7 +128,8 @@ async def get_active_report_job(
         .where(
             AIJob.assessment_id == assessment_id,
             AIJob.job_type == "report_generation",
-            AIJob.status.in_(("queued", "in_progress")),
+            AIJob.status.in_(ACTIVE_JOB_STATUSES),
+            AIJob.created_at >= stale_cutoff,
             Assessment.tenant_id == tenant.id,
         )
         .order_by(AIJob.created_at.desc())
@@ -112,15 +138,6 @@ async def get_active_report_job(
     job = result.scalar_one_or_none()
     if not job:
         return None
-
-    # Auto-fail stale jobs
-    if job.created_at < stale_cutoff:
-        job.status = "failed"
-        job.error_message = "Job timed out"
-        job.completed_at = datetime.now(timezone.utc)
-        await db.commit()
-        return None
-
     return AIJobResponse.model_validate(job)
 
 
@@ -137,85 +154,113 @@ async def download_report_pdf(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Report not found"
         )
+    filename = f"TNE-Report-{assessment_id}-v{report.version}.pdf"
+    disposition = f'attachment; filename="{filename}"'
 
-    s3 = boto3.client(
-        "s3",
-        endpoint_url=settings.s3_endpoint_url,
-        aws_access_key_id=settings.s3_access_key,
-        aws_secret_access_key=settings.s3_secret_key,
-        region_name=settings.s3_region,
-        config=BotoConfig(signature_version="s3v4"),
-    )
-
-    # Try to fetch existing PDF from S3
-    pdf_bytes: bytes | None = None
+    # A cached PDF is served from S3: by redirect to a short-lived presigned
+    # URL when S3 is reachable from browsers, otherwise streamed through in
+    # chunks (never read into memory whole)
     if report.pdf_storage_key:
+        if settings.report_pdf_presigned_redirect:
+            url = get_s3_client().generate_presigned_url(
+                "get_object",
+                Params={
+                    "Bucket": settings.s3_bucket_name,
+                    "Key": report.pdf_storage_key,
+                    "ResponseContentDisposition": disposition,
+                },
+                ExpiresIn=_PDF_URL_EXPIRES,
+            )
+            return RedirectResponse(url, status_code=status.HTTP_302_FOUND)
         try:
-            obj = s3.get_object(
+            obj = await asyncio.to_thread(
+                get_s3_client().get_object,
                 Bucket=settings.s3_bucket_name,
                 Key=report.pdf_storage_key,
             )
-            pdf_bytes = obj["Body"].read()
         except Exception:
             log.warning("Failed to fetch cached PDF, regenerating")
+        else:
+            return StreamingResponse(
+                obj["Body"].iter_chunks(_PDF_CHUNK_BYTES),
+                media_type="application/pdf",
+                headers={
+                    "Content-Disposition": disposition,
+                    "Content-Length": str(obj["ContentLength"]),
+                },
+            )
 
     # Generate PDF on-the-fly if not cached
-    if pdf_bytes is None:
-        log.info("Generating PDF on-the-fly for report %s", report.id)
-
-        result = await db.execute(
-            select(Assessment).where(Assessment.id == assessment_id)
-        )
-        assessment = result.scalar_one()
-
-        scores_result = await db.execute(
-            select(ThemeScore).where(ThemeScore.assessment_id == assessment_id)
-        )
-        theme_scores = scores_result.scalars().all()
-
-        themes_result = await db.execute(
-            select(AssessmentTheme).where(
-                AssessmentTheme.template_id == assessment.template_id
+    log.info("Generating PDF on-the-fly for report %s", report.id)
+
+    # The assessment's fields and its named theme scores in one query;
+    # outer joins keep the assessment row when nothing is scored yet
+    rows = (
+        await db.execute(
+            select(
+                Assessment.academic_year,
+                Assessment.overall_score,
+                AssessmentTheme.name,
+                ThemeScore.normalised_score,
+            )
+            .outerjoin(ThemeScore, ThemeScore.assessment_id == Assessment.id)
+            .outerjoin(
+                AssessmentTheme,
+                and_(
+                    AssessmentTheme.id == ThemeScore.theme_id,
+                    AssessmentTheme.template_id == Assessment.template_id,
+                ),
             )
+            .where(Assessment.id == assessment_id)
         )
-        themes_by_id = {t.id: t for t in themes_result.scalars().all()}
-
-        pdf_theme_scores = [
-            {"name": themes_by_id[ts.theme_id].name, "score": ts.normalised_score}
-            for ts in theme_scores
-            if ts.theme_id in themes_by_id
-        ]
-
-        pdf_bytes = render_report_pdf(
+    ).all()
+    academic_year, overall_score = rows[0].academic_year, rows[0].overall_score
+
+    pdf_theme_scores = [
+        {"name": row.name, "score": row.normalised_score}
+        for row in rows
+        if row.name is not None
+    ]
+
+    # Render straight into a temp file that is uploaded and then streamed
+    # back, so the PDF is never held in memory here
+    fd, pdf_path = tempfile.mkstemp(suffix=".pdf")
+    os.close(fd)
+    try:
+        await render_report_pdf_async(
             report=report,
             institution_name=tenant.name,
-            academic_year=assessment.academic_year,
-            overall_score=assessment.overall_score,
+            academic_year=academic_year,
+            overall_score=overall_score,
             theme_scores=pdf_theme_scores,
+            target=pdf_path,
         )
-
-        # Cache in S3 for future requests
-        storage_key = (
-            f"reports/{tenant.id}/{assessment_id}/"
-            f"report-v{report.version}.pdf"
+    except Exception:
+        os.unlink(pdf_path)
+        raise
+
+    # Cache in S3 for future requests
+    storage_key = (
+        f"reports/{tenant.id}/{assessment_id}/"
+        f"report-v{report.version}.pdf"
+    )
+    try:
+        await asyncio.to_thread(
+            get_s3_client().upload_file,
+            pdf_path,
+            settings.s3_bucket_name,
+            storage_key,
+            ExtraArgs={"ContentType": "application/pdf"},
         )
-        try:
-            s3.put_object(
-                Bucket=settings.s3_bucket_name,
-                Key=storage_key,
-                Body=pdf_bytes,
-                ContentType="application/pdf",
-            )
-            report.pdf_storage_key = storage_key
-            await db.commit()
-        except Exception:
-            log.exception("Failed to cache PDF in S3")
+        report.pdf_storage_key = storage_key
+        await db.commit()
+        await delete_cached(report_cache_key(tenant.id, assessment_id))
+    except Exception:
+        log.exception("Failed to cache PDF in S3")
 
-    filename = f"TNE-Report-{assessment_id}-v{report.version}.pdf"
-    return Response(
-        content=pdf_bytes,
+    return FileResponse(
+        pdf_path,
         media_type="application/pdf",
-        headers={
-            "Content-Disposition": f'attachment; filename="{filename}"',
-        },
+        filename=filename,
+        background=BackgroundTask(os.unlink, pdf_path),
     )
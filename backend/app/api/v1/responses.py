@@ -3,7 +3,8 @@
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
@@ -17,15 +18,7 @@ from app.services.calculation_service import run_auto_calculations
 router = APIRouter(prefix="/assessments/{assessment_id}/responses")
 
 
-async def _get_assessment_or_404(
-    db: AsyncSession, assessment_id: uuid.UUID, tenant_id: uuid.UUID
-) -> Assessment:
-    result = await db.execute(
-        select(Assessment).where(
-            Assessment.id == assessment_id, Assessment.tenant_id == tenant_id
-        )
-    )
-    assessment = result.scalar_one_or_none()
+def _check_editable(assessment: Assessment | None) -> Assessment:
     if not assessment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Assessment not found")
     if assessment.status not in ("draft", "under_review"):
@@ -36,6 +29,17 @@ async def _get_assessment_or_404(
     return assessment
 
 
+async def _get_assessment_or_404(
+    db: AsyncSession, assessment_id: uuid.UUID, tenant_id: uuid.UUID
+) -> Assessment:
+    result = await db.execute(
+        select(Assessment).where(
+            Assessment.id == assessment_id, Assessment.tenant_id == tenant_id
+        )
+    )
+    return _check_editable(result.scalar_one_or_none())
+
+
 @router.get("", response_model=list[ResponseOut])
 async def list_responses(
     assessment_id: uuid.UUID,
@@ -43,19 +47,18 @@ async def list_responses(
     db: AsyncSession = Depends(get_db),
 ):
     """Get all responses for an assessment."""
-    # Verify tenant owns this assessment
+    # Ownership check and responses in one query: no rows means the tenant
+    # has no such assessment, a NULL response means it has no answers yet
     result = await db.execute(
-        select(Assessment).where(
-            Assessment.id == assessment_id, Assessment.tenant_id == tenant.id
-        )
+        select(AssessmentResponse)
+        .select_from(Assessment)
+        .outerjoin(AssessmentResponse, AssessmentResponse.assessment_id == Assessment.id)
+        .where(Assessment.id == assessment_id, Assessment.tenant_id == tenant.id)
     )
-    if not result.scalar_one_or_none():
+    responses = result.scalars().all()
+    if not responses:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Assessment not found")
-
-    responses = await db.execute(
-        select(AssessmentResponse).where(AssessmentResponse.assessment_id == assessment_id)
-    )
-    return responses.scalars().all()
+    return [response for response in responses if response is not None]
 
 
 @router.put("/{item_id}", response_model=ResponseOut)
@@ -68,11 +71,16 @@ async def save_response(
     db: AsyncSession = Depends(get_db),
 ):
     """Save or update a single response (auto-save endpoint)."""
-    assessment = await _get_assessment_or_404(db, assessment_id, tenant.id)
-
-    # Verify item exists
-    item_result = await db.execute(select(AssessmentItem).where(AssessmentItem.id == item_id))
-    item = item_result.scalar_one_or_none()
+    # Assessment (owned by the tenant) and item in one round-trip
+    row = (
+        await db.execute(
+            select(Assessment, AssessmentItem)
+            .outerjoin(AssessmentItem, AssessmentItem.id == item_id)
+            .where(Assessment.id == assessment_id, Assessment.tenant_id == tenant.id)
+        )
+    ).one_or_none()
+    assessment = _check_editable(row and row.Assessment)
+    item = row.AssessmentItem
     if not item:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
 
@@ -100,17 +108,20 @@ async def save_response(
     await db.flush()
 
     # Trigger auto-calculations if this item feeds into a calculated field
-    if item.field_type == "auto_calculated" and item.field_config:
-        # Get all responses for this assessment to use as calculation inputs
+    dependencies = (item.field_config or {}).get("depends_on")
+    if item.field_type == "auto_calculated" and dependencies:
+        # Code and value of just the responses this calculation reads
         all_resp_result = await db.execute(
-            select(AssessmentResponse, AssessmentItem)
-            .join(AssessmentItem)
-            .where(AssessmentResponse.assessment_id == assessment.id)
+            select(AssessmentItem.code, AssessmentResponse.value)
+            .select_from(AssessmentResponse)
+            .join(AssessmentItem, AssessmentItem.id == AssessmentResponse.item_id)
+            .where(
+                AssessmentResponse.assessment_id == assessment.id,
+                AssessmentItem.code.in_(dependencies),
+            )
         )
-        resp_map = {}
-        for resp_row, item_row in all_resp_result.all():
-            resp_map[item_row.code] = resp_row.value or {}
-        calculated = run_auto_calculations(item.code, resp_map)
+        resp_map = {code: value or {} for code, value in all_resp_result}
+        calculated = run_auto_calculations(item.code, dependencies, resp_map)
         if calculated is not None:
             response.value = {"value": calculated}
             await db.flush()
@@ -129,28 +140,28 @@ async def bulk_save_responses(
     """Bulk save multiple responses at once."""
     assessment = await _get_assessment_or_404(db, assessment_id, tenant.id)
 
-    saved = []
-    for resp_data in body.responses:
-        result = await db.execute(
-            select(AssessmentResponse).where(
-                AssessmentResponse.assessment_id == assessment.id,
-                AssessmentResponse.item_id == resp_data.item_id,
-                AssessmentResponse.partner_id == resp_data.partner_id,
-            )
-        )
-        response = result.scalar_one_or_none()
-
-        if response:
-            response.value = resp_data.value
-        else:
-            response = AssessmentResponse(
-                assessment_id=assessment.id,
-                item_id=resp_data.item_id,
-                partner_id=resp_data.partner_id,
-                value=resp_data.value,
-            )
-            db.add(response)
-        saved.append(response)
-
-    await db.flush()
-    return saved
+    # One row per item/partner (the last value sent wins); an upsert may not
+    # touch the same row twice
+    rows = {
+        (resp_data.item_id, resp_data.partner_id): {
+            "assessment_id": assessment.id,
+            "item_id": resp_data.item_id,
+            "partner_id": resp_data.partner_id,
+            "value": resp_data.value,
+        }
+        for resp_data in body.responses
+    }
+    if not rows:
+        return []
+
+    # Insert or update every response in a single statement
+    stmt = pg_insert(AssessmentResponse).values(list(rows.values()))
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_response_item_partner",
+        set_={"value": stmt.excluded.value, "updated_at": func.now()},
+    )
+    result = await db.scalars(
+        stmt.returning(AssessmentResponse),
+        execution_options={"populate_existing": True},
+    )
+    return result.all()
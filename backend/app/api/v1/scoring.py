@@ -15,9 +15,13 @@ from app.models.tenant import Tenant
 from app.models.user import User
 from app.schemas.scoring import AssessmentScoresResponse, ItemScoreResponse, ThemeScoreResponse
 from app.schemas.ai_job import AIJobResponse
+from app.services.cache_service import get_cached_json, scores_cache_key, set_cached_json
 
 router = APIRouter(prefix="/assessments/{assessment_id}/scores")
 
+# Scores only change when a scoring job finishes, which drops the entry
+_SCORES_TTL = 60
+
 
 @router.get("", response_model=AssessmentScoresResponse)
 async def get_scores(
@@ -26,40 +30,36 @@ async def get_scores(
     db: AsyncSession = Depends(get_db),
 ):
     """Get all scores for an assessment."""
-    result = await db.execute(
-        select(Assessment).where(
-            Assessment.id == assessment_id, Assessment.tenant_id == tenant.id
+    cache_key = scores_cache_key(tenant.id, assessment_id)
+    cached = await get_cached_json(cache_key)
+    if cached is not None:
+        return cached
+
+    # The tenant's assessment with its theme scores (NULL when unscored)
+    score_rows = (
+        await db.execute(
+            select(Assessment, ThemeScore)
+            .outerjoin(ThemeScore, ThemeScore.assessment_id == Assessment.id)
+            .where(Assessment.id == assessment_id, Assessment.tenant_id == tenant.id)
         )
-    )
-    assessment = result.scalar_one_or_none()
-    if not assessment:
+    ).all()
+    if not score_rows:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Assessment not found")
-
-    scores_result = await db.execute(
-        select(ThemeScore).where(ThemeScore.assessment_id == assessment_id)
-    )
-    theme_scores = scores_result.scalars().all()
-
-    # Load theme metadata for names/slugs
-    themes_result = await db.execute(
-        select(AssessmentTheme).where(
-            AssessmentTheme.template_id == assessment.template_id
-        )
-    )
-    themes = themes_result.scalars().all()
-    themes_by_id = {t.id: t for t in themes}
-
-    # Load items grouped by theme
-    items_result = await db.execute(
-        select(AssessmentItem).where(
-            AssessmentItem.theme_id.in_([t.id for t in themes])
-        )
+    assessment = score_rows[0].Assessment
+    theme_scores = [row.ThemeScore for row in score_rows if row.ThemeScore is not None]
+
+    # Theme metadata for names/slugs, and items grouped by theme, in one query
+    theme_rows = await db.execute(
+        select(AssessmentTheme, AssessmentItem)
+        .outerjoin(AssessmentItem, AssessmentItem.theme_id == AssessmentTheme.id)
+        .where(AssessmentTheme.template_id == assessment.template_id)
     )
-    items = items_result.scalars().all()
-    items_by_id = {i.id: i for i in items}
+    themes_by_id = {}
     items_by_theme: dict[uuid.UUID, list] = {}
-    for item in items:
-        items_by_theme.setdefault(item.theme_id, []).append(item)
+    for theme, item in theme_rows:
+        themes_by_id[theme.id] = theme
+        if item is not None:
+            items_by_theme.setdefault(item.theme_id, []).append(item)
 
     # Load responses with scores
     responses_result = await db.execute(
@@ -103,13 +103,15 @@ async def get_scores(
 
     overall = assessment.overall_score or 0.0
 
-    return AssessmentScoresResponse(
+    scores = AssessmentScoresResponse(
         assessment_id=assessment_id,
         overall_score=overall,
         overall_max_score=100.0,
         overall_percentage=overall,
         theme_scores=theme_score_responses,
     )
+    await set_cached_json(cache_key, scores.model_dump(mode="json"), _SCORES_TTL)
+    return scores
 
 
 @router.post("/trigger-scoring", response_model=AIJobResponse, status_code=status.HTTP_202_ACCEPTED)
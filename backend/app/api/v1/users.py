@@ -3,8 +3,7 @@
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from passlib.context import CryptContext
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -13,11 +12,10 @@ from app.dependencies import get_current_user, get_tenant, require_role
 from app.models.tenant import Tenant
 from app.models.user import User
 from app.schemas.user import UserCreate, UserResponse, UserUpdate
+from app.services.password_service import hash_password_async
 
 router = APIRouter(prefix="/users")
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 
 @router.get("/me", response_model=UserResponse)
 async def get_me(
@@ -54,7 +52,9 @@ async def create_user(
 ):
     """Create a new user within the current tenant."""
     # Check duplicate email
-    existing = await db.execute(select(User).where(User.email == body.email))
+    existing = await db.execute(
+        select(User.id).where(func.lower(User.email) == body.email.lower())
+    )
     if existing.scalar_one_or_none():
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT, detail="Email already registered"
@@ -63,7 +63,7 @@ async def create_user(
     user = User(
         tenant_id=tenant.id,
         email=body.email,
-        password_hash=pwd_context.hash(body.password),
+        password_hash=await hash_password_async(body.password),
         full_name=body.full_name,
         role=body.role,
     )
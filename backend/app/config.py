@@ -26,11 +26,26 @@ class Settings(BaseSettings):
     s3_secret_key: str = "minioadmin"
     s3_bucket_name: str = "tne-uploads"
     s3_region: str = "us-east-1"
+    # Redirect cached report PDF downloads to presigned S3 URLs; only when
+    # browsers can reach s3_endpoint_url and the bucket allows CORS from the
+    # frontend, which fetches the PDF with script
+    report_pdf_presigned_redirect: bool = False
 
     # Anthropic
     anthropic_api_key: str = ""
     anthropic_model: str = "claude-sonnet-4-6"
     anthropic_max_retries: int = 3
+    claude_max_concurrency: int = 4
+    # Cosine similarity at which a free-text response reuses a cached score
+    text_score_cache_similarity: float = 0.95
+    # Score free text in background jobs through the Message Batches API
+    # (half price, but results can take minutes)
+    claude_use_message_batches: bool = False
+    claude_batch_poll_seconds: float = 10.0
+    claude_batch_timeout_seconds: float = 3600.0
+
+    # Risk prediction: score cut-offs between low/medium and medium/high
+    risk_level_thresholds: tuple[float, float] = (0.3, 0.6)
 
     # Celery
     celery_broker_url: str = "redis://localhost:6379/1"
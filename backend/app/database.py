@@ -1,5 +1,6 @@
 from collections.abc import AsyncGenerator
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
@@ -10,6 +11,9 @@ engine = create_async_engine(
     echo=settings.database_echo,
     pool_size=20,
     max_overflow=10,
+    # JSONB columns (responses, report sections, job payloads) go through orjson
+    json_serializer=lambda obj: orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode(),
+    json_deserializer=orjson.loads,
 )
 
 async_session_factory = async_sessionmaker(
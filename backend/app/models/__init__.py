@@ -7,7 +7,7 @@ from app.models.assessment import (
     Assessment,
     AssessmentResponse,
 )
-from app.models.file_upload import FileUpload
+from app.models.file_upload import FileUpload, FileUploadPage
 from app.models.scoring import ThemeScore
 from app.models.report import AssessmentReport
 from app.models.benchmark import BenchmarkSnapshot
@@ -23,6 +23,7 @@ __all__ = [
     "Assessment",
     "AssessmentResponse",
     "FileUpload",
+    "FileUploadPage",
     "ThemeScore",
     "AssessmentReport",
     "BenchmarkSnapshot",
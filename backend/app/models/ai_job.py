@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import String, Float, Text, DateTime, ForeignKey, func
+from sqlalchemy import String, Float, Text, DateTime, ForeignKey, Index, func, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -13,7 +13,7 @@ class AIJob(Base):
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     assessment_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("assessments.id"), index=True
+        UUID(as_uuid=True), ForeignKey("assessments.id")
     )
     job_type: Mapped[str] = mapped_column(String(50))
     # scoring, report_generation, document_extraction, risk_prediction
@@ -26,3 +26,18 @@ class AIJob(Base):
     started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_ai_jobs_assessment_status", "assessment_id", "status"),
+        Index(
+            "ix_ai_jobs_pending",
+            "created_at",
+            postgresql_where=text("status IN ('queued', 'processing', 'in_progress')"),
+        ),
+        Index(
+            "ix_ai_jobs_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
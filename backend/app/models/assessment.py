@@ -1,7 +1,9 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import String, Integer, Float, Text, DateTime, ForeignKey, func, UniqueConstraint
+from sqlalchemy import (
+    String, Integer, Float, Text, DateTime, ForeignKey, Index, func, text, UniqueConstraint
+)
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -75,7 +77,7 @@ class Assessment(Base):
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     tenant_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("tenants.id"), index=True
+        UUID(as_uuid=True), ForeignKey("tenants.id")
     )
     template_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("assessment_templates.id")
@@ -104,12 +106,21 @@ class Assessment(Base):
     report: Mapped["AssessmentReport | None"] = relationship(back_populates="assessment")  # noqa: F821
 
 
+# Declared outside the class body since it needs a column expression (DESC)
+Index(
+    "ix_assessments_active",
+    Assessment.tenant_id,
+    Assessment.submitted_at.desc(),
+    postgresql_where=text("status IN ('submitted', 'under_review')"),
+)
+
+
 class AssessmentResponse(Base):
     __tablename__ = "assessment_responses"
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     assessment_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("assessments.id"), index=True
+        UUID(as_uuid=True), ForeignKey("assessments.id")
     )
     item_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("assessment_items.id")
@@ -127,7 +138,13 @@ class AssessmentResponse(Base):
     )
 
     __table_args__ = (
-        UniqueConstraint("assessment_id", "item_id", "partner_id", name="uq_response_item_partner"),
+        UniqueConstraint(
+            "assessment_id",
+            "item_id",
+            "partner_id",
+            name="uq_response_item_partner",
+            postgresql_nulls_not_distinct=True,
+        ),
     )
 
     assessment: Mapped["Assessment"] = relationship(back_populates="responses")
@@ -1,7 +1,9 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import String, Integer, Text, DateTime, ForeignKey, func
+from sqlalchemy import (
+    String, Integer, Text, DateTime, ForeignKey, Index, func, text, UniqueConstraint
+)
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -30,3 +32,36 @@ class FileUpload(Base):
     )  # pending, processing, completed, failed
     extraction_error: Mapped[str | None] = mapped_column(Text)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        # Queue-style lookups of uploads still awaiting extraction
+        Index(
+            "ix_file_uploads_assessment_status",
+            "assessment_id",
+            "extraction_status",
+            postgresql_where=text("extraction_status <> 'completed'"),
+        ),
+        Index(
+            "ix_file_uploads_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
+
+
+class FileUploadPage(Base):
+    """Extracted text of one page, kept out of FileUpload.extracted_data."""
+
+    __tablename__ = "file_upload_pages"
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    upload_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("file_uploads.id", ondelete="CASCADE")
+    )
+    page_no: Mapped[int] = mapped_column(Integer)  # 1-based
+    text: Mapped[str] = mapped_column(Text)
+
+    __table_args__ = (
+        UniqueConstraint("upload_id", "page_no", name="uq_file_upload_page"),
+    )
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Float, Text, DateTime, ForeignKey, func, UniqueConstraint
+from sqlalchemy import Float, Text, DateTime, ForeignKey, Index, func, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -13,7 +13,7 @@ class ThemeScore(Base):
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     assessment_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("assessments.id"), index=True
+        UUID(as_uuid=True), ForeignKey("assessments.id")
     )
     theme_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("assessment_themes.id")
@@ -25,6 +25,12 @@ class ThemeScore(Base):
 
     __table_args__ = (
         UniqueConstraint("assessment_id", "theme_id", name="uq_theme_score"),
+        Index(
+            "ix_theme_scores_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
     assessment: Mapped["Assessment"] = relationship(back_populates="theme_scores")  # noqa: F821
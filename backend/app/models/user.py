@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, String, DateTime, ForeignKey, func
+from sqlalchemy import Boolean, String, DateTime, ForeignKey, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -29,3 +29,8 @@ class User(Base):
     )
 
     tenant: Mapped["Tenant"] = relationship(back_populates="users")  # noqa: F821
+
+
+# Declared outside the class body since it needs a column expression; serves
+# the case-insensitive email lookups in the auth endpoints
+Index("ix_users_email_lower", func.lower(User.email), unique=True)
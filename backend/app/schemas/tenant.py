@@ -40,6 +40,20 @@ class TenantResponse(BaseModel):
     updated_at: datetime | None = None
 
 
+class TenantSummaryResponse(BaseModel):
+    """Tenant row as listed on the platform admin page."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    name: str
+    slug: str
+    country: str
+    subscription_tier: str
+    is_active: bool
+    created_at: datetime | None = None
+
+
 # ---------------------------------------------------------------------------
 # Partner Institution schemas
 # ---------------------------------------------------------------------------
@@ -0,0 +1,93 @@
+"""Shared async Redis access and a small JSON cache on top of it."""
+
+import asyncio
+import uuid
+from collections.abc import Callable
+from functools import wraps
+from typing import Any, TypeVar
+
+import orjson
+import redis
+import redis.asyncio as aioredis
+import structlog
+
+from app.config import settings
+
+logger = structlog.get_logger()
+
+T = TypeVar("T")
+
+
+def loop_local(factory: Callable[[], T]) -> Callable[[], T]:
+    """Cache ``factory()`` for the running event loop.
+
+    Async clients hold connections bound to the loop that opened them, and
+    Celery tasks run each job under a fresh ``asyncio.run`` loop, so a
+    process-wide singleton would be reused across dead loops.
+    """
+    state: dict = {}
+
+    @wraps(factory)
+    def get() -> T:
+        loop = asyncio.get_running_loop()
+        if state.get("loop") is not loop:
+            state["loop"], state["value"] = loop, factory()
+        return state["value"]
+
+    return get
+
+
+@loop_local
+def get_async_redis() -> aioredis.Redis:
+    """Get the async Redis client for the running event loop."""
+    return aioredis.from_url(settings.redis_url)
+
+
+async def get_cached_json(key: str) -> Any | None:
+    """Return the cached value for ``key``, or None on a miss or Redis error."""
+    try:
+        raw = await get_async_redis().get(key)
+    except redis.RedisError as e:
+        logger.warning("cache_unavailable", key=key, error=str(e))
+        return None
+    return None if raw is None else orjson.loads(raw)
+
+
+async def set_cached_json(key: str, value: Any, ttl: int) -> None:
+    """Cache ``value`` under ``key`` for ``ttl`` seconds; Redis errors are logged."""
+    try:
+        await get_async_redis().set(key, orjson.dumps(value), ex=ttl)
+    except redis.RedisError as e:
+        logger.warning("cache_unavailable", key=key, error=str(e))
+
+
+async def delete_cached(*keys: str) -> None:
+    """Drop cached values so the next read recomputes them; Redis errors are logged."""
+    try:
+        await get_async_redis().delete(*keys)
+    except redis.RedisError as e:
+        logger.warning("cache_unavailable", keys=keys, error=str(e))
+
+
+async def publish_json(channel: str, value: Any) -> None:
+    """Publish ``value`` to subscribers of ``channel``; Redis errors are logged."""
+    try:
+        await get_async_redis().publish(channel, orjson.dumps(value))
+    except redis.RedisError as e:
+        logger.warning("cache_unavailable", channel=channel, error=str(e))
+
+
+def job_events_channel(job_id: uuid.UUID) -> str:
+    """Pub/sub channel carrying an AI job's state after every change."""
+    return f"job_events:{job_id}"
+
+
+# Per-assessment GET responses. Keys carry the tenant id, so a hit can only
+# ever be served to the tenant whose ownership check filled it
+
+def scores_cache_key(tenant_id: uuid.UUID, assessment_id: uuid.UUID) -> str:
+    return f"assessment_scores:{tenant_id}:{assessment_id}"
+
+
+def report_cache_key(tenant_id: uuid.UUID, assessment_id: uuid.UUID) -> str:
+    return f"assessment_report:{tenant_id}:{assessment_id}"
@@ -3,6 +3,7 @@
 Handles computed fields like Student-Staff Ratio (SSR), gender percentages,
 PhD staff percentage, flying faculty percentage, etc.
 """
+from collections.abc import Callable
 from typing import Any
 
 
@@ -71,16 +72,14 @@ def calculate_trend(values: list[float | int | None]) -> dict:
         return {"slope": None, "direction": "insufficient_data", "pct_change": None}
 
     n = len(clean)
-    x_mean = (n - 1) / 2
-    y_mean = sum(clean) / n
+    total = sum(clean)
+    y_mean = total / n
 
-    numerator = sum((i - x_mean) * (y - y_mean) for i, y in enumerate(clean))
-    denominator = sum((i - x_mean) ** 2 for i in range(n))
-
-    if denominator == 0:
-        slope = 0.0
-    else:
-        slope = numerator / denominator
+    # Least-squares slope over x = 0..n-1 in one pass: sum((x - x_mean)**2)
+    # has the closed form n(n^2 - 1)/12, and the centred cross-product
+    # reduces to sum(x*y) - x_mean*sum(y)
+    numerator = sum(i * y for i, y in enumerate(clean)) - (n - 1) / 2 * total
+    slope = numerator * 12 / (n * (n * n - 1))
 
     if clean[0] != 0:
         pct_change = round((clean[-1] - clean[0]) / clean[0] * 100, 1)
@@ -98,40 +97,46 @@ def calculate_trend(values: list[float | int | None]) -> dict:
     return {"slope": round(slope, 4), "direction": direction, "pct_change": pct_change}
 
 
-def run_auto_calculations(item_code: str, responses: dict[str, Any]) -> Any:
+# Calculation behind each seeded auto-calculated item. Its inputs are the
+# item's ``field_config["depends_on"]`` codes, passed in that order
+_CALCULATORS: dict[str, Callable[..., Any]] = {
+    "TL08": calculate_phd_percentage,  # PhD staff, total academic staff
+    "TL10": calculate_flying_faculty_percentage,  # flying faculty, total academic staff
+    "TL11": calculate_ssr,  # total students, total academic staff
+}
+
+
+def _numeric_input(value: Any) -> float | None:
+    """A calculation input as a number, or None if it is missing or non-numeric."""
+    if isinstance(value, dict):
+        value = value.get("value")
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def run_auto_calculations(
+    item_code: str, depends_on: list[str], responses: dict[str, Any]
+) -> Any:
     """Run auto-calculation for a specific item based on other response values.
 
     Args:
-        item_code: The code of the auto-calculated item (e.g., "TL_SSR")
-        responses: Dict mapping item_codes to their response values
+        item_code: The code of the auto-calculated item (e.g., "TL11")
+        depends_on: Codes of the items it is calculated from, in argument
+            order, as given by the item's ``field_config["depends_on"]``
+        responses: Dict mapping item_codes to their response values; only the
+            codes in ``depends_on`` are read
 
     Returns:
-        The calculated value, or None if inputs are missing
+        The calculated value, or None if any input is missing or non-numeric
     """
-    calculators = {
-        "TL_SSR": lambda r: calculate_ssr(
-            r.get("TL03", {}).get("value", 0),  # total students
-            r.get("TL06", {}).get("value", 0),  # total academic staff
-        ),
-        "TL_PHD_PCT": lambda r: calculate_phd_percentage(
-            r.get("TL07", {}).get("value", 0),  # PhD staff
-            r.get("TL06", {}).get("value", 0),  # total academic staff
-        ),
-        "TL_FLYING_PCT": lambda r: calculate_flying_faculty_percentage(
-            r.get("TL09", {}).get("value", 0),  # flying faculty
-            r.get("TL06", {}).get("value", 0),  # total academic staff
-        ),
-        "SE_RETENTION": lambda r: calculate_retention_rate(
-            r.get("SE01", {}).get("value", 0),  # enrolled
-            r.get("SE02", {}).get("value", 0),  # completed
-        ),
-        "IM_EMPLOYMENT": lambda r: calculate_employment_rate(
-            r.get("IM01", {}).get("value", 0),  # graduates
-            r.get("IM02", {}).get("value", 0),  # employed
-        ),
-    }
-
-    calculator = calculators.get(item_code)
+    calculator = _CALCULATORS.get(item_code)
     if calculator is None:
         return None
-    return calculator(responses)
+    inputs = [_numeric_input(responses.get(code)) for code in depends_on]
+    if None in inputs:
+        return None
+    return calculator(*inputs)
@@ -0,0 +1,64 @@
+"""Password hashing and verification with bcrypt.
+
+Hashes are standard ``$2b$`` strings, so hashes written earlier through
+passlib keep verifying. The async variants run the ~100 ms bcrypt work off
+the event loop.
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+
+BCRYPT_ROUNDS = 12
+
+# bcrypt only reads the first 72 bytes of a password; newer releases raise
+# instead of truncating, so truncate here the way passlib always did
+_MAX_PASSWORD_BYTES = 72
+
+# bcrypt releases the GIL while hashing, so threads already use every core.
+# A pool of its own keeps a burst of logins from queueing behind (or
+# starving) other work on the loop's default executor
+_bcrypt_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix="bcrypt")
+
+# Checked when there is no stored hash. checkpw only reads the salt and cost
+# from it, so a fresh salt with a placeholder checksum costs exactly what a
+# real hash does, without hashing anything at import or on first use
+_DUMMY_HASH = bcrypt.gensalt(rounds=BCRYPT_ROUNDS) + b"." * 31
+
+
+def _encode(password: str) -> bytes:
+    return password.encode()[:_MAX_PASSWORD_BYTES]
+
+
+def hash_password(password: str) -> str:
+    """Hash a password with a fresh salt."""
+    return bcrypt.hashpw(_encode(password), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
+
+
+def verify_password(password: str, password_hash: str | None) -> bool:
+    """Check a password against a stored hash; malformed hashes never match.
+
+    With no hash (no such account) a throwaway hash is checked anyway and the
+    result is False, so unknown emails take as long as wrong passwords.
+    """
+    if password_hash is None:
+        bcrypt.checkpw(_encode(password), _DUMMY_HASH)
+        return False
+    try:
+        return bcrypt.checkpw(_encode(password), password_hash.encode())
+    except ValueError:
+        return False
+
+
+async def hash_password_async(password: str) -> str:
+    """Non-blocking variant of ``hash_password``."""
+    return await asyncio.get_running_loop().run_in_executor(_bcrypt_pool, hash_password, password)
+
+
+async def verify_password_async(password: str, password_hash: str | None) -> bool:
+    """Non-blocking variant of ``verify_password``."""
+    return await asyncio.get_running_loop().run_in_executor(
+        _bcrypt_pool, verify_password, password, password_hash
+    )
@@ -4,6 +4,8 @@ Phase 1: Basic algorithmic scoring for numeric items.
 Phase 3: Full AI scoring pipeline with Claude API.
 """
 import uuid
+
+import numpy as np
 from sqlalchemy import select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -60,12 +62,12 @@ async def calculate_theme_scores(
     db: AsyncSession,
     assessment_id: uuid.UUID,
 ) -> list[ThemeScore]:
-    """Calculate aggregated theme scores from individual item scores."""
-    # Get assessment with its template themes
-    result = await db.execute(
-        select(Assessment).where(Assessment.id == assessment_id)
-    )
-    assessment = result.scalar_one_or_none()
+    """Calculate aggregated theme scores from individual item scores.
+
+    Also sets ``overall_score`` on the session's ``Assessment`` instance.
+    """
+    # Served from the session identity map when the caller already loaded it
+    assessment = await db.get(Assessment, assessment_id)
     if not assessment:
         return []
 
@@ -74,39 +76,39 @@ async def calculate_theme_scores(
         select(AssessmentTheme).where(AssessmentTheme.template_id == assessment.template_id)
     )
     themes = themes_result.scalars().all()
+    theme_index = {theme.id: n for n, theme in enumerate(themes)}
 
     # Delete existing theme scores for this assessment
     await db.execute(
         delete(ThemeScore).where(ThemeScore.assessment_id == assessment_id)
     )
 
-    theme_scores = []
-    for theme in themes:
-        # Get items and their responses for this theme
-        items_result = await db.execute(
-            select(AssessmentItem).where(AssessmentItem.theme_id == theme.id)
+    # Scored responses for every theme of the template in one round-trip
+    rows_result = await db.execute(
+        select(AssessmentItem.theme_id, AssessmentItem.weight, AssessmentResponse.ai_score)
+        .join(AssessmentResponse, AssessmentResponse.item_id == AssessmentItem.id)
+        .join(AssessmentTheme, AssessmentTheme.id == AssessmentItem.theme_id)
+        .where(
+            AssessmentResponse.assessment_id == assessment_id,
+            AssessmentResponse.ai_score.is_not(None),
+            AssessmentTheme.template_id == assessment.template_id,
         )
-        items = items_result.scalars().all()
+    )
+    rows = rows_result.all()
 
-        responses_result = await db.execute(
-            select(AssessmentResponse).where(
-                AssessmentResponse.assessment_id == assessment_id,
-                AssessmentResponse.item_id.in_([i.id for i in items]),
-            )
+    # Weighted average of item scores per theme
+    count = len(rows)
+    theme_idx = np.fromiter((theme_index[row[0]] for row in rows), dtype=np.intp, count=count)
+    weights = np.fromiter((row[1] for row in rows), dtype=np.float64, count=count)
+    scores = np.fromiter((row[2] for row in rows), dtype=np.float64, count=count)
+    total_weight = np.bincount(theme_idx, weights=weights, minlength=len(themes))
+    weighted_sum = np.bincount(theme_idx, weights=scores * weights, minlength=len(themes))
+
+    theme_scores = []
+    for n, theme in enumerate(themes):
+        normalised = (
+            round(float(weighted_sum[n] / total_weight[n]), 2) if total_weight[n] > 0 else None
         )
-        responses = responses_result.scalars().all()
-
-        # Calculate weighted average of item scores
-        total_weight = 0.0
-        weighted_sum = 0.0
-        for resp in responses:
-            if resp.ai_score is not None:
-                item = next((i for i in items if i.id == resp.item_id), None)
-                if item:
-                    weighted_sum += resp.ai_score * item.weight
-                    total_weight += item.weight
-
-        normalised = round(weighted_sum / total_weight, 2) if total_weight > 0 else None
         theme_weight = THEME_WEIGHTS.get(theme.slug, 0.2)
         weighted = round(normalised * theme_weight, 2) if normalised is not None else None
 
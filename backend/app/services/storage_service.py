@@ -0,0 +1,30 @@
+"""Shared S3 client for uploads, downloads and document extraction."""
+
+from functools import lru_cache
+
+import boto3
+from botocore.config import Config as BotoConfig
+
+from app.config import settings
+
+
+@lru_cache(maxsize=1)
+def get_s3_client():
+    """Get the process-wide S3 client.
+
+    Building a client loads botocore's service model, so it is done once;
+    clients are thread-safe, and the wider pool lets concurrent transfers
+    proceed without queueing on botocore's default of 10 connections.
+    """
+    return boto3.client(
+        "s3",
+        endpoint_url=settings.s3_endpoint_url,
+        aws_access_key_id=settings.s3_access_key,
+        aws_secret_access_key=settings.s3_secret_key,
+        region_name=settings.s3_region,
+        config=BotoConfig(
+            signature_version="s3v4",
+            max_pool_connections=64,
+            retries={"mode": "adaptive", "max_attempts": 3},
+        ),
+    )
@@ -3,8 +3,12 @@
 import secrets
 
 import redis
+import structlog
 
 from app.config import settings
+from app.services.cache_service import get_async_redis
+
+logger = structlog.get_logger()
 
 _redis = redis.from_url(settings.redis_url, decode_responses=True)
 
@@ -12,6 +16,18 @@ _redis = redis.from_url(settings.redis_url, decode_responses=True)
 RATE_LIMIT_MAX = 3
 RATE_LIMIT_WINDOW = 60  # seconds
 
+# Sign-in attempts allowed per window; looser than the email-sending limits
+# so a few mistyped passwords never lock anyone out
+LOGIN_RATE_LIMIT_PER_EMAIL = 10
+
+# Count a hit and start the window on the first one, atomically and in one
+# round-trip (EVALSHA, falling back to EVAL once per connection)
+_rate_limit_hit = _redis.register_script(
+    "local n = redis.call('INCR', KEYS[1]) "
+    "if n == 1 then redis.call('EXPIRE', KEYS[1], ARGV[1]) end "
+    "return n"
+)
+
 
 def create_email_verification_token(user_id: str) -> str:
     """Create a one-time email verification token (24h TTL)."""
@@ -53,14 +69,27 @@ def verify_magic_link_token(token: str) -> str | None:
     return email
 
 
-def check_rate_limit(action: str, identifier: str) -> bool:
+def check_rate_limit(action: str, identifier: str, limit: int = RATE_LIMIT_MAX) -> bool:
     """Check rate limit. Returns True if allowed, False if exceeded."""
     key = f"rate:{action}:{identifier}"
-    current = _redis.get(key)
-    if current is not None and int(current) >= RATE_LIMIT_MAX:
-        return False
-    pipe = _redis.pipeline()
-    pipe.incr(key)
-    pipe.expire(key, RATE_LIMIT_WINDOW)
-    pipe.execute()
-    return True
+    return _rate_limit_hit(keys=[key], args=[RATE_LIMIT_WINDOW]) <= limit
+
+
+async def check_rate_limit_async(
+    action: str, identifier: str, limit: int = RATE_LIMIT_MAX
+) -> bool:
+    """Async ``check_rate_limit`` for request handlers.
+
+    Fails open (returns True) when Redis is unavailable, so an outage never
+    blocks the action being limited.
+    """
+    key = f"rate:{action}:{identifier}"
+    try:
+        async with get_async_redis().pipeline(transaction=True) as pipe:
+            pipe.incr(key)
+            pipe.expire(key, RATE_LIMIT_WINDOW, nx=True)
+            hits, _ = await pipe.execute()
+    except redis.RedisError as e:
+        logger.warning("rate_limit_unavailable", action=action, error=str(e))
+        return True
+    return hits <= limit
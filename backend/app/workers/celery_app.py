@@ -19,6 +19,9 @@ celery_app.conf.update(
     task_track_started=True,
     task_acks_late=True,
     worker_prefetch_multiplier=1,
+    beat_schedule={
+        "sweep-stale-jobs": {"task": "sweep_stale_jobs", "schedule": 60.0},
+    },
 )
 
 # Auto-discover tasks in these modules
@@ -2,10 +2,18 @@
 
 import asyncio
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from app.workers.celery_app import celery_app
 
+# Job statuses that count as not yet finished. Workers set 'processing';
+# 'in_progress' is kept for rows written before that
+ACTIVE_JOB_STATUSES = ("queued", "processing", "in_progress")
+
+# Report jobs still active this long after creation are considered stuck;
+# the sweeper fails them and the API stops reporting them
+STALE_JOB_AGE = timedelta(minutes=10)
+
 
 def _run_async(coro):
     """Run an async coroutine from a sync Celery task.
@@ -51,6 +59,50 @@ async def _update_job_status(
             job.completed_at = datetime.now(timezone.utc)
         await session.commit()
 
+    await _publish_job(job)
+
+
+async def _publish_job(job) -> None:
+    """Push a job's state to clients streaming /jobs/{id}/events."""
+    from app.schemas.ai_job import AIJobResponse
+    from app.services.cache_service import job_events_channel, publish_json
+
+    await publish_json(
+        job_events_channel(job.id), AIJobResponse.model_validate(job).model_dump(mode="json")
+    )
+
+
+@celery_app.task(name="sweep_stale_jobs")
+def sweep_stale_jobs() -> dict:
+    """Fail report jobs stuck past ``STALE_JOB_AGE`` (run every minute by beat)."""
+
+    async def _run():
+        from sqlalchemy import update
+
+        from app.database import async_session_factory
+        from app.models.ai_job import AIJob
+
+        now = datetime.now(timezone.utc)
+        async with async_session_factory() as session:
+            result = await session.execute(
+                update(AIJob)
+                .where(
+                    AIJob.job_type == "report_generation",
+                    AIJob.status.in_(ACTIVE_JOB_STATUSES),
+                    AIJob.created_at < now - STALE_JOB_AGE,
+                )
+                .values(status="failed", error_message="Job timed out", completed_at=now)
+                .returning(AIJob)
+            )
+            jobs = result.scalars().all()
+            await session.commit()
+
+        for job in jobs:
+            await _publish_job(job)
+        return {"failed": len(jobs)}
+
+    return _run_async(_run())
+
 
 # ---------------------------------------------------------------------------
 # Email tasks
@@ -145,6 +197,11 @@ def score_assessment(self, assessment_id: str, job_id: str | None = None) -> dic
 
                 await session.commit()
 
+                if assessment:
+                    from app.services.cache_service import delete_cached, scores_cache_key
+
+                    await delete_cached(scores_cache_key(assessment.tenant_id, assessment.id))
+
                 if job_id:
                     await _update_job_status(
                         uuid.UUID(job_id), "completed", result_data=result, progress=1.0
@@ -196,6 +253,11 @@ def generate_report(self, assessment_id: str, job_id: str | None = None) -> dict
 
                 await session.commit()
 
+                if assessment:
+                    from app.services.cache_service import delete_cached, report_cache_key
+
+                    await delete_cached(report_cache_key(assessment.tenant_id, assessment.id))
+
                 result = {
                     "report_id": str(report.id),
                     "version": report.version,
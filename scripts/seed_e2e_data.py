@@ -13,8 +13,6 @@ import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
-from passlib.context import CryptContext
-
 # Add backend to path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
 
@@ -22,8 +20,8 @@ from app.database import engine, async_session_factory, Base  # noqa: E402
 from app.models.tenant import Tenant, PartnerInstitution  # noqa: E402
 from app.models.user import User  # noqa: E402
 from app.models.assessment import Assessment, AssessmentTemplate  # noqa: E402
+from app.services.password_service import hash_password  # noqa: E402
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 # ---------------------------------------------------------------------------
 # E2E test data constants (must match e2e/fixtures/test-data.ts)
@@ -167,7 +165,7 @@ async def seed():
             user = User(
                 tenant_id=tenant.id,
                 email=user_data["email"],
-                password_hash=pwd_context.hash(user_data["password"]),
+                password_hash=hash_password(user_data["password"]),
                 full_name=user_data["full_name"],
                 role=user_data["role"],
                 is_active=True,
@@ -180,7 +178,7 @@ async def seed():
         t2_admin = User(
             tenant_id=tenant2.id,
             email="e2e-admin@other-institute.edu",
-            password_hash=pwd_context.hash("TestPass123!"),
+            password_hash=hash_password("TestPass123!"),
             full_name="E2E Other Admin",
             role="tenant_admin",
             is_active=True,
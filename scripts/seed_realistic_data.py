@@ -20,8 +20,6 @@ import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-from passlib.context import CryptContext
-
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
 
 from app.database import Base, async_session_factory, engine  # noqa: E402
@@ -37,9 +35,9 @@ from app.models.report import AssessmentReport  # noqa: E402
 from app.models.scoring import ThemeScore  # noqa: E402
 from app.models.tenant import PartnerInstitution, Tenant  # noqa: E402
 from app.models.user import User  # noqa: E402
+from app.services.password_service import hash_password  # noqa: E402
 from sqlalchemy import delete, select  # noqa: E402
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 random.seed(42)  # reproducible data
 
 # ---------------------------------------------------------------------------
@@ -1514,7 +1512,7 @@ async def seed():
                 user = User(
                     tenant_id=tenant.id,
                     email=u_data["email"],
-                    password_hash=pwd_context.hash(PASSWORD),
+                    password_hash=hash_password(PASSWORD),
                     full_name=u_data["full_name"],
                     role=u_data["role"],
                     is_active=True,
@@ -1530,7 +1528,7 @@ async def seed():
                 pa = User(
                     tenant_id=tenant.id,
                     email=PLATFORM_ADMIN["email"],
-                    password_hash=pwd_context.hash(PLATFORM_ADMIN["password"]),
+                    password_hash=hash_password(PLATFORM_ADMIN["password"]),
                     full_name=PLATFORM_ADMIN["full_name"],
                     role=PLATFORM_ADMIN["role"],
                     is_active=True,